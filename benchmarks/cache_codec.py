@@ -0,0 +1,50 @@
+"""
+Compare encode/decode cost and payload size of the cache codecs.
+
+    python -m benchmarks.cache_codec
+"""
+
+import timeit
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from crypto_exchange.exchange.schemas import ExchangeInfo, ExchangeRate
+from crypto_exchange.lib.codec import CODECS
+
+NUMBER = 100000
+
+VALUES: list[BaseModel] = [
+    ExchangeInfo(
+        based_ticker="BTCUSDT",
+        from_asset_min_amount=Decimal("0.00001000"),
+        from_asset_max_amount=Decimal("9000.00000000"),
+        to_asset_min_amount=Decimal("5.00000000"),
+        to_asset_max_amount=Decimal("9000000.00000000"),
+        timestamp=1700000000,
+    ),
+    ExchangeRate(rate=Decimal("63000.10000000"), timestamp=1700000000),
+]
+
+
+def main() -> None:
+    print(
+        f"{'model':<14}{'codec':<8}{'bytes':>7}"
+        f"{'encode us':>12}{'decode us':>12}"
+    )
+    for value in VALUES:
+        model = type(value)
+        for name, codec in CODECS.items():
+            data = codec.encode(value)
+            encode = timeit.timeit(lambda: codec.encode(value), number=NUMBER)
+            decode = timeit.timeit(
+                lambda: codec.decode(data, model), number=NUMBER
+            )
+            print(
+                f"{model.__name__:<14}{name:<8}{len(data):>7}"
+                f"{encode / NUMBER * 1e6:>12.2f}{decode / NUMBER * 1e6:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
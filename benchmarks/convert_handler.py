@@ -0,0 +1,100 @@
+"""
+Throughput of the /api/v1/convert handler with a constant resolver.
+
+    python -m benchmarks.convert_handler --requests 20000
+
+Resolving is replaced by a constant result, so the numbers isolate the
+request parsing, response building and serialization of the handler.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import ClientSession, web
+
+from crypto_exchange.config import Config
+from crypto_exchange.exchange.resolver import ExchangeResolver
+from crypto_exchange.exchange.schemas import ExchangeResult
+from crypto_exchange.routes import setup_routes
+
+PAYLOAD = json.dumps(
+    {
+        "currency_from": "btc",
+        "currency_to": "usdt",
+        "amount": 0.5,
+        "exchange": "binance",
+        "cache_max_seconds": 60,
+    }
+)
+RESULT = ExchangeResult(
+    rate="63000.12345678", result="31500.06172839", updated_at=1700000000
+)
+
+
+async def resolve(self: ExchangeResolver, *args: Any, **kwargs: Any) -> Any:
+    return RESULT
+
+
+async def run(requests: int, concurrency: int) -> dict[str, Any]:
+    app = web.Application()
+    app["config"] = Config()
+    app["http_session"] = None
+    app["http_sessions"] = {}
+    app["redis"] = None
+    app["local_cache"] = None
+    app["market_data"] = {}
+    app["currency_graphs"] = {}
+    app["symbol_catalogs"] = {}
+    app["circuit_breakers"] = {}
+    app["request_hedgers"] = {}
+    app["rate_limiters"] = {}
+    setup_routes(app)
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    url = f"http://{host}:{port}/api/v1/convert"
+    headers = {"Content-Type": "application/json"}
+    remaining = iter(range(requests))
+
+    async def worker(session: ClientSession) -> None:
+        for _ in remaining:
+            async with session.post(url, data=PAYLOAD, headers=headers) as r:
+                await r.read()
+
+    try:
+        with patch.object(ExchangeResolver, "resolve", resolve):
+            async with ClientSession() as session:
+                started_at = time.perf_counter()
+                await asyncio.gather(
+                    *(worker(session) for _ in range(concurrency))
+                )
+                duration = time.perf_counter() - started_at
+    finally:
+        await runner.cleanup()
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "duration_s": round(duration, 3),
+        "rps": round(requests / duration, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.requests, args.concurrency))))
+
+
+if __name__ == "__main__":
+    main()
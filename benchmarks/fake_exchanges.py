@@ -0,0 +1,315 @@
+"""
+Fake Binance and KuCoin REST APIs for offline load tests.
+
+Both serve the endpoints used by the providers from a fixed market, with
+a configurable latency and error rate, and count the calls per endpoint.
+"""
+
+import asyncio
+import random
+from collections import Counter
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, NamedTuple
+
+from aiohttp import ClientSession, web
+from yarl import URL
+
+BINANCE_HOST = "api.binance.com"
+KUCOIN_HOST = "api.kucoin.com"
+
+
+class Market(NamedTuple):
+    base: str
+    quote: str
+    price: Decimal
+    min_size: Decimal
+    max_size: Decimal
+
+
+BINANCE_MARKETS = [
+    Market(
+        "BTC", "USDT", Decimal("63000.10"), Decimal("0.00001"), Decimal(9000)
+    ),
+    Market("ETH", "USDT", Decimal("2500.55"), Decimal("0.0001"), Decimal(9000)),
+    Market("ETH", "BTC", Decimal("0.0397"), Decimal("0.0001"), Decimal(100000)),
+    Market("BNB", "USDT", Decimal("580.2"), Decimal("0.001"), Decimal(90000)),
+    Market("SOL", "USDT", Decimal("150.37"), Decimal("0.001"), Decimal(90000)),
+    Market("DOGE", "USDT", Decimal("0.1036"), Decimal(1), Decimal(9000000)),
+    Market("XRP", "USDT", Decimal("0.5371"), Decimal("0.1"), Decimal(9000000)),
+    Market("LTC", "BTC", Decimal("0.001042"), Decimal("0.001"), Decimal(90000)),
+]
+
+KUCOIN_MARKETS = [
+    market for market in BINANCE_MARKETS if market.base not in ("BNB", "LTC")
+] + [Market("KCS", "USDT", Decimal("9.31"), Decimal("0.01"), Decimal(10000000))]
+
+MIN_NOTIONAL = Decimal(5)
+MAX_NOTIONAL = Decimal(9000000)
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class FakeExchange:
+    """Base of the fake exchange servers."""
+
+    def __init__(
+        self,
+        markets: list[Market],
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.markets = {
+            self.get_symbol(market.base, market.quote): market
+            for market in markets
+        }
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.calls: Counter[str] = Counter()
+        self.url: URL | None = None
+        self._runner: web.AppRunner | None = None
+
+    @staticmethod
+    def get_symbol(base: str, quote: str) -> str:
+        raise NotImplementedError()
+
+    def add_routes(self, app: web.Application) -> None:
+        raise NotImplementedError()
+
+    @web.middleware
+    async def _middleware(
+        self,
+        request: web.Request,
+        handler: Handler,
+    ) -> web.StreamResponse:
+        resource = request.match_info.route.resource
+        self.calls[resource.canonical if resource else request.path] += 1
+        delay = self.latency + self.random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.random.random() < self.error_rate:
+            return web.json_response({"msg": "Fake error."}, status=502)
+        return await handler(request)
+
+    async def start(self) -> URL:
+        app = web.Application(middlewares=[self._middleware])
+        self.add_routes(app)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = URL.build(scheme="http", host=host, port=port)
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+class FakeBinance(FakeExchange):
+    @staticmethod
+    def get_symbol(base: str, quote: str) -> str:
+        return f"{base}{quote}"
+
+    def add_routes(self, app: web.Application) -> None:
+        app.router.add_get("/sapi/v1/convert/exchangeInfo", self.convert_info)
+        app.router.add_get("/api/v3/ticker/price", self.ticker_price)
+        app.router.add_get("/api/v3/exchangeInfo", self.exchange_info)
+        app.router.add_get("/api/v3/ticker/24hr", self.tickers_24hr)
+
+    async def convert_info(self, request: web.Request) -> web.Response:
+        from_asset = request.query["fromAsset"]
+        to_asset = request.query["toAsset"]
+        market = self.markets.get(self.get_symbol(from_asset, to_asset))
+        reverse = self.markets.get(self.get_symbol(to_asset, from_asset))
+        if market is None and reverse is None:
+            return web.json_response(
+                {"code": 345122, "msg": "Pair not found."}, status=400
+            )
+
+        listed = market or reverse
+        base_limits = (listed.min_size, listed.max_size)
+        quote_limits = (MIN_NOTIONAL, MAX_NOTIONAL)
+        from_limits, to_limits = (
+            (base_limits, quote_limits)
+            if market
+            else (quote_limits, base_limits)
+        )
+        return web.json_response(
+            [
+                {
+                    "fromAsset": from_asset,
+                    "toAsset": to_asset,
+                    "fromAssetMinAmount": str(from_limits[0]),
+                    "fromAssetMaxAmount": str(from_limits[1]),
+                    "toAssetMinAmount": str(to_limits[0]),
+                    "toAssetMaxAmount": str(to_limits[1]),
+                    "fromIsBase": market is not None,
+                }
+            ]
+        )
+
+    async def ticker_price(self, request: web.Request) -> web.Response:
+        symbol = request.query.get("symbol")
+        if symbol is None:
+            return web.json_response(
+                [
+                    {"symbol": symbol, "price": str(market.price)}
+                    for symbol, market in self.markets.items()
+                ]
+            )
+        if symbol not in self.markets:
+            return web.json_response(
+                {"code": -1121, "msg": "Invalid symbol."}, status=400
+            )
+        return web.json_response(
+            {"symbol": symbol, "price": str(self.markets[symbol].price)}
+        )
+
+    async def exchange_info(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "symbols": [
+                    {
+                        "symbol": symbol,
+                        "status": "TRADING",
+                        "baseAsset": market.base,
+                        "quoteAsset": market.quote,
+                        "filters": [
+                            {
+                                "filterType": "LOT_SIZE",
+                                "minQty": str(market.min_size),
+                                "maxQty": str(market.max_size),
+                            },
+                            {
+                                "filterType": "NOTIONAL",
+                                "minNotional": str(MIN_NOTIONAL),
+                                "maxNotional": str(MAX_NOTIONAL),
+                            },
+                        ],
+                    }
+                    for symbol, market in self.markets.items()
+                ]
+            }
+        )
+
+    async def tickers_24hr(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            [
+                {"symbol": symbol, "quoteVolume": "1000000"}
+                for symbol in self.markets
+            ]
+        )
+
+
+class FakeKucoin(FakeExchange):
+    @staticmethod
+    def get_symbol(base: str, quote: str) -> str:
+        return f"{base}-{quote}"
+
+    def add_routes(self, app: web.Application) -> None:
+        app.router.add_get("/api/v2/symbols/{ticker}", self.symbol)
+        app.router.add_get("/api/v2/symbols", self.symbols)
+        app.router.add_get(
+            "/api/v1/market/orderbook/level1", self.orderbook_level1
+        )
+        app.router.add_get("/api/v1/market/allTickers", self.all_tickers)
+
+    @staticmethod
+    def _not_found() -> web.Response:
+        return web.json_response(
+            {"code": "900001", "msg": "Symbol Not Exists"}, status=400
+        )
+
+    @staticmethod
+    def _symbol_data(symbol: str, market: Market) -> dict[str, Any]:
+        return {
+            "symbol": symbol,
+            "baseCurrency": market.base,
+            "quoteCurrency": market.quote,
+            "baseMinSize": str(market.min_size),
+            "baseMaxSize": str(market.max_size),
+            "enableTrading": True,
+        }
+
+    async def symbol(self, request: web.Request) -> web.Response:
+        symbol = request.match_info["ticker"]
+        if symbol not in self.markets:
+            return self._not_found()
+        return web.json_response(
+            {
+                "code": "200000",
+                "data": self._symbol_data(symbol, self.markets[symbol]),
+            }
+        )
+
+    async def symbols(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "code": "200000",
+                "data": [
+                    self._symbol_data(symbol, market)
+                    for symbol, market in self.markets.items()
+                ],
+            }
+        )
+
+    async def orderbook_level1(self, request: web.Request) -> web.Response:
+        symbol = request.query["symbol"]
+        if symbol not in self.markets:
+            return self._not_found()
+        return web.json_response(
+            {
+                "code": "200000",
+                "data": {"price": str(self.markets[symbol].price)},
+            }
+        )
+
+    async def all_tickers(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "code": "200000",
+                "data": {
+                    "ticker": [
+                        {
+                            "symbol": symbol,
+                            "last": str(market.price),
+                            "volValue": "1000000",
+                        }
+                        for symbol, market in self.markets.items()
+                    ]
+                },
+            }
+        )
+
+
+class FakeExchangeSession:
+    """Client session proxy sending requests for exchange hosts to fakes."""
+
+    def __init__(self, session: ClientSession, hosts: dict[str, URL]):
+        self._session = session
+        self._hosts = hosts
+
+    def _rewrite(self, str_or_url: Any) -> URL:
+        url = URL(str_or_url)
+        target = self._hosts.get(url.host or "")
+        if target is None:
+            return url
+        return (
+            url.with_scheme(target.scheme)
+            .with_host(target.host)
+            .with_port(target.port)
+        )
+
+    def get(self, url: Any, **kwargs: Any) -> Any:
+        return self._session.get(self._rewrite(url), **kwargs)
+
+    def post(self, url: Any, **kwargs: Any) -> Any:
+        return self._session.post(self._rewrite(url), **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
@@ -0,0 +1,173 @@
+"""
+Micro-benchmarks of the helpers and models used on every convert request.
+
+    python -m benchmarks.hot_paths
+    python -m benchmarks.hot_paths --save-baseline
+
+Costs are reported relative to a fixed pure Python calibration workload,
+so a baseline stored on one machine stays meaningful on another. The
+regression tests in crypto_exchange/tests/test_performance.py compare
+against benchmarks/baseline.json, which keeps a baseline for every JSON
+backend, since orjson is optional. Saving only replaces the baseline of
+the installed backend.
+"""
+
+import argparse
+import json
+import platform
+import timeit
+import warnings
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable
+
+from crypto_exchange.api.schemas import ConvertRequest, ConvertResponse
+from crypto_exchange.exchange.providers.binance import Binance
+from crypto_exchange.exchange.providers.kucoin import Kucoin
+from crypto_exchange.exchange.schemas import (
+    ExchangeInfo,
+    ExchangeRate,
+    ExchangeResult,
+)
+from crypto_exchange.lib import utils
+from crypto_exchange.lib.utils import (
+    DecimalEncoder,
+    format_decimal,
+    json_dumps,
+    json_loads,
+)
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+JSON_BACKEND = "json" if utils.orjson is None else "orjson"
+
+# Minimum time of a single timing run, long enough to hide timer noise.
+MIN_RUN_TIME = 0.01
+REPEAT = 5
+
+RATE = Decimal("63000.123456789")
+AMOUNT = Decimal("0.5")
+EXCHANGE_INFO_FIELDS: dict[str, Any] = {
+    "based_ticker": "BTCUSDT",
+    "from_asset_min_amount": Decimal("0.00001"),
+    "from_asset_max_amount": Decimal("9000"),
+    "to_asset_min_amount": Decimal("5"),
+    "to_asset_max_amount": Decimal("9000000"),
+    "timestamp": 1700000000,
+}
+CONVERT_REQUEST_FIELDS: dict[str, Any] = {
+    "currency_from": "btc",
+    "currency_to": "usdt",
+    "amount": 0.5,
+    "exchange": "binance",
+    "cache_max_seconds": 60,
+}
+CONVERT_REQUEST_BODY = json.dumps(CONVERT_REQUEST_FIELDS).encode()
+EXCHANGE_RESULT = ExchangeResult(
+    rate="63000.12345678", result="31500.06172839", updated_at=1700000000
+)
+
+
+def convert_response_round_trip() -> dict:
+    return ConvertResponse(
+        currency_from="BTC",
+        currency_to="USDT",
+        exchange="binance",
+        **EXCHANGE_RESULT.dict(),
+    ).dict()
+
+
+def convert_response_json() -> bytes:
+    return json_dumps(
+        {
+            "currency_from": "BTC",
+            "currency_to": "USDT",
+            "exchange": "binance",
+            "rate": EXCHANGE_RESULT.rate,
+            "result": EXCHANGE_RESULT.result,
+            "updated_at": EXCHANGE_RESULT.updated_at,
+            "stale": EXCHANGE_RESULT.stale,
+        }
+    )
+
+
+BENCHMARKS: dict[str, Callable[[], Any]] = {
+    "format_decimal": lambda: format_decimal(RATE * AMOUNT),
+    "decimal_encoder": lambda: json.dumps(
+        {"rate": RATE, "amount": AMOUNT}, cls=DecimalEncoder
+    ),
+    "exchange_info": lambda: ExchangeInfo(**EXCHANGE_INFO_FIELDS),
+    "exchange_rate": lambda: ExchangeRate(rate=RATE, timestamp=1700000000),
+    "exchange_result": lambda: ExchangeResult(
+        rate="63000.12345678", result="31500.06172839", updated_at=1700000000
+    ),
+    "convert_request": lambda: ConvertRequest(**CONVERT_REQUEST_FIELDS),
+    "convert_request_json": lambda: ConvertRequest.model_validate(
+        json_loads(CONVERT_REQUEST_BODY)
+    ),
+    "convert_response_round_trip": convert_response_round_trip,
+    "convert_response_json": convert_response_json,
+    "binance_get_ticker": lambda: Binance.get_ticker("BTC", "USDT"),
+    "kucoin_get_ticker": lambda: Kucoin.get_ticker("BTC", "USDT"),
+}
+
+
+def calibration() -> str:
+    return "".join([str(i) for i in range(20)])
+
+
+def measure(func: Callable[[], Any]) -> float:
+    """Best time of a single call in seconds."""
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < MIN_RUN_TIME:
+        number *= 10
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+
+def load_baselines() -> dict[str, Any]:
+    if not BASELINE_PATH.exists():
+        return {"benchmarks": {}}
+    with open(BASELINE_PATH) as f:
+        return json.load(f)
+
+
+def load_baseline() -> dict[str, float]:
+    """Relative costs stored for the installed JSON backend."""
+    return load_baselines()["benchmarks"].get(JSON_BACKEND, {})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help=f"Write the relative costs to {BASELINE_PATH.name}.",
+    )
+    args = parser.parse_args()
+    # The round trip mirrors v1.convert, including deprecated calls.
+    warnings.simplefilter("ignore", DeprecationWarning)
+
+    unit = measure(calibration)
+    baseline = {} if args.save_baseline else load_baseline()
+    print(f"JSON backend: {JSON_BACKEND}")
+    print(f"{'benchmark':<30}{'us':>9}{'relative':>10}{'baseline':>10}")
+    results = {}
+    for name, func in BENCHMARKS.items():
+        cost = measure(func)
+        results[name] = round(cost / unit, 3)
+        print(
+            f"{name:<30}{cost * 1e6:>9.3f}{results[name]:>10.3f}"
+            f"{baseline.get(name, float('nan')):>10.3f}"
+        )
+
+    if args.save_baseline:
+        baselines = load_baselines()
+        baselines["python"] = platform.python_version()
+        baselines["benchmarks"][JSON_BACKEND] = results
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(baselines, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+End-to-end load test of /api/v1/convert against fake exchanges.
+
+    python -m benchmarks.load_test --requests 5000 --concurrency 50
+
+Starts the app wired like crypto_exchange.__main__, with provider requests
+sent to local fake Binance and KuCoin servers, drives a fixed, seeded mix
+of pairs and prints a JSON report. Redis is taken from --redis-host and
+--redis-port, the quote keys of both providers are deleted before the run
+so results are comparable across commits.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import subprocess
+import time
+from collections import Counter
+from typing import Any, AsyncGenerator, NamedTuple
+
+import redis.asyncio as aioredis
+from aiohttp import ClientSession, ClientTimeout, web
+
+from benchmarks.fake_exchanges import (
+    BINANCE_HOST,
+    BINANCE_MARKETS,
+    KUCOIN_HOST,
+    KUCOIN_MARKETS,
+    FakeBinance,
+    FakeExchange,
+    FakeExchangeSession,
+    FakeKucoin,
+)
+from crypto_exchange.__main__ import create_app
+from crypto_exchange.config import Config
+from crypto_exchange.services.requests import setup_requests
+
+
+class Scenario(NamedTuple):
+    name: str
+    weight: int
+    currency_from: str
+    currency_to: str
+    amount: str
+    exchange: str | None
+    cache_max_seconds: int | None
+
+
+# Cache hits dominate, as for a quotes service behind a UI.
+SCENARIOS = [
+    Scenario("cache_hit", 40, "BTC", "USDT", "0.5", "binance", 60),
+    Scenario("cache_hit", 15, "USDT", "ETH", "1000", "binance", 60),
+    Scenario("cache_hit", 10, "SOL", "USDT", "3", "kucoin", 60),
+    Scenario("cache_hit", 10, "ETH", "BTC", "2", None, 60),
+    Scenario("cache_miss", 8, "BTC", "USDT", "0.1", "kucoin", None),
+    Scenario("cache_miss", 4, "XRP", "USDT", "1000", None, None),
+    Scenario("intermediary", 5, "DOGE", "SOL", "5000", "binance", 60),
+    Scenario("intermediary", 3, "XRP", "BTC", "1000", "kucoin", 60),
+    Scenario("not_found", 3, "ABC", "USDT", "1", "binance", 60),
+    Scenario("invalid_amount", 2, "BTC", "USDT", "100000", "binance", 60),
+]
+
+
+def percentile(values: list[float], percent: float) -> float:
+    index = min(len(values) - 1, int(len(values) * percent / 100))
+    return values[index]
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def clear_quotes(redis_host: str, redis_port: int) -> None:
+    """Delete the cached quotes of both providers."""
+    redis = aioredis.Redis(host=redis_host, port=redis_port, db=0)
+    try:
+        for pattern in ["Binance*", "Kucoin*"]:
+            keys = [key async for key in redis.scan_iter(pattern)]
+            if keys:
+                await redis.delete(*keys)
+    finally:
+        await redis.aclose()
+
+
+def create_benchmark_app(
+    config: Config,
+    exchanges: dict[str, FakeExchange],
+) -> web.Application:
+    """Create the app with provider requests sent to the fake exchanges."""
+    app = create_app(config)
+
+    async def setup_fake_requests(app: web.Application) -> AsyncGenerator:
+        hosts = {
+            host: exchange.url
+            for host, exchange in exchanges.items()
+            if exchange.url is not None
+        }
+        async for http_session in setup_requests(app):
+            app["http_session"] = FakeExchangeSession(http_session, hosts)
+            app["http_sessions"] = {
+                provider_name: FakeExchangeSession(session, hosts)
+                for provider_name, session in app["http_sessions"].items()
+            }
+            yield app["http_session"]
+
+    index = list(app.cleanup_ctx).index(setup_requests)
+    app.cleanup_ctx[index] = setup_fake_requests
+    return app
+
+
+async def drive(
+    url: str,
+    requests: list[Scenario],
+    concurrency: int,
+) -> tuple[float, list[float], Counter[str], Counter[str]]:
+    """Send the requests with at most concurrency in flight."""
+    latencies: list[float] = []
+    statuses: Counter[str] = Counter()
+    scenarios: Counter[str] = Counter()
+    queue = iter(requests)
+
+    async def worker(session: ClientSession) -> None:
+        for scenario in queue:
+            payload = {
+                "currency_from": scenario.currency_from,
+                "currency_to": scenario.currency_to,
+                "amount": scenario.amount,
+                "exchange": scenario.exchange,
+                "cache_max_seconds": scenario.cache_max_seconds,
+            }
+            started_at = time.perf_counter()
+            async with session.post(url, json=payload) as response:
+                await response.read()
+            latencies.append(time.perf_counter() - started_at)
+            statuses[str(response.status)] += 1
+            scenarios[scenario.name] += 1
+
+    started_at = time.perf_counter()
+    async with ClientSession(timeout=ClientTimeout(total=30)) as session:
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+    return time.perf_counter() - started_at, latencies, statuses, scenarios
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    overrides: dict[str, Any] = {}
+    if args.config:
+        with open(args.config) as f:
+            overrides = json.load(f)
+    config = Config(
+        **{
+            "redis_host": args.redis_host,
+            "redis_port": args.redis_port,
+            "intermediary_currencies": ["USDT", "BTC"],
+            **overrides,
+        }
+    )
+
+    exchanges: dict[str, FakeExchange] = {
+        BINANCE_HOST: FakeBinance(
+            BINANCE_MARKETS,
+            args.latency,
+            args.jitter,
+            args.error_rate,
+            args.seed,
+        ),
+        KUCOIN_HOST: FakeKucoin(
+            KUCOIN_MARKETS,
+            args.latency,
+            args.jitter,
+            args.error_rate,
+            args.seed,
+        ),
+    }
+    for exchange in exchanges.values():
+        await exchange.start()
+    await clear_quotes(config.redis_host, config.redis_port)
+
+    app = create_benchmark_app(config, exchanges)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+
+    rng = random.Random(args.seed)
+    requests = rng.choices(
+        SCENARIOS, weights=[item.weight for item in SCENARIOS], k=args.requests
+    )
+    try:
+        duration, latencies, statuses, scenarios = await drive(
+            f"http://{host}:{port}/api/v1/convert",
+            requests,
+            args.concurrency,
+        )
+    finally:
+        await runner.cleanup()
+        for exchange in exchanges.values():
+            await exchange.stop()
+
+    latencies.sort()
+    return {
+        "commit": get_commit(),
+        "requests": len(latencies),
+        "concurrency": args.concurrency,
+        "upstream_latency_ms": args.latency * 1000,
+        "upstream_error_rate": args.error_rate,
+        "duration_s": round(duration, 3),
+        "rps": round(len(latencies) / duration, 1),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 3),
+            "p95": round(percentile(latencies, 95) * 1000, 3),
+            "p99": round(percentile(latencies, 99) * 1000, 3),
+            "max": round(latencies[-1] * 1000, 3),
+        },
+        "statuses": dict(sorted(statuses.items())),
+        "scenarios": dict(sorted(scenarios.items())),
+        "upstream_calls": {
+            type(exchange).__name__: dict(sorted(exchange.calls.items()))
+            for exchange in exchanges.values()
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Upstream latency, s."
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.01, help="Added random latency, s."
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--redis-host", default="localhost")
+    parser.add_argument("--redis-port", type=int, default=6379)
+    parser.add_argument("--config", help="JSON file with Config overrides.")
+    parser.add_argument("--output", help="Also write the report to a file.")
+    parser.add_argument("--log-level", default="ERROR")
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level)
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Startup profile of the server.
+
+    python -m benchmarks.startup --runs 5
+
+Reports the import time of crypto_exchange.__main__ by package, with the
+slowest modules, and the time from starting ``python -m crypto_exchange``
+to the first served request for every installed event loop. Imports are
+measured with ``python -X importtime`` in fresh interpreters, Redis is
+taken from --redis-host and --redis-port like in benchmarks.load_test.
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from importlib.util import find_spec
+from typing import Any
+
+ENTRY_MODULE = "crypto_exchange.__main__"
+EVENT_LOOPS = ["asyncio", "uvloop"]
+READY_TIMEOUT = 30
+POLL_INTERVAL = 0.005
+
+
+def import_times() -> list[tuple[str, int]]:
+    """Self import time in microseconds of every module, in import order."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {ENTRY_MODULE}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, module = line.split("|")
+        times.append((module.strip(), int(self_time.split(":")[1])))
+    return times
+
+
+def profile_imports(runs: int, top: int) -> dict[str, Any]:
+    """Median self import times by top level package and module."""
+    modules: dict[str, list[float]] = defaultdict(list)
+    totals = []
+    for _ in range(runs):
+        times = import_times()
+        totals.append(sum(self_time for _, self_time in times))
+        for module, self_time in times:
+            modules[module].append(self_time)
+
+    medians = {
+        module: statistics.median(values) for module, values in modules.items()
+    }
+    packages: dict[str, float] = defaultdict(float)
+    for module, median in medians.items():
+        packages[module.split(".")[0]] += median
+
+    def ms(value: float) -> float:
+        return round(value / 1000, 2)
+
+    def slowest(times: dict[str, float]) -> list[tuple[str, float]]:
+        return sorted(times.items(), key=lambda item: -item[1])
+
+    return {
+        "total_ms": ms(statistics.median(totals)),
+        "packages_ms": {
+            package: ms(self_time)
+            for package, self_time in slowest(packages)[:top]
+        },
+        "slowest_modules_ms": {
+            module: ms(self_time)
+            for module, self_time in slowest(medians)[:top]
+        },
+        "crypto_exchange_modules_ms": {
+            module: ms(self_time)
+            for module, self_time in slowest(medians)
+            if module.startswith("crypto_exchange")
+        },
+    }
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_ready(config: dict[str, Any]) -> float:
+    """Seconds from starting the server to its first served request."""
+    port = get_free_port()
+    with tempfile.NamedTemporaryFile("w", suffix=".json") as config_file:
+        json.dump({**config, "host": "127.0.0.1", "port": port}, config_file)
+        config_file.flush()
+
+        started_at = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "crypto_exchange"],
+            env={**os.environ, "CONFIG_PATH": config_file.name},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while time.perf_counter() - started_at < READY_TIMEOUT:
+                if process.poll() is not None:
+                    raise RuntimeError(
+                        f"Server exited with code {process.returncode}."
+                    )
+                try:
+                    with urllib.request.urlopen(
+                        f"http://127.0.0.1:{port}/metrics"
+                    ):
+                        return time.perf_counter() - started_at
+                except (urllib.error.URLError, ConnectionError):
+                    time.sleep(POLL_INTERVAL)
+            raise TimeoutError("Server did not become ready.")
+        finally:
+            process.terminate()
+            process.wait()
+
+
+def profile_ready(
+    runs: int, redis_host: str, redis_port: int
+) -> dict[str, float | None]:
+    """Median time to the first served request by event loop."""
+    report: dict[str, float | None] = {}
+    for event_loop in EVENT_LOOPS:
+        if event_loop != "asyncio" and find_spec(event_loop) is None:
+            report[event_loop] = None
+            continue
+        config = {
+            "redis_host": redis_host,
+            "redis_port": redis_port,
+            "event_loop": event_loop,
+        }
+        durations = [time_to_ready(config) for _ in range(runs)]
+        report[event_loop] = round(statistics.median(durations) * 1000, 1)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--redis-host", default="localhost")
+    parser.add_argument("--redis-port", type=int, default=6379)
+    args = parser.parse_args()
+
+    report = {
+        "python": sys.version.split()[0],
+        "imports": profile_imports(args.runs, args.top),
+        "time_to_ready_ms": profile_ready(
+            args.runs, args.redis_host, args.redis_port
+        ),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,91 @@
 import asyncio
+import logging
+import socket
+from functools import partial
 
 from aiohttp import web
 
-from crypto_exchange.config import get_config
+from crypto_exchange.config import Config, get_config
 from crypto_exchange.routes import setup_routes
+from crypto_exchange.services.cache import setup_local_cache
+from crypto_exchange.services.catalog import setup_symbol_catalogs
+from crypto_exchange.services.graph import setup_currency_graphs
+from crypto_exchange.services.providers import setup_providers
 from crypto_exchange.services.redis import setup_redis
+from crypto_exchange.services.refresher import setup_rates_refresher
 from crypto_exchange.services.requests import setup_requests
+from crypto_exchange.services.resilience import setup_resilience
+from crypto_exchange.services.streams import setup_market_data
+from crypto_exchange.services.warmup import setup_warmup
 
+logger = logging.getLogger(__name__)
 
-def main() -> None:
-    config = get_config()
-    loop = asyncio.new_event_loop()
-
-    asyncio.set_event_loop(loop)
 
+def create_app(config: Config, leader: bool = True) -> web.Application:
     app = web.Application()
     app["config"] = config
-    app["loop"] = loop
 
     app.cleanup_ctx.extend(
         [
             setup_redis,
             setup_requests,
+            setup_resilience,
+            setup_local_cache,
+            setup_market_data,
+            setup_providers,
+            setup_currency_graphs,
+            setup_symbol_catalogs,
         ]
     )
+    if leader:
+        # Bulk refreshes write to the shared Redis, one worker is enough.
+        app.cleanup_ctx.append(setup_rates_refresher)
+    # Every worker warms its own local cache.
+    app.cleanup_ctx.append(setup_warmup)
 
     setup_routes(app)
+    return app
 
-    web.run_app(
-        app=app,
-        host=config.host,
-        port=config.port,
-    )
+
+def create_event_loop(name: str) -> asyncio.AbstractEventLoop:
+    """Create an event loop of the configured implementation."""
+    if name == "uvloop":
+        try:
+            import uvloop
+        except ImportError:
+            logger.warning("uvloop is not installed, using asyncio.")
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run_worker(
+    config: Config,
+    sock: socket.socket | None = None,
+    leader: bool = True,
+) -> None:
+    loop = create_event_loop(config.event_loop)
+
+    asyncio.set_event_loop(loop)
+
+    app = create_app(config, leader)
+    app["loop"] = loop
+
+    if sock is None:
+        web.run_app(app=app, host=config.host, port=config.port, loop=loop)
+    else:
+        web.run_app(app=app, sock=sock, loop=loop)
+
+
+def main() -> None:
+    config = get_config()
+
+    if config.workers > 1:
+        from crypto_exchange.workers import run_workers
+
+        run_workers(config, partial(run_worker, config))
+    else:
+        run_worker(config)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,8 @@
+from aiohttp import web
+
+
+async def ready(request: web.Request) -> web.Response:
+    """Readiness probe, ready once the startup warm-up is done."""
+    if request.app["ready"].is_set():
+        return web.json_response({"status": "ready"})
+    return web.json_response({"status": "warming_up"}, status=503)
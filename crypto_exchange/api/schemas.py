@@ -9,6 +9,11 @@ class ConvertRequest(BaseModel):
     amount: Decimal
     exchange: str | None = None
     cache_max_seconds: int | None = None
+    stale_while_revalidate: int | None = None
+
+
+class BatchConvertRequest(BaseModel):
+    items: list[dict]
 
 
 class ConvertResponse(BaseModel):
@@ -18,3 +23,4 @@ class ConvertResponse(BaseModel):
     rate: str
     result: str
     updated_at: int
+    stale: bool = False
@@ -1,64 +1,250 @@
+import asyncio
 import logging
+import time
 from decimal import Decimal
 
 from aiohttp import web
 
-from crypto_exchange.api.schemas import ConvertRequest, ConvertResponse
+from crypto_exchange.api.schemas import (
+    BatchConvertRequest,
+    ConvertRequest,
+    ConvertResponse,
+)
 from crypto_exchange.exchange.exceptions import (
     InvalidAssetAmount,
     InvalidProvider,
     PairNotFound,
     ProviderBadResponse,
 )
-from crypto_exchange.exchange.resolver import ExchangeResolver
+from crypto_exchange.exchange.resolver import PROVIDERS_MAP, ExchangeResolver
+from crypto_exchange.lib.cache import LocalCache
+from crypto_exchange.lib.metrics import REQUEST_DURATION, get_outcome
+from crypto_exchange.lib.tracing import span, trace_request
+from crypto_exchange.lib.utils import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
 
 async def convert(request: web.Request) -> web.Response:
-    try:
-        request_json = await request.json()
-        data = ConvertRequest(**request_json)
-    except Exception as e:
-        return web.json_response({"error": str(e)}, status=400)
+    config = request.app["config"]
+    if not config.request_tracing:
+        return await _convert(request)
+
+    with trace_request() as trace:
+        response = await _convert(request)
+    response.headers["Server-Timing"] = trace.server_timing()
+    if config.request_trace_log:
+        logger.info(f"Request trace {request.path}: {trace.to_json()}")
+    return response
+
+
+async def _convert(request: web.Request) -> web.Response:
+    with span("parse"):
+        try:
+            data = await _parse_convert_request(request)
+        except Exception as e:
+            return web.json_response({"error": str(e)}, status=400)
 
     currency_from = data.currency_from.upper()
     currency_to = data.currency_to.upper()
 
-    resolver = ExchangeResolver(
-        http_session=request.app["http_session"],
-        redis=request.app["redis"],
+    resolver = _create_resolver(
+        request.app,
         exchange=data.exchange,
+        local_cache=request.app["local_cache"],
+        stale_while_revalidate=data.stale_while_revalidate,
     )
+    started_at = time.perf_counter()
     try:
-        result = await resolver.resolve(
-            currency_from=data.currency_from.upper(),
-            currency_to=data.currency_to.upper(),
-            amount=Decimal(data.amount),
-            cache_max_seconds=data.cache_max_seconds,
+        with span("resolve"):
+            result = await resolver.resolve(
+                currency_from=data.currency_from.upper(),
+                currency_to=data.currency_to.upper(),
+                amount=Decimal(data.amount),
+                cache_max_seconds=data.cache_max_seconds,
+            )
+    except Exception as e:
+        _observe_request(resolver, started_at, e)
+        error, status = _get_error_response(e)
+        return web.json_response(error, status=status)
+    _observe_request(resolver, started_at)
+
+    with span("serialize"):
+        return web.Response(
+            body=json_dumps(
+                {
+                    "currency_from": currency_from,
+                    "currency_to": currency_to,
+                    "exchange": resolver.exchange,
+                    "rate": result.rate,
+                    "result": result.result,
+                    "updated_at": result.updated_at,
+                    "stale": result.stale,
+                }
+            ),
+            content_type="application/json",
+            charset="utf-8",
         )
-    except InvalidProvider as e:
-        return web.json_response({"error": str(e)}, status=400)
-    except InvalidAssetAmount as e:
+
+
+async def _parse_convert_request(request: web.Request) -> ConvertRequest:
+    """
+    Validate the body parsed straight from bytes. Bodies that are not a
+    JSON object go through request.json() and ConvertRequest(**...), so
+    their error messages stay the same.
+    """
+    body = await request.read()
+    try:
+        request_json = json_loads(body)
+    except ValueError:
+        request_json = None
+    if isinstance(request_json, dict):
+        return ConvertRequest.model_validate(request_json)
+    return ConvertRequest(**await request.json())
+
+
+async def convert_batch(request: web.Request) -> web.Response:
+    try:
+        request_json = await request.json()
+        batch = BatchConvertRequest(**request_json)
+    except Exception as e:
         return web.json_response({"error": str(e)}, status=400)
-    except ProviderBadResponse:
+
+    max_items = request.app["config"].batch_max_items
+    if len(batch.items) > max_items:
         return web.json_response(
-            {"error": "Error with exchange, please try again later."},
-            status=500,
+            {"error": f"Batch size exceeds the limit of {max_items} items."},
+            status=400,
+        )
+
+    items: list[ConvertRequest | Exception] = []
+    for item in batch.items:
+        try:
+            items.append(ConvertRequest(**item))
+        except Exception as e:
+            items.append(e)
+
+    requests = [item for item in items if isinstance(item, ConvertRequest)]
+
+    # The single MGET below serves every item from a cache of the batch,
+    # a large batch warming the shared one would evict its hot pairs.
+    local_cache = LocalCache(
+        maxsize=len(requests) * 8,
+        ttl=request.app["config"].local_cache_ttl,
+    )
+
+    try:
+        resolver = _create_resolver(request.app, None, local_cache)
+        await resolver.warm_local_cache(
+            (
+                item.exchange,
+                item.currency_from.upper(),
+                item.currency_to.upper(),
+            )
+            for item in requests
+            if item.cache_max_seconds is not None
         )
-    except PairNotFound as e:
-        return web.json_response({"error": str(e)}, status=400)
     except Exception as e:
-        logger.exception(e)
-        return web.json_response(
-            {"error": "Internal error, try later..."}, status=500
+        logger.warning(f"Failed to warm local cache for batch: {e!r}")
+
+    async def convert_item(item: ConvertRequest) -> dict:
+        resolver = _create_resolver(
+            request.app,
+            item.exchange,
+            local_cache,
+            stale_while_revalidate=item.stale_while_revalidate,
         )
+        started_at = time.perf_counter()
+        try:
+            result = await resolver.resolve(
+                currency_from=item.currency_from.upper(),
+                currency_to=item.currency_to.upper(),
+                amount=Decimal(item.amount),
+                cache_max_seconds=item.cache_max_seconds,
+            )
+        except Exception as e:
+            _observe_request(resolver, started_at, e)
+            error, status = _get_error_response(e)
+            return {**error, "status": status}
+        _observe_request(resolver, started_at)
 
-    convert_response = ConvertResponse(
-        currency_from=currency_from,
-        currency_to=currency_to,
-        exchange=resolver.exchange,
-        **result.dict(),
+        return ConvertResponse(
+            currency_from=item.currency_from.upper(),
+            currency_to=item.currency_to.upper(),
+            exchange=resolver.exchange,
+            **result.dict(),
+        ).dict()
+
+    results = iter(await asyncio.gather(*map(convert_item, requests)))
+
+    return web.json_response(
+        {
+            "results": [
+                (
+                    {"error": str(item), "status": 400}
+                    if isinstance(item, Exception)
+                    else next(results)
+                )
+                for item in items
+            ]
+        }
+    )
+
+
+def _create_resolver(
+    app: web.Application,
+    exchange: str | None,
+    local_cache: LocalCache | None,
+    stale_while_revalidate: int | None = None,
+) -> ExchangeResolver:
+    config = app["config"]
+    return ExchangeResolver(
+        http_session=app["http_session"],
+        redis=app["redis"],
+        exchange=exchange,
+        local_cache=local_cache,
+        http_sessions=app["http_sessions"],
+        market_data=app["market_data"],
+        currency_graphs=app["currency_graphs"],
+        symbol_catalogs=app["symbol_catalogs"],
+        circuit_breakers=app["circuit_breakers"],
+        request_hedgers=app["request_hedgers"],
+        rate_limiters=app["rate_limiters"],
+        providers=app["providers"],
+        provider_policy=config.provider_policy,
+        intermediary_currencies=config.intermediary_currencies,
+        intermediary_policy=config.intermediary_policy,
+        intermediary_max_concurrency=config.intermediary_max_concurrency,
+        negative_cache_ttl=config.negative_cache_ttl,
+        cache_codec=config.cache_codec,
+        cache_max_staleness=config.cache_max_staleness,
+        stale_while_revalidate=(
+            config.stale_while_revalidate
+            if stale_while_revalidate is None
+            else stale_while_revalidate
+        ),
     )
 
-    return web.json_response(convert_response.dict())
+
+def _observe_request(
+    resolver: ExchangeResolver,
+    started_at: float,
+    error: Exception | None = None,
+) -> None:
+    """Record the resolve latency by provider and outcome."""
+    provider = (resolver.exchange or "").lower()
+    REQUEST_DURATION.labels(
+        provider if provider in PROVIDERS_MAP else "none",
+        get_outcome(error),
+    ).observe(time.perf_counter() - started_at)
+
+
+def _get_error_response(e: Exception) -> tuple[dict, int]:
+    """Map a resolver exception to an error body and status code."""
+    if isinstance(e, (InvalidProvider, InvalidAssetAmount, PairNotFound)):
+        return {"error": str(e)}, 400
+    if isinstance(e, ProviderBadResponse):
+        return {"error": "Error with exchange, please try again later."}, 500
+
+    logger.error(e, exc_info=e)
+    return {"error": "Internal error, try later..."}, 500
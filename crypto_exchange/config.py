@@ -1,16 +1,107 @@
 import json
 import os
 from pathlib import Path
+from typing import Literal
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
+from crypto_exchange.lib.constants import (
+    CACHE_MAX_STALENESS,
+    CIRCUIT_BREAKER_FAILURES,
+    CIRCUIT_BREAKER_RESET_TIMEOUT,
+    HEDGE_BUDGET,
+    INTERMEDIARY_CURRENCIES,
+    INTERMEDIARY_MAX_CONCURRENCY,
+    NEGATIVE_CACHE_TTL,
+    RATE_LIMIT_MAX_WAIT,
+    WARMUP_TIMEOUT,
+)
+
+
+class HttpPoolConfig(BaseModel):
+    """Connection pool and timeouts of the HTTP session of a provider."""
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15
+    dns_cache_ttl: int | None = 10
+    pool_timeout: float | None = None
+    connect_timeout: float | None = 2
+    read_timeout: float | None = 2
+    total_timeout: float | None = None
+
+
+class WarmupPair(BaseModel):
+    """Pair preloaded at startup, on every provider without an exchange."""
+
+    currency_from: str
+    currency_to: str
+    exchange: str | None = None
+
 
 class Config(BaseSettings):
     host: str | None = Field("0.0.0.0", env="HOST")
     port: int | None = Field(8080, env="PORT")
+    workers: int = Field(1, ge=1, env="WORKERS")
+    event_loop: Literal["asyncio", "uvloop"] = Field(
+        "asyncio", env="EVENT_LOOP"
+    )
     redis_host: str | None = Field("localhost", env="REDIS_HOST")
     redis_port: int | None = Field(6379, env="REDIS_PORT")
+    local_cache_size: int = Field(1024, env="LOCAL_CACHE_SIZE")
+    local_cache_ttl: int = Field(60, env="LOCAL_CACHE_TTL")
+    negative_cache_ttl: int = Field(
+        NEGATIVE_CACHE_TTL, env="NEGATIVE_CACHE_TTL"
+    )
+    cache_codec: Literal["json", "binary"] = Field("json", env="CACHE_CODEC")
+    cache_max_staleness: int = Field(
+        CACHE_MAX_STALENESS, env="CACHE_MAX_STALENESS"
+    )
+    stale_while_revalidate: int = Field(0, env="STALE_WHILE_REVALIDATE")
+    http_pools: dict[str, HttpPoolConfig] = Field({}, env="HTTP_POOLS")
+    hedge_delay: float | None = Field(None, env="HEDGE_DELAY")
+    hedge_quantile: float | None = Field(None, env="HEDGE_QUANTILE")
+    hedge_budget: float = Field(HEDGE_BUDGET, env="HEDGE_BUDGET")
+    circuit_breaker_failures: int | None = Field(
+        CIRCUIT_BREAKER_FAILURES, env="CIRCUIT_BREAKER_FAILURES"
+    )
+    circuit_breaker_reset_timeout: float = Field(
+        CIRCUIT_BREAKER_RESET_TIMEOUT, env="CIRCUIT_BREAKER_RESET_TIMEOUT"
+    )
+    rate_limit_max_wait: float | None = Field(
+        RATE_LIMIT_MAX_WAIT, env="RATE_LIMIT_MAX_WAIT"
+    )
+    request_tracing: bool = Field(False, env="REQUEST_TRACING")
+    request_trace_log: bool = Field(False, env="REQUEST_TRACE_LOG")
+    batch_max_items: int = Field(500, env="BATCH_MAX_ITEMS")
+    provider_policy: Literal["sequential", "first_success", "best_rate"] = (
+        Field("sequential", env="PROVIDER_POLICY")
+    )
+    intermediary_currencies: list[str] = Field(
+        INTERMEDIARY_CURRENCIES, env="INTERMEDIARY_CURRENCIES"
+    )
+    intermediary_policy: Literal["first_success", "best_rate"] = Field(
+        "first_success", env="INTERMEDIARY_POLICY"
+    )
+    intermediary_max_concurrency: int = Field(
+        INTERMEDIARY_MAX_CONCURRENCY, env="INTERMEDIARY_MAX_CONCURRENCY"
+    )
+    rates_refresh_interval: int | None = Field(
+        None, env="RATES_REFRESH_INTERVAL"
+    )
+    currency_graph_refresh_interval: int | None = Field(
+        None, env="CURRENCY_GRAPH_REFRESH_INTERVAL"
+    )
+    symbol_catalog_refresh_interval: int | None = Field(
+        None, env="SYMBOL_CATALOG_REFRESH_INTERVAL"
+    )
+    warmup_pairs: list[WarmupPair] = Field([], env="WARMUP_PAIRS")
+    warmup_timeout: float = Field(WARMUP_TIMEOUT, env="WARMUP_TIMEOUT")
+    market_data_streams: list[str] = Field([], env="MARKET_DATA_STREAMS")
+    market_data_max_staleness: float = Field(
+        5.0, env="MARKET_DATA_MAX_STALENESS"
+    )
 
     class Config:
         case_sensitive = False
@@ -0,0 +1,30 @@
+from crypto_exchange.exchange.schemas import ExchangeInfo
+
+
+class SymbolCatalog:
+    """
+    In-memory index of the exchange information of every listed pair.
+
+    Exchange information is keyed by (base, quote) and also reachable by
+    the reversed pair, so the orientation of a request is resolved
+    without asking the provider.
+    """
+
+    def __init__(self, exchange_infos: dict[tuple[str, str], ExchangeInfo]):
+        self._exchange_infos = dict(exchange_infos)
+        for (base, quote), exchange_info in exchange_infos.items():
+            self._exchange_infos.setdefault((quote, base), exchange_info)
+        self._size = len(exchange_infos)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def get_exchange_info(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> ExchangeInfo | None:
+        return self._exchange_infos.get((currency_from, currency_to))
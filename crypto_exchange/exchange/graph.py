@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Iterable
+
+from crypto_exchange.exchange.schemas import TradingPair
+from crypto_exchange.lib.constants import MAX_CACHED_ROUTES
+
+
+class CurrencyGraph:
+    """
+    Index of the currencies a provider can exchange between.
+
+    Currencies are nodes and every listed pair is an undirected edge,
+    weighted by its liquidity. Routes are chosen by the fewest hops and
+    then by the best bottleneck liquidity along the route. Liquidity is
+    the 24h quote volume reported by the exchange, so it is only an
+    approximate ranking across different quote currencies.
+    """
+
+    def __init__(
+        self,
+        pairs: Iterable[TradingPair] = (),
+        max_cached_routes: int = MAX_CACHED_ROUTES,
+    ):
+        self.max_cached_routes = max_cached_routes
+        self._edges: dict[str, dict[str, Decimal]] = {}
+        self._routes: OrderedDict[tuple[str, str, int], list[str] | None] = (
+            OrderedDict()
+        )
+        for pair in pairs:
+            self._add_edge(pair.base, pair.quote, pair.liquidity)
+            self._add_edge(pair.quote, pair.base, pair.liquidity)
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def __bool__(self) -> bool:
+        return bool(self._edges)
+
+    def _add_edge(self, node: str, neighbor: str, liquidity: Decimal) -> None:
+        neighbors = self._edges.setdefault(node, {})
+        neighbors[neighbor] = max(
+            liquidity, neighbors.get(neighbor, Decimal(0))
+        )
+
+    def has_pair(self, currency_from: str, currency_to: str) -> bool:
+        return currency_to in self._edges.get(currency_from, {})
+
+    def find_route(
+        self,
+        currency_from: str,
+        currency_to: str,
+        max_hops: int,
+    ) -> list[str] | None:
+        """
+        Return the currencies of the best route from currency_from to
+        currency_to with at most max_hops exchanges, or None if there is
+        no such route. Results for listed currencies are cached until the
+        graph is replaced, evicting the least recently used ones.
+        """
+        if currency_from not in self._edges or currency_to not in self._edges:
+            return None
+
+        key = (currency_from, currency_to, max_hops)
+        if key in self._routes:
+            self._routes.move_to_end(key)
+            return self._routes[key]
+
+        route = self._find_route(currency_from, currency_to, max_hops)
+        self._routes[key] = route
+        while len(self._routes) > self.max_cached_routes:
+            self._routes.popitem(last=False)
+        return route
+
+    def _find_route(
+        self,
+        currency_from: str,
+        currency_to: str,
+        max_hops: int,
+    ) -> list[str] | None:
+        # Breadth-first search by layers. For every node reached at its
+        # shortest distance keep the predecessor with the best bottleneck
+        # liquidity, which is optimal among the shortest routes.
+        liquidity: dict[str, Decimal] = {currency_from: Decimal("Infinity")}
+        parents: dict[str, str] = {}
+        layer = [currency_from]
+        for _ in range(max_hops):
+            next_layer: dict[str, Decimal] = {}
+            for node in layer:
+                for neighbor, edge in self._edges[node].items():
+                    if neighbor in liquidity:
+                        continue
+                    bottleneck = min(liquidity[node], edge)
+                    if bottleneck > next_layer.get(neighbor, Decimal(-1)):
+                        next_layer[neighbor] = bottleneck
+                        parents[neighbor] = node
+            if not next_layer:
+                return None
+
+            liquidity.update(next_layer)
+            if currency_to in next_layer:
+                route = [currency_to]
+                while route[-1] != currency_from:
+                    route.append(parents[route[-1]])
+                return route[::-1]
+            layer = list(next_layer)
+
+        return None
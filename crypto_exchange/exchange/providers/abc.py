@@ -1,9 +1,14 @@
+import asyncio
+import contextvars
+import copy
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections import Counter
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, Awaitable, Callable, Hashable, Mapping, Self
+from urllib.parse import urlsplit
 
 import redis.asyncio as aioredis
 from aiohttp import ClientSession
@@ -13,31 +18,207 @@ from crypto_exchange.exchange.exceptions import (
     PairNotFound,
     ProviderBadResponse,
 )
+from crypto_exchange.exchange.catalog import SymbolCatalog
+from crypto_exchange.exchange.graph import CurrencyGraph
 from crypto_exchange.exchange.schemas import (
     ExchangeInfo,
     ExchangeRate,
     ExchangeResult,
+    TradingPair,
 )
-from crypto_exchange.lib.utils import DecimalEncoder, format_decimal
+from crypto_exchange.exchange.streams.book import Level1Book
+from crypto_exchange.lib.cache import LocalCache
+from crypto_exchange.lib.circuit_breaker import CircuitBreaker
+from crypto_exchange.lib.codec import get_codec
+from crypto_exchange.lib.constants import (
+    CACHE_CODEC_JSON,
+    CACHE_MAX_STALENESS,
+    NEGATIVE_CACHE_TTL,
+    PRIORITY_REQUEST,
+    RATE_LIMIT_BACKOFF,
+)
+from crypto_exchange.lib.hash_cache import (
+    HashField,
+    read_fresh_fields,
+    write_fields,
+)
+from crypto_exchange.lib.hedging import RequestHedger
+from crypto_exchange.lib.metrics import (
+    CACHE_REQUESTS,
+    CACHE_REVALIDATIONS,
+    CIRCUIT_BREAKER_REJECTIONS,
+    RATE_LIMIT_REJECTIONS,
+    RATE_LIMIT_WAIT_DURATION,
+    REDIS_OPERATION_DURATION,
+    UPSTREAM_REQUEST_DURATION,
+    UPSTREAM_RESPONSES,
+)
+from crypto_exchange.lib.rate_limiter import RateLimiter, RateLimitExceeded
+from crypto_exchange.lib.single_flight import SingleFlight
+from crypto_exchange.lib.tracing import span
+from crypto_exchange.lib.utils import format_decimal
 
 logger = logging.getLogger(__name__)
 
+# Binance answers repeated 429s with 418 while the IP is banned.
+RATE_LIMITED_STATUSES = (429, 418)
+
 
 class Provider(ABC):
     """Abstract base class for cryptocurrency providers."""
 
     NOT_FOUND_ERROR_CODES: list[int | str] = []
 
-    def __init__(self, http_session: ClientSession, redis: aioredis.Redis):
+    # Request weight allowed per period in seconds by the provider API.
+    RATE_LIMIT: tuple[int, int] = (1200, 60)
+
+    # Whether the symbol catalog lists every pair the provider converts,
+    # so pairs missing from it are not looked up one by one.
+    SYMBOL_CATALOG_COMPLETE = True
+
+    # Whether the currency graph has every pair the provider converts, so
+    # pairs without a route in it are not probed through intermediaries.
+    CURRENCY_GRAPH_COMPLETE = True
+
+    # Shared by all instances so concurrent requests for the same ticker
+    # result in a single upstream call per process.
+    _single_flight = SingleFlight()
+
+    # Background refreshes of stale cached values, at most one per key.
+    _revalidations: dict[Hashable, asyncio.Task] = {}
+
+    # Negative cache hits per provider name, across all instances.
+    negative_cache_hits: Counter[str] = Counter()
+
+    def __init__(
+        self,
+        http_session: ClientSession,
+        redis: aioredis.Redis,
+        local_cache: LocalCache | None = None,
+        market_data: Level1Book | None = None,
+        symbol_catalog: SymbolCatalog | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedger: RequestHedger | None = None,
+        rate_limiter: RateLimiter | None = None,
+        priority: int = PRIORITY_REQUEST,
+        negative_cache_ttl: int = NEGATIVE_CACHE_TTL,
+        cache_codec: str = CACHE_CODEC_JSON,
+        cache_max_staleness: int = CACHE_MAX_STALENESS,
+        stale_while_revalidate: int = 0,
+    ):
         self.name = self.__class__.__name__
         self.http_session = http_session
         self.redis = redis
+        self.local_cache = local_cache
+        self.market_data = market_data
+        self.symbol_catalog = symbol_catalog
+        self.circuit_breaker = circuit_breaker
+        self.hedger = hedger
+        self.rate_limiter = rate_limiter
+        self.priority = priority
+        self.negative_cache_ttl = negative_cache_ttl
+        self.cache_codec = get_codec(cache_codec)
+        self.cache_max_staleness = cache_max_staleness
+        self.stale_while_revalidate = stale_while_revalidate
+        # Quotes are stored as fields of one Redis hash per kind.
+        self._exchange_info_hash = f"{self.name}:exchange-info"
+        self._exchange_rate_hash = f"{self.name}:exchange-rate"
 
-    async def _fetch_data(self, url: str) -> Any:
-        async with self.http_session.get(url) as response:
-            data = await response.json()
-            self._handle_api_error(url, response.status, data)
-            return data
+    def replace(self, **changes: Any) -> Self:
+        """
+        Copy the provider with some attributes changed, sharing its HTTP
+        session, circuit breaker, hedger and rate limiter.
+        """
+        provider = copy.copy(self)
+        vars(provider).update(changes)
+        return provider
+
+    async def _fetch_data(
+        self,
+        url: str,
+        endpoint: str | None = None,
+        weight: int = 1,
+    ) -> Any:
+        """
+        Request the url and return its JSON. Metrics are labelled with the
+        endpoint, the url path by default. Requests fail fast while the
+        circuit breaker is open, wait for their weight in the rate limiter
+        and slow ones are hedged by the hedger.
+        """
+        if self.circuit_breaker and not self.circuit_breaker.allow_request():
+            CIRCUIT_BREAKER_REJECTIONS.labels(self.name.lower()).inc()
+            raise ProviderBadResponse(f"{self.name} is unavailable.")
+
+        labels = (self.name.lower(), endpoint or urlsplit(url).path)
+        try:
+            if self.hedger is None:
+                status, data = await self._request(url, labels, weight)
+            else:
+                status, data = await self.hedger.run(
+                    lambda: self._request(url, labels, weight)
+                )
+        except RateLimitExceeded:
+            RATE_LIMIT_REJECTIONS.labels(self.name.lower()).inc()
+            raise ProviderBadResponse(f"{self.name} rate limit exceeded.")
+        except Exception:
+            self._record_health(healthy=False)
+            raise
+        self._record_health(
+            healthy=status < 500 and status not in RATE_LIMITED_STATUSES
+        )
+        self._handle_api_error(url, status, data)
+        return data
+
+    async def _request(
+        self,
+        url: str,
+        labels: tuple[str, str],
+        weight: int,
+    ) -> Any:
+        if self.rate_limiter is not None:
+            with span("rate_limit", labels[0]):
+                waited = await self.rate_limiter.acquire(weight, self.priority)
+            RATE_LIMIT_WAIT_DURATION.labels(labels[0]).observe(waited)
+
+        status = "error"
+        try:
+            with (
+                span("upstream", " ".join(labels)),
+                UPSTREAM_REQUEST_DURATION.labels(*labels).time(),
+            ):
+                async with self.http_session.get(url) as response:
+                    status = str(response.status)
+                    self._update_rate_limit(response.status, response.headers)
+                    data = await response.json()
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            UPSTREAM_RESPONSES.labels(*labels, status).inc()
+        return response.status, data
+
+    def _update_rate_limit(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+    ) -> None:
+        """Adapt the rate limiter to the headers of a response."""
+        if self.rate_limiter is None:
+            return
+        retry_after = headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            self.rate_limiter.pause(int(retry_after))
+        elif status in RATE_LIMITED_STATUSES:
+            self.rate_limiter.update_remaining(0)
+            self.rate_limiter.pause(RATE_LIMIT_BACKOFF)
+
+    def _record_health(self, healthy: bool) -> None:
+        if self.circuit_breaker is None:
+            return
+        if healthy:
+            self.circuit_breaker.record_success()
+        else:
+            self.circuit_breaker.record_failure()
 
     def _handle_api_error(self, url: str, status: int, data: dict) -> None:
         if (
@@ -60,27 +241,131 @@ class Provider(ABC):
         """Fetch exchange information from the provider's API."""
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _fetch_all_exchange_info(
+        self,
+    ) -> dict[tuple[str, str], ExchangeInfo]:
+        """Fetch exchange information of all listed (base, quote) pairs."""
+        raise NotImplementedError()
+
     @abstractmethod
     async def _fetch_ticker_price(self, based_ticker: str) -> Decimal:
         """Fetch the ticker price from the provider's API."""
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _fetch_all_ticker_prices(self) -> dict[str, Decimal]:
+        """Fetch the prices of all tickers from the provider's API."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _fetch_trading_pairs(self) -> list[TradingPair]:
+        """Fetch all tradable pairs with their liquidity."""
+        raise NotImplementedError()
+
     @staticmethod
     @abstractmethod
     def get_ticker(currency_from: str, currency_to: str) -> str:
         """Construct the ticker symbol for the currency pair."""
         raise NotImplementedError()
 
-    @staticmethod
     def _is_fresh_cache_data(
+        self,
         cache_timestamp: int,
         cache_max_seconds: int | None,
     ) -> bool:
         if cache_max_seconds is None:
             return False
+        cache_max_seconds = min(cache_max_seconds, self.cache_max_staleness)
         timestamp_now = int(datetime.utcnow().timestamp())
         return cache_timestamp >= timestamp_now - cache_max_seconds
 
+    def _get_cache_read_seconds(self, cache_max_seconds: int) -> int:
+        """Age up to which cached values are served, stale ones included."""
+        return min(
+            cache_max_seconds + self.stale_while_revalidate,
+            self.cache_max_staleness,
+        )
+
+    def _revalidate_if_stale(
+        self,
+        value: ExchangeInfo | ExchangeRate,
+        cache_max_seconds: int,
+        key: tuple[str, ...],
+        load: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """
+        Reload a value served from the stale while revalidate window in
+        the background. The reload shares the single flight of on request
+        loads and runs at most once per key at a time.
+        """
+        if self._is_fresh_cache_data(
+            cache_timestamp=value.timestamp,
+            cache_max_seconds=cache_max_seconds,
+        ):
+            return
+        key = (self.name, *key)
+        if key in self._revalidations:
+            return
+
+        CACHE_REVALIDATIONS.labels(self.name.lower(), key[1]).inc()
+        # A new context keeps the reload out of the request trace.
+        task = asyncio.create_task(
+            self._single_flight.do(key, load), context=contextvars.Context()
+        )
+        self._revalidations[key] = task
+        task.add_done_callback(lambda t: self._finish_revalidation(key, t))
+
+    def _finish_revalidation(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._revalidations.get(key) is task:
+            del self._revalidations[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Failed to revalidate {key}: {task.exception()!r}")
+
+    def _get_local_cache(
+        self,
+        cache_key: HashField,
+        cache_max_seconds: int | None,
+    ) -> ExchangeInfo | ExchangeRate | None:
+        """Retrieve a fresh value from the in-process cache, if enabled."""
+        if self.local_cache is None:
+            return None
+
+        stale = False
+
+        def validate(value: ExchangeInfo | ExchangeRate) -> bool:
+            nonlocal stale
+            stale = not self._is_fresh_cache_data(
+                cache_timestamp=value.timestamp,
+                cache_max_seconds=cache_max_seconds,
+            )
+            return not stale
+
+        value = self.local_cache.get(cache_key, validate=validate)
+        self._count_cache_request(
+            cache_key, "local", "hit" if value else "stale" if stale else "miss"
+        )
+        return value
+
+    def _count_cache_request(
+        self,
+        cache_key: HashField,
+        layer: str,
+        result: str,
+    ) -> None:
+        CACHE_REQUESTS.labels(
+            self.name.lower(), cache_key.key.partition(":")[2], layer, result
+        ).inc()
+
+    def _set_local_cache(
+        self,
+        cache_key: HashField | str,
+        value: ExchangeInfo | ExchangeRate | list[str] | bool,
+        ttl: int | None = None,
+    ) -> None:
+        if self.local_cache is not None:
+            self.local_cache.set(cache_key, value, ttl=ttl)
+
     def _check_exchange_amount(
         self,
         exchange_info: ExchangeInfo,
@@ -112,6 +397,15 @@ class Provider(ABC):
     ) -> ExchangeInfo:
         """Fetch or retrieve cached exchange between two currencies."""
 
+        if self._is_pair_not_found_locally(currency_from, currency_to):
+            raise PairNotFound("Pair not found.")
+
+        exchange_info = self._get_catalog_exchange_info(
+            currency_from, currency_to
+        )
+        if exchange_info:
+            return exchange_info
+
         if cache_max_seconds is not None:
             tickers = [
                 self.get_ticker(currency_from, currency_to),
@@ -119,14 +413,53 @@ class Provider(ABC):
             ]
             exchange_info = await self._get_cached_exchange_info(
                 tickers=tickers,
-                cache_max_seconds=cache_max_seconds,
+                cache_max_seconds=self._get_cache_read_seconds(
+                    cache_max_seconds
+                ),
             )
             if exchange_info:
+                self._revalidate_if_stale(
+                    exchange_info,
+                    cache_max_seconds,
+                    ("exchange-info", *sorted([currency_from, currency_to])),
+                    lambda: self._load_exchange_info(
+                        currency_from, currency_to
+                    ),
+                )
                 return exchange_info
 
-        exchange_info = await self._fetch_exchange_info(
-            currency_from=currency_from,
-            currency_to=currency_to,
+        return await self._single_flight.do(
+            (self.name, "exchange-info", *sorted([currency_from, currency_to])),
+            lambda: self._load_exchange_info(currency_from, currency_to),
+        )
+
+    def _get_catalog_exchange_info(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> ExchangeInfo | None:
+        """
+        Look the pair up in the symbol catalog. Returns None while no
+        catalog is loaded or for pairs missing from an incomplete one,
+        pairs missing from a complete catalog are not listed.
+        """
+        if not self.symbol_catalog:
+            return None
+        exchange_info = self.symbol_catalog.get_exchange_info(
+            currency_from, currency_to
+        )
+        if exchange_info is None and self.SYMBOL_CATALOG_COMPLETE:
+            raise PairNotFound("Pair not found.")
+        return exchange_info
+
+    async def _load_exchange_info(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> ExchangeInfo:
+        """Fetch exchange information from the provider and cache it."""
+        exchange_info = await self._fetch_listed_exchange_info(
+            currency_from, currency_to
         )
         await self._set_exchange_info_cache(
             ticker=exchange_info.based_ticker,
@@ -134,9 +467,268 @@ class Provider(ABC):
         )
         return exchange_info
 
-    def _get_exchange_info_cache_key(self, key: str) -> str:
+    async def _fetch_listed_exchange_info(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> ExchangeInfo:
+        """Fetch exchange information unless the pair is known missing."""
+        if await self._is_pair_not_found(currency_from, currency_to):
+            raise PairNotFound("Pair not found.")
+
+        try:
+            return await self._fetch_exchange_info(
+                currency_from=currency_from,
+                currency_to=currency_to,
+            )
+        except PairNotFound:
+            await self._set_pair_not_found_cache(currency_from, currency_to)
+            raise
+
+    async def _set_cache(
+        self,
+        values: dict[HashField, ExchangeInfo | ExchangeRate],
+    ) -> None:
+        """
+        Write the values to the local cache and to Redis in a pipeline.
+        Redis fields expire cache_max_staleness seconds after their data
+        was fetched, values older than that are not written at all.
+        """
+        timestamp_now = int(datetime.utcnow().timestamp())
+        fields: dict[tuple[str, int], dict[str, bytes]] = {}
+        for cache_key, value in values.items():
+            self._set_local_cache(cache_key, value)
+            ttl = value.timestamp + self.cache_max_staleness - timestamp_now
+            if ttl > 0:
+                fields.setdefault((cache_key.key, ttl), {})[cache_key.field] = (
+                    self.cache_codec.encode(value)
+                )
+
+        if not fields:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for (key, ttl), mapping in fields.items():
+                write_fields(pipe, key, mapping, ttl)
+            with REDIS_OPERATION_DURATION.labels("write_fields").time():
+                await pipe.execute()
+
+    async def _get_cached_values(
+        self,
+        cache_keys: dict[HashField, type[ExchangeInfo] | type[ExchangeRate]],
+        cache_max_seconds: int,
+    ) -> dict[HashField, Any]:
+        """
+        Read fresh values from Redis in a single round trip and store them
+        in the local cache. Values older than cache_max_seconds are
+        filtered out by Redis, so they are counted as misses.
+        """
+        with span("cache_read", self.name.lower()):
+            cached_values = await read_fresh_fields(
+                self.redis,
+                list(cache_keys),
+                min_ttl=self.cache_max_staleness - cache_max_seconds,
+            )
+        cached = {}
+        missing = {}
+        for (cache_key, model), cached_value in zip(
+            cache_keys.items(), cached_values
+        ):
+            if not cached_value:
+                missing[cache_key] = model
+                continue
+            value = self.cache_codec.decode(cached_value, model)
+            if self._is_fresh_cache_data(
+                cache_timestamp=value.timestamp,
+                cache_max_seconds=cache_max_seconds,
+            ):
+                self._set_local_cache(cache_key, value)
+                cached[cache_key] = value
+                self._count_cache_request(cache_key, "redis", "hit")
+            else:
+                self._count_cache_request(cache_key, "redis", "stale")
+
+        # Only kinds without a hit for any of the tickers are looked up
+        # under the legacy keys, so cached pairs keep a single round trip.
+        found = {cache_key.key for cache_key in cached}
+        legacy = {}
+        for cache_key, model in missing.items():
+            if cache_key.key in found:
+                self._count_cache_request(cache_key, "redis", "miss")
+            else:
+                legacy[cache_key] = model
+        if legacy:
+            cached.update(
+                await self._get_legacy_cached_values(legacy, cache_max_seconds)
+            )
+        return cached
+
+    def _get_legacy_cache_key(self, cache_key: HashField) -> str:
+        """Plain key the value was stored under before the hash cache."""
+        return f"{cache_key.key.replace(':', '-')}-{cache_key.field}"
+
+    async def _get_legacy_cached_values(
+        self,
+        cache_keys: dict[HashField, type[ExchangeInfo] | type[ExchangeRate]],
+        cache_max_seconds: int,
+    ) -> dict[HashField, Any]:
+        """
+        Read values missing from the hashes under their legacy plain keys
+        and move fresh ones to the hashes. Kept for one release, so quotes
+        cached by the previous release are not all missed after a deploy.
+        """
+        with span("cache_read", self.name.lower()):
+            cached_values = await self.redis.mget(
+                [
+                    self._get_legacy_cache_key(cache_key)
+                    for cache_key in cache_keys
+                ]
+            )
+        cached = {}
+        for (cache_key, model), cached_value in zip(
+            cache_keys.items(), cached_values
+        ):
+            if not cached_value:
+                self._count_cache_request(cache_key, "redis", "miss")
+                continue
+            value = self.cache_codec.decode(cached_value, model)
+            if self._is_fresh_cache_data(
+                cache_timestamp=value.timestamp,
+                cache_max_seconds=cache_max_seconds,
+            ):
+                cached[cache_key] = value
+                self._count_cache_request(cache_key, "redis", "hit")
+            else:
+                self._count_cache_request(cache_key, "redis", "stale")
+
+        if cached:
+            await self._set_cache(cached)
+        return cached
+
+    def _get_pair_not_found_cache_key(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> str:
+        """Generate a direction agnostic negative cache key for the pair."""
+        ticker = self.get_ticker(*sorted([currency_from, currency_to]))
+        return f"{self.name}-pair-not-found-{ticker}"
+
+    def _is_pair_not_found_locally(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> bool:
+        if self.local_cache is None or not self.negative_cache_ttl:
+            return False
+        cache_key = self._get_pair_not_found_cache_key(
+            currency_from, currency_to
+        )
+        if cache_key in self.local_cache and self.local_cache.get(cache_key):
+            self.negative_cache_hits[self.name] += 1
+            return True
+        return False
+
+    async def _is_pair_not_found(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> bool:
+        """Check the shared negative cache before going to the provider."""
+        if not self.negative_cache_ttl:
+            return False
+        cache_key = self._get_pair_not_found_cache_key(
+            currency_from, currency_to
+        )
+        with REDIS_OPERATION_DURATION.labels("get").time():
+            cached_value = await self.redis.get(cache_key)
+        if not cached_value:
+            return False
+        self._set_local_cache(cache_key, True, ttl=self.negative_cache_ttl)
+        self.negative_cache_hits[self.name] += 1
+        return True
+
+    async def _set_pair_not_found_cache(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> None:
+        """Remember that the provider does not list the pair."""
+        if not self.negative_cache_ttl:
+            return
+        cache_key = self._get_pair_not_found_cache_key(
+            currency_from, currency_to
+        )
+        self._set_local_cache(cache_key, True, ttl=self.negative_cache_ttl)
+        with REDIS_OPERATION_DURATION.labels("set").time():
+            await self.redis.set(cache_key, 1, ex=self.negative_cache_ttl)
+
+    def _get_route_cache_key(self, currency_from: str, currency_to: str) -> str:
+        """Generate a cache key for a resolved intermediary route."""
+        ticker = self.get_ticker(currency_from, currency_to)
+        return f"{self.name}-route-{ticker}"
+
+    async def get_cached_route(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> list[str] | None:
+        """Retrieve the cached route for a pair the provider does not list."""
+        if not self.negative_cache_ttl:
+            return None
+        cache_key = self._get_route_cache_key(currency_from, currency_to)
+        if self.local_cache is not None and cache_key in self.local_cache:
+            route = self.local_cache.get(cache_key)
+            if route:
+                return route
+
+        with REDIS_OPERATION_DURATION.labels("get").time():
+            cached_value = await self.redis.get(cache_key)
+        if not cached_value:
+            return None
+        route = json.loads(cached_value)
+        self._set_local_cache(cache_key, route, ttl=self.negative_cache_ttl)
+        return route
+
+    async def set_cached_route(
+        self,
+        currency_from: str,
+        currency_to: str,
+        route: list[str],
+    ) -> None:
+        """Cache the route resolved for a pair the provider does not list."""
+        if not self.negative_cache_ttl:
+            return
+        cache_key = self._get_route_cache_key(currency_from, currency_to)
+        self._set_local_cache(cache_key, route, ttl=self.negative_cache_ttl)
+        with REDIS_OPERATION_DURATION.labels("set").time():
+            await self.redis.set(
+                cache_key, json.dumps(route), ex=self.negative_cache_ttl
+            )
+
+    def get_cache_keys(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> dict[HashField, type[ExchangeInfo] | type[ExchangeRate]]:
+        """Cache keys, with their models, read when exchanging the pair."""
+        tickers = [
+            self.get_ticker(currency_from, currency_to),
+            self.get_ticker(currency_to, currency_from),
+        ]
+        return {
+            **{
+                self._get_exchange_info_cache_key(ticker): ExchangeInfo
+                for ticker in tickers
+            },
+            **{
+                self._get_exchange_rate_cache_key(ticker): ExchangeRate
+                for ticker in tickers
+            },
+        }
+
+    def _get_exchange_info_cache_key(self, key: str) -> HashField:
         """Generate a cache key for exchange information."""
-        return f"{self.name}-exchange-info-{key}"
+        return HashField(self._exchange_info_hash, key)
 
     async def _set_exchange_info_cache(
         self,
@@ -144,31 +736,31 @@ class Provider(ABC):
         exchange_info: ExchangeInfo,
     ) -> None:
         """Set the exchange information in cache."""
-        cache_key = self._get_exchange_info_cache_key(ticker)
-        await self.redis.set(
-            cache_key, json.dumps(exchange_info.dict(), cls=DecimalEncoder)
+        await self._set_cache(
+            {self._get_exchange_info_cache_key(ticker): exchange_info}
         )
 
     async def _get_cached_exchange_info(
         self,
         tickers: list[str],
-        cache_max_seconds: int | None,
+        cache_max_seconds: int,
     ) -> ExchangeInfo | None:
         """Retrieve cached exchange information if available and fresh."""
 
         cache_keys = [
             self._get_exchange_info_cache_key(ticker) for ticker in tickers
         ]
-        cached_values = await self.redis.mget(cache_keys)
-        for cached_value in cached_values:
-            if not cached_value:
-                continue
-            exchange_info = ExchangeInfo.model_validate_json(cached_value)
-            if self._is_fresh_cache_data(
-                cache_timestamp=exchange_info.timestamp,
-                cache_max_seconds=cache_max_seconds,
-            ):
+        for cache_key in cache_keys:
+            exchange_info = self._get_local_cache(cache_key, cache_max_seconds)
+            if exchange_info:
                 return exchange_info
+
+        cached = await self._get_cached_values(
+            dict.fromkeys(cache_keys, ExchangeInfo), cache_max_seconds
+        )
+        for cache_key in cache_keys:
+            if cache_key in cached:
+                return cached[cache_key]
         return None
 
     async def get_exchange_rate(
@@ -179,31 +771,97 @@ class Provider(ABC):
         cache_max_seconds: int | None,
     ) -> ExchangeRate:
         """Fetch or retrieve cached exchange rate for the given ticker."""
+        exchange_rate, _ = await self._get_exchange_rate(
+            based_ticker, currency_from, currency_to, cache_max_seconds
+        )
+        return exchange_rate
+
+    async def _get_exchange_rate(
+        self,
+        based_ticker: str,
+        currency_from: str,
+        currency_to: str,
+        cache_max_seconds: int | None,
+    ) -> tuple[ExchangeRate, bool]:
+        """Return the oriented rate and whether it came from the stream."""
+        exchange_rate = self._get_streamed_exchange_rate(based_ticker)
+        if exchange_rate:
+            return (
+                self._orient_exchange_rate(
+                    exchange_rate, based_ticker, currency_from, currency_to
+                ),
+                True,
+            )
 
         if cache_max_seconds is not None:
             exchange_rate = await self._get_cached_exchange_rate(
                 ticker=based_ticker,
-                cache_max_seconds=cache_max_seconds,
+                cache_max_seconds=self._get_cache_read_seconds(
+                    cache_max_seconds
+                ),
             )
             if exchange_rate:
-                return exchange_rate
+                self._revalidate_if_stale(
+                    exchange_rate,
+                    cache_max_seconds,
+                    ("exchange-rate", based_ticker),
+                    lambda: self._load_exchange_rate(based_ticker),
+                )
 
-        price = await self._fetch_ticker_price(based_ticker)
-        exchange_rate = ExchangeRate(
-            rate=Decimal(price),
-            timestamp=int(datetime.utcnow().timestamp()),
-        )
+        if not exchange_rate:
+            exchange_rate = await self._single_flight.do(
+                (self.name, "exchange-rate", based_ticker),
+                lambda: self._load_exchange_rate(based_ticker),
+            )
 
-        await self._set_exchange_rate_cache(based_ticker, exchange_rate)
+        return (
+            self._orient_exchange_rate(
+                exchange_rate, based_ticker, currency_from, currency_to
+            ),
+            False,
+        )
 
+    def _orient_exchange_rate(
+        self,
+        exchange_rate: ExchangeRate,
+        based_ticker: str,
+        currency_from: str,
+        currency_to: str,
+    ) -> ExchangeRate:
+        """Invert the rate of the based ticker for the reverse direction."""
+        # Cached rates are shared, so the inverted rate is a new object.
         if self.get_ticker(currency_from, currency_to) != based_ticker:
-            exchange_rate.rate = 1 / exchange_rate.rate
+            return ExchangeRate(
+                rate=1 / exchange_rate.rate,
+                timestamp=exchange_rate.timestamp,
+            )
+        return exchange_rate
+
+    def _get_streamed_exchange_rate(self, ticker: str) -> ExchangeRate | None:
+        """Read the rate from the live market data book, if it is healthy."""
+        if self.market_data is None:
+            return None
+        quote = self.market_data.get_quote(ticker)
+        if quote is None:
+            return None
+        return ExchangeRate(rate=quote.last, timestamp=quote.timestamp)
 
+    async def _load_exchange_rate(self, based_ticker: str) -> ExchangeRate:
+        """Fetch the exchange rate from the provider and cache it."""
+        exchange_rate = await self._fetch_exchange_rate(based_ticker)
+        await self._set_exchange_rate_cache(based_ticker, exchange_rate)
         return exchange_rate
 
-    def _get_exchange_rate_cache_key(self, key: str) -> str:
+    async def _fetch_exchange_rate(self, based_ticker: str) -> ExchangeRate:
+        price = await self._fetch_ticker_price(based_ticker)
+        return ExchangeRate(
+            rate=Decimal(price),
+            timestamp=int(datetime.utcnow().timestamp()),
+        )
+
+    def _get_exchange_rate_cache_key(self, key: str) -> HashField:
         """Generate a cache key for exchange rate."""
-        return f"{self.name}-exchange-rate-{key}"
+        return HashField(self._exchange_rate_hash, key)
 
     async def _set_exchange_rate_cache(
         self,
@@ -211,29 +869,121 @@ class Provider(ABC):
         exchange_rate: ExchangeRate,
     ) -> None:
         """Set the exchange rate in cache."""
-        cache_key = self._get_exchange_rate_cache_key(ticker)
-        await self.redis.set(
-            cache_key, json.dumps(exchange_rate.dict(), cls=DecimalEncoder)
+        await self._set_cache(
+            {self._get_exchange_rate_cache_key(ticker): exchange_rate}
         )
 
+    async def refresh_exchange_rates(self) -> int:
+        """
+        Fetch all ticker prices in one call and write them to the cache
+        in a single Redis pipeline. Returns the number of refreshed rates.
+        """
+        prices = await self._fetch_all_ticker_prices()
+        timestamp = int(datetime.utcnow().timestamp())
+
+        mapping = {}
+        for ticker, price in prices.items():
+            cache_key = self._get_exchange_rate_cache_key(ticker)
+            exchange_rate = ExchangeRate(rate=price, timestamp=timestamp)
+            # Only refresh hot entries, the full ticker list would
+            # evict them from the bounded local cache.
+            if self.local_cache is not None and cache_key in self.local_cache:
+                self.local_cache.set(cache_key, exchange_rate)
+            mapping[ticker] = self.cache_codec.encode(exchange_rate)
+
+        if mapping:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                write_fields(
+                    pipe,
+                    self._exchange_rate_hash,
+                    mapping,
+                    self.cache_max_staleness,
+                )
+                with REDIS_OPERATION_DURATION.labels("write_fields").time():
+                    await pipe.execute()
+
+        return len(prices)
+
+    async def get_currency_graph(self) -> CurrencyGraph:
+        """Build the graph of currencies tradable on the provider."""
+        return CurrencyGraph(await self._fetch_trading_pairs())
+
+    async def get_symbol_catalog(self) -> SymbolCatalog:
+        """Load the exchange information of every listed pair at once."""
+        return SymbolCatalog(await self._fetch_all_exchange_info())
+
     async def _get_cached_exchange_rate(
         self,
         ticker: str,
-        cache_max_seconds: int | None,
+        cache_max_seconds: int,
     ) -> ExchangeRate | None:
         """Retrieve cached exchange rate if available and fresh."""
 
         cache_key = self._get_exchange_rate_cache_key(ticker)
-        cached_value = await self.redis.get(cache_key)
-        if cached_value:
-            exchange_rate = ExchangeRate.model_validate_json(cached_value)
-            if self._is_fresh_cache_data(
-                cache_timestamp=exchange_rate.timestamp,
-                cache_max_seconds=cache_max_seconds,
-            ):
-                return exchange_rate
+        exchange_rate = self._get_local_cache(cache_key, cache_max_seconds)
+        if exchange_rate:
+            return exchange_rate
 
-        return None
+        cached = await self._get_cached_values(
+            {cache_key: ExchangeRate}, cache_max_seconds
+        )
+        return cached.get(cache_key)
+
+    async def _get_cached_quote(
+        self,
+        currency_from: str,
+        currency_to: str,
+        cache_max_seconds: int,
+    ) -> tuple[ExchangeInfo | None, ExchangeRate | None]:
+        """
+        Retrieve fresh cached exchange information and its rate. Entries
+        missing from the local cache are read in a single round trip with
+        the exchange information of both ticker directions and their rates.
+        """
+        tickers = [
+            self.get_ticker(currency_from, currency_to),
+            self.get_ticker(currency_to, currency_from),
+        ]
+        cache_keys: dict[HashField, type[ExchangeInfo] | type[ExchangeRate]]
+        for ticker in tickers:
+            exchange_info = self._get_local_cache(
+                self._get_exchange_info_cache_key(ticker), cache_max_seconds
+            )
+            if exchange_info:
+                based_ticker = exchange_info.based_ticker
+                exchange_rate = self._get_streamed_exchange_rate(
+                    based_ticker
+                ) or self._get_local_cache(
+                    self._get_exchange_rate_cache_key(based_ticker),
+                    cache_max_seconds,
+                )
+                if exchange_rate:
+                    return exchange_info, exchange_rate
+                cache_keys = {
+                    self._get_exchange_rate_cache_key(based_ticker): (
+                        ExchangeRate
+                    )
+                }
+                break
+        else:
+            exchange_info = None
+            cache_keys = self.get_cache_keys(currency_from, currency_to)
+
+        cached = await self._get_cached_values(cache_keys, cache_max_seconds)
+        if not exchange_info:
+            for ticker in tickers:
+                exchange_info = cached.get(
+                    self._get_exchange_info_cache_key(ticker)
+                )
+                if exchange_info:
+                    break
+            else:
+                return None, None
+
+        exchange_rate = cached.get(
+            self._get_exchange_rate_cache_key(exchange_info.based_ticker)
+        )
+        return exchange_info, exchange_rate
 
     async def exchange(
         self,
@@ -244,26 +994,119 @@ class Provider(ABC):
     ) -> ExchangeResult:
         """
         Fetch or retrieve cached exchange rate and returns the exchange result.
+        Exchange information comes from the symbol catalog when it is loaded,
+        otherwise cached exchange information and rate are read from Redis in
+        a single round trip.
         """
-        exchange_info = await self.get_exchange_info(
-            currency_from=currency_from,
-            currency_to=currency_to,
-            cache_max_seconds=cache_max_seconds,
+        if self._is_pair_not_found_locally(currency_from, currency_to):
+            raise PairNotFound("Pair not found.")
+
+        exchange_info = self._get_catalog_exchange_info(
+            currency_from, currency_to
         )
+        if exchange_info:
+            self._check_exchange_amount(
+                exchange_info=exchange_info,
+                amount=amount,
+                currency_from=currency_from,
+                currency_to=currency_to,
+            )
+            exchange_rate, streamed = await self._get_exchange_rate(
+                based_ticker=exchange_info.based_ticker,
+                currency_from=currency_from,
+                currency_to=currency_to,
+                cache_max_seconds=cache_max_seconds,
+            )
+        else:
+            exchange_rate, streamed = await self._get_quote_exchange_rate(
+                amount=amount,
+                currency_from=currency_from,
+                currency_to=currency_to,
+                cache_max_seconds=cache_max_seconds,
+            )
+
+        with span("format"):
+            # Streamed rates are bounded by the market data staleness
+            # instead, so only cached rates are marked stale.
+            return ExchangeResult(
+                rate=format_decimal(exchange_rate.rate),
+                result=format_decimal(amount * exchange_rate.rate),
+                updated_at=exchange_rate.timestamp,
+                stale=not streamed
+                and cache_max_seconds is not None
+                and not self._is_fresh_cache_data(
+                    cache_timestamp=exchange_rate.timestamp,
+                    cache_max_seconds=cache_max_seconds,
+                ),
+            )
+
+    async def _get_quote_exchange_rate(
+        self,
+        amount: Decimal,
+        currency_from: str,
+        currency_to: str,
+        cache_max_seconds: int | None,
+    ) -> tuple[ExchangeRate, bool]:
+        """
+        Check the amount and return the oriented rate and whether it came
+        from the stream. On a miss the rate is only loaded once the
+        exchange information allows the amount.
+        """
+        exchange_info, exchange_rate = None, None
+        if cache_max_seconds is not None:
+            exchange_info, exchange_rate = await self._get_cached_quote(
+                currency_from=currency_from,
+                currency_to=currency_to,
+                cache_max_seconds=self._get_cache_read_seconds(
+                    cache_max_seconds
+                ),
+            )
+            if exchange_info:
+                self._revalidate_if_stale(
+                    exchange_info,
+                    cache_max_seconds,
+                    ("exchange-info", *sorted([currency_from, currency_to])),
+                    lambda: self._load_exchange_info(
+                        currency_from, currency_to
+                    ),
+                )
+            if exchange_info and exchange_rate:
+                based_ticker = exchange_info.based_ticker
+                self._revalidate_if_stale(
+                    exchange_rate,
+                    cache_max_seconds,
+                    ("exchange-rate", based_ticker),
+                    lambda: self._load_exchange_rate(based_ticker),
+                )
+
+        if not exchange_info:
+            exchange_info = await self._single_flight.do(
+                (
+                    self.name,
+                    "exchange-info",
+                    *sorted([currency_from, currency_to]),
+                ),
+                lambda: self._load_exchange_info(currency_from, currency_to),
+            )
+
         self._check_exchange_amount(
             exchange_info=exchange_info,
             amount=amount,
             currency_from=currency_from,
             currency_to=currency_to,
         )
-        exchange_rate = await self.get_exchange_rate(
-            based_ticker=exchange_info.based_ticker,
-            currency_from=currency_from,
-            currency_to=currency_to,
-            cache_max_seconds=cache_max_seconds,
-        )
-        return ExchangeResult(
-            rate=format_decimal(exchange_rate.rate),
-            result=format_decimal(amount * exchange_rate.rate),
-            updated_at=exchange_rate.timestamp,
+
+        based_ticker = exchange_info.based_ticker
+        streamed_exchange_rate = self._get_streamed_exchange_rate(based_ticker)
+        exchange_rate = streamed_exchange_rate or exchange_rate
+        if not exchange_rate:
+            exchange_rate = await self._single_flight.do(
+                (self.name, "exchange-rate", based_ticker),
+                lambda: self._load_exchange_rate(based_ticker),
+            )
+        return (
+            self._orient_exchange_rate(
+                exchange_rate, based_ticker, currency_from, currency_to
+            ),
+            streamed_exchange_rate is not None,
         )
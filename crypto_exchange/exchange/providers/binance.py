@@ -1,10 +1,12 @@
+import asyncio
 import logging
 from datetime import datetime
 from decimal import Decimal
+from typing import Mapping
 
 from crypto_exchange.exchange.exceptions import ProviderBadResponse
 from crypto_exchange.exchange.providers.abc import Provider
-from crypto_exchange.exchange.schemas import ExchangeInfo
+from crypto_exchange.exchange.schemas import ExchangeInfo, TradingPair
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,25 @@ EXCHANGE_INFO_URL = (
 
 TICKER_PRICE_URL = f"{BASE_URL}/api/v3/ticker/price?symbol={{ticker}}"
 
+ALL_TICKER_PRICES_URL = f"{BASE_URL}/api/v3/ticker/price"
+
+SYMBOLS_URL = f"{BASE_URL}/api/v3/exchangeInfo"
+
+ALL_TICKERS_24HR_URL = f"{BASE_URL}/api/v3/ticker/24hr"
+
+# Request weights of the endpoints, the exchange info weight is charged
+# to the separate SAPI limit and is not tracked.
+TICKER_PRICE_WEIGHT = 2
+ALL_TICKER_PRICES_WEIGHT = 4
+SYMBOLS_WEIGHT = 20
+ALL_TICKERS_24HR_WEIGHT = 80
+
+# Symbols with the older MIN_NOTIONAL filter have no maximum notional,
+# the maximum of the NOTIONAL filter of most symbols is used instead.
+DEFAULT_MAX_NOTIONAL = Decimal("9000000")
+
+USED_WEIGHT_HEADER = "X-MBX-USED-WEIGHT-1M"
+
 PAIR_NOT_FOUND_ERROR_CODE = 345122
 INVALID_SYMBOL_ERROR_CODE = -1121
 
@@ -29,6 +50,24 @@ class Binance(Provider):
         INVALID_SYMBOL_ERROR_CODE,
     ]
 
+    RATE_LIMIT = (6000, 60)
+
+    # Spot symbols miss convert-only pairs.
+    SYMBOL_CATALOG_COMPLETE = False
+    CURRENCY_GRAPH_COMPLETE = False
+
+    def _update_rate_limit(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+    ) -> None:
+        super()._update_rate_limit(status, headers)
+        used_weight = headers.get(USED_WEIGHT_HEADER, "")
+        if self.rate_limiter is not None and used_weight.isdigit():
+            self.rate_limiter.update_remaining(
+                self.RATE_LIMIT[0] - int(used_weight)
+            )
+
     async def _fetch_exchange_info(
         self,
         currency_from: str,
@@ -68,12 +107,70 @@ class Binance(Provider):
             timestamp=int(datetime.utcnow().timestamp()),
         )
 
+    async def _fetch_all_exchange_info(
+        self,
+    ) -> dict[tuple[str, str], ExchangeInfo]:
+        # Convert exchangeInfo requires an asset, so the limits of all
+        # pairs come from the spot lot size and notional filters.
+        data = await self._fetch_data(SYMBOLS_URL, weight=SYMBOLS_WEIGHT)
+        timestamp = int(datetime.utcnow().timestamp())
+
+        exchange_infos = {}
+        for symbol in data["symbols"]:
+            filters = {item["filterType"]: item for item in symbol["filters"]}
+            lot_size = filters.get("LOT_SIZE")
+            notional = filters.get("NOTIONAL") or filters.get("MIN_NOTIONAL")
+            if symbol["status"] != "TRADING" or not lot_size or not notional:
+                continue
+
+            exchange_infos[(symbol["baseAsset"], symbol["quoteAsset"])] = (
+                ExchangeInfo(
+                    based_ticker=symbol["symbol"],
+                    from_asset_min_amount=Decimal(lot_size["minQty"]),
+                    from_asset_max_amount=Decimal(lot_size["maxQty"]),
+                    to_asset_min_amount=Decimal(notional["minNotional"]),
+                    to_asset_max_amount=Decimal(
+                        notional.get("maxNotional", DEFAULT_MAX_NOTIONAL)
+                    ),
+                    timestamp=timestamp,
+                )
+            )
+        return exchange_infos
+
     async def _fetch_ticker_price(self, based_ticker: str) -> Decimal:
         data = await self._fetch_data(
-            TICKER_PRICE_URL.format(ticker=based_ticker)
+            TICKER_PRICE_URL.format(ticker=based_ticker),
+            weight=TICKER_PRICE_WEIGHT,
         )
         return Decimal(data["price"])
 
+    async def _fetch_all_ticker_prices(self) -> dict[str, Decimal]:
+        data = await self._fetch_data(
+            ALL_TICKER_PRICES_URL, weight=ALL_TICKER_PRICES_WEIGHT
+        )
+        return {item["symbol"]: Decimal(item["price"]) for item in data}
+
+    async def _fetch_trading_pairs(self) -> list[TradingPair]:
+        symbols_data, tickers_data = await asyncio.gather(
+            self._fetch_data(SYMBOLS_URL, weight=SYMBOLS_WEIGHT),
+            self._fetch_data(
+                ALL_TICKERS_24HR_URL, weight=ALL_TICKERS_24HR_WEIGHT
+            ),
+        )
+        volumes = {
+            item["symbol"]: Decimal(item["quoteVolume"])
+            for item in tickers_data
+        }
+        return [
+            TradingPair(
+                base=symbol["baseAsset"],
+                quote=symbol["quoteAsset"],
+                liquidity=volumes.get(symbol["symbol"], Decimal(0)),
+            )
+            for symbol in symbols_data["symbols"]
+            if symbol["status"] == "TRADING"
+        ]
+
     @staticmethod
     def get_ticker(currency_from: str, currency_to: str) -> str:
         return f"{currency_from}{currency_to}"
@@ -1,24 +1,39 @@
 import logging
 from datetime import datetime
 from decimal import Decimal
+from typing import Mapping
 
 from crypto_exchange.exchange.exceptions import (
     PairNotFound,
     ProviderBadResponse,
 )
 from crypto_exchange.exchange.providers.abc import Provider
-from crypto_exchange.exchange.schemas import ExchangeInfo
+from crypto_exchange.exchange.schemas import ExchangeInfo, TradingPair
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.kucoin.com"
 
-EXCHANGE_INFO_URL = f"{BASE_URL}/api/v2/symbols/{{ticker}}"
+EXCHANGE_INFO_ENDPOINT = "/api/v2/symbols/{ticker}"
+
+EXCHANGE_INFO_URL = f"{BASE_URL}{EXCHANGE_INFO_ENDPOINT}"
+
+ALL_EXCHANGE_INFO_URL = f"{BASE_URL}/api/v2/symbols"
 
 TICKER_PRICE_URL = (
     f"{BASE_URL}/api/v1/market/orderbook/level1?symbol={{ticker}}"
 )
 
+ALL_TICKERS_URL = f"{BASE_URL}/api/v1/market/allTickers"
+
+# Request weights of the endpoints in the public resource pool.
+SYMBOL_WEIGHT = 4
+TICKER_PRICE_WEIGHT = 2
+ALL_TICKERS_WEIGHT = 15
+
+REMAINING_WEIGHT_HEADER = "gw-ratelimit-remaining"
+RESET_HEADER = "gw-ratelimit-reset"
+
 PAIR_NOT_FOUND_ERROR_CODE = "900001"
 
 
@@ -27,6 +42,23 @@ class Kucoin(Provider):
 
     NOT_FOUND_ERROR_CODES = [PAIR_NOT_FOUND_ERROR_CODE]
 
+    RATE_LIMIT = (2000, 30)
+
+    def _update_rate_limit(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+    ) -> None:
+        super()._update_rate_limit(status, headers)
+        remaining = headers.get(REMAINING_WEIGHT_HEADER, "")
+        if self.rate_limiter is None or not remaining.isdigit():
+            return
+        self.rate_limiter.update_remaining(int(remaining))
+        reset = headers.get(RESET_HEADER, "")
+        if int(remaining) == 0 and reset.isdigit():
+            # The reset header is in milliseconds.
+            self.rate_limiter.pause(int(reset) / 1000)
+
     async def _fetch_exchange_info(
         self,
         currency_from: str,
@@ -35,7 +67,9 @@ class Kucoin(Provider):
 
         async def _fetch(ticker: str) -> dict:
             return await self._fetch_data(
-                EXCHANGE_INFO_URL.format(ticker=ticker)
+                EXCHANGE_INFO_URL.format(ticker=ticker),
+                endpoint=EXCHANGE_INFO_ENDPOINT,
+                weight=SYMBOL_WEIGHT,
             )
 
         ticker = f"{currency_from}-{currency_to}"
@@ -59,12 +93,68 @@ class Kucoin(Provider):
             timestamp=int(datetime.utcnow().timestamp()),
         )
 
+    async def _fetch_all_exchange_info(
+        self,
+    ) -> dict[tuple[str, str], ExchangeInfo]:
+        data = await self._fetch_data(
+            ALL_EXCHANGE_INFO_URL, weight=SYMBOL_WEIGHT
+        )
+        symbols = data.get("data")
+        if symbols is None:
+            logger.warning(f"Kucoin returned bad response: {data}")
+            raise ProviderBadResponse()
+
+        timestamp = int(datetime.utcnow().timestamp())
+        return {
+            (item["baseCurrency"], item["quoteCurrency"]): ExchangeInfo(
+                based_ticker=item["symbol"],
+                from_asset_min_amount=Decimal(item["baseMinSize"]),
+                from_asset_max_amount=Decimal(item["baseMaxSize"]),
+                to_asset_min_amount=Decimal(item["baseMinSize"]),
+                to_asset_max_amount=Decimal(item["baseMaxSize"]),
+                timestamp=timestamp,
+            )
+            for item in symbols
+            if item.get("enableTrading")
+        }
+
     async def _fetch_ticker_price(self, based_ticker: str) -> Decimal:
         data = await self._fetch_data(
-            TICKER_PRICE_URL.format(ticker=based_ticker)
+            TICKER_PRICE_URL.format(ticker=based_ticker),
+            weight=TICKER_PRICE_WEIGHT,
         )
         return Decimal(data["data"]["price"])
 
+    async def _fetch_all_tickers(self) -> list[dict]:
+        data = await self._fetch_data(
+            ALL_TICKERS_URL, weight=ALL_TICKERS_WEIGHT
+        )
+        tickers = (data.get("data") or {}).get("ticker")
+        if tickers is None:
+            logger.warning(f"Kucoin returned bad response: {data}")
+            raise ProviderBadResponse()
+        return tickers
+
+    async def _fetch_all_ticker_prices(self) -> dict[str, Decimal]:
+        return {
+            item["symbol"]: Decimal(item["last"])
+            for item in await self._fetch_all_tickers()
+            if item.get("last")
+        }
+
+    async def _fetch_trading_pairs(self) -> list[TradingPair]:
+        trading_pairs = []
+        for item in await self._fetch_all_tickers():
+            base, _, quote = item["symbol"].partition("-")
+            trading_pairs.append(
+                TradingPair(
+                    base=base,
+                    quote=quote,
+                    liquidity=Decimal(item.get("volValue") or 0),
+                )
+            )
+        return trading_pairs
+
     @staticmethod
     def get_ticker(currency_from: str, currency_to: str) -> str:
         return f"{currency_from}-{currency_to}"
@@ -1,14 +1,42 @@
+import asyncio
 import logging
 from decimal import Decimal
+from typing import Any, Coroutine, Iterable
 
 import redis.asyncio as aioredis
 from aiohttp import ClientSession
 
+from crypto_exchange.exchange.catalog import SymbolCatalog
 from crypto_exchange.exchange.exceptions import InvalidProvider, PairNotFound
+from crypto_exchange.exchange.graph import CurrencyGraph
 from crypto_exchange.exchange.providers.binance import Binance
 from crypto_exchange.exchange.providers.kucoin import Kucoin
-from crypto_exchange.exchange.schemas import ExchangeResult
-from crypto_exchange.lib.constants import INTERMEDIARY_CURRENCIES
+from crypto_exchange.exchange.schemas import (
+    ExchangeInfo,
+    ExchangeRate,
+    ExchangeResult,
+)
+from crypto_exchange.exchange.streams.book import Level1Book
+from crypto_exchange.lib.cache import LocalCache
+from crypto_exchange.lib.circuit_breaker import CircuitBreaker
+from crypto_exchange.lib.codec import get_codec
+from crypto_exchange.lib.constants import (
+    CACHE_CODEC_JSON,
+    CACHE_MAX_STALENESS,
+    INTERMEDIARY_CURRENCIES,
+    INTERMEDIARY_MAX_CONCURRENCY,
+    INTERMEDIARY_POLICY_BEST_RATE,
+    INTERMEDIARY_POLICY_FIRST_SUCCESS,
+    MAX_ROUTE_HOPS,
+    NEGATIVE_CACHE_TTL,
+    PROVIDER_POLICY_BEST_RATE,
+    PROVIDER_POLICY_SEQUENTIAL,
+)
+from crypto_exchange.lib.hash_cache import HashField, read_fresh_fields
+from crypto_exchange.lib.hedging import RequestHedger
+from crypto_exchange.lib.metrics import INTERMEDIARY_ROUTES
+from crypto_exchange.lib.rate_limiter import RateLimiter
+from crypto_exchange.lib.tracing import span
 from crypto_exchange.lib.utils import format_decimal
 
 logger = logging.getLogger(__name__)
@@ -25,23 +53,132 @@ class ExchangeResolver:
         http_session: ClientSession,
         redis: aioredis.Redis,
         exchange: str | None,
+        local_cache: LocalCache | None = None,
+        http_sessions: dict[str, ClientSession] | None = None,
+        market_data: dict[str, Level1Book] | None = None,
+        currency_graphs: dict[str, CurrencyGraph] | None = None,
+        symbol_catalogs: dict[str, SymbolCatalog] | None = None,
+        circuit_breakers: dict[str, CircuitBreaker] | None = None,
+        request_hedgers: dict[str, RequestHedger] | None = None,
+        rate_limiters: dict[str, RateLimiter] | None = None,
+        providers: dict[str, Binance | Kucoin] | None = None,
+        max_route_hops: int = MAX_ROUTE_HOPS,
+        provider_policy: str = PROVIDER_POLICY_SEQUENTIAL,
+        intermediary_currencies: list[str] = INTERMEDIARY_CURRENCIES,
+        intermediary_policy: str = INTERMEDIARY_POLICY_FIRST_SUCCESS,
+        intermediary_max_concurrency: int = INTERMEDIARY_MAX_CONCURRENCY,
+        negative_cache_ttl: int = NEGATIVE_CACHE_TTL,
+        cache_codec: str = CACHE_CODEC_JSON,
+        cache_max_staleness: int = CACHE_MAX_STALENESS,
+        stale_while_revalidate: int = 0,
     ):
         self.http_session = http_session
         self.redis = redis
         self.exchange = exchange
+        self.local_cache = local_cache
+        self.http_sessions = http_sessions or {}
+        self.market_data = market_data or {}
+        self.currency_graphs = currency_graphs or {}
+        self.symbol_catalogs = symbol_catalogs or {}
+        self.circuit_breakers = circuit_breakers or {}
+        self.request_hedgers = request_hedgers or {}
+        self.rate_limiters = rate_limiters or {}
+        self.providers = providers or {}
+        self.max_route_hops = max_route_hops
+        self.provider_policy = provider_policy
+        self.intermediary_currencies = intermediary_currencies
+        self.intermediary_policy = intermediary_policy
+        self.intermediary_max_concurrency = intermediary_max_concurrency
+        self.negative_cache_ttl = negative_cache_ttl
+        self.cache_codec = cache_codec
+        self.cache_max_staleness = cache_max_staleness
+        self.stale_while_revalidate = stale_while_revalidate
 
     def get_provider_instance(self) -> Binance | Kucoin:
+        return self._create_provider(self.exchange)
+
+    def _create_provider(self, exchange: str) -> Binance | Kucoin:
+        """
+        The app-scoped instance of the provider when there is one, copied
+        when this request reads another local cache or serves stale quotes
+        for another duration.
+        """
+        provider_name = exchange.lower()
+        provider = self.providers.get(provider_name)
+        if provider is not None:
+            if (
+                provider.local_cache is self.local_cache
+                and provider.stale_while_revalidate
+                == self.stale_while_revalidate
+            ):
+                return provider
+            return provider.replace(
+                local_cache=self.local_cache,
+                stale_while_revalidate=self.stale_while_revalidate,
+            )
+
         try:
-            provider_cls = PROVIDERS_MAP[self.exchange.lower()]
+            provider_cls = PROVIDERS_MAP[provider_name]
         except KeyError:
-            raise InvalidProvider(
-                f"Provider '{self.exchange}' is not supported."
-            )
+            raise InvalidProvider(f"Provider '{exchange}' is not supported.")
         return provider_cls(
-            http_session=self.http_session,
+            http_session=self.http_sessions.get(
+                provider_name, self.http_session
+            ),
             redis=self.redis,
+            local_cache=self.local_cache,
+            market_data=self.market_data.get(provider_name),
+            symbol_catalog=self.symbol_catalogs.get(provider_name),
+            circuit_breaker=self.circuit_breakers.get(provider_name),
+            hedger=self.request_hedgers.get(provider_name),
+            rate_limiter=self.rate_limiters.get(provider_name),
+            negative_cache_ttl=self.negative_cache_ttl,
+            cache_codec=self.cache_codec,
+            cache_max_staleness=self.cache_max_staleness,
+            stale_while_revalidate=self.stale_while_revalidate,
         )
 
+    async def warm_local_cache(
+        self,
+        pairs: Iterable[tuple[str | None, str, str]],
+    ) -> int:
+        """
+        Load cached exchange info and rates for many (exchange,
+        currency_from, currency_to) pairs into the local cache with a
+        single Redis round trip. Pairs without an exchange are loaded for
+        every provider. Returns the number of loaded entries.
+        """
+        cache_keys: dict[HashField, type[ExchangeInfo] | type[ExchangeRate]] = (
+            {}
+        )
+        for exchange, currency_from, currency_to in pairs:
+            for provider_name in [exchange] if exchange else PROVIDERS_MAP:
+                try:
+                    provider = self._create_provider(provider_name)
+                except InvalidProvider:
+                    continue
+                cache_keys.update(
+                    provider.get_cache_keys(currency_from, currency_to)
+                )
+
+        if self.local_cache is None or not cache_keys:
+            return 0
+
+        cached_values = await read_fresh_fields(
+            self.redis, list(cache_keys), min_ttl=0
+        )
+        codec = get_codec(self.cache_codec)
+        loaded = 0
+        for (cache_key, model), cached_value in zip(
+            cache_keys.items(), cached_values
+        ):
+            if cached_value:
+                self.local_cache.set(
+                    cache_key, codec.decode(cached_value, model)
+                )
+                loaded += 1
+        return loaded
+
     async def resolve(
         self,
         currency_from: str,
@@ -51,18 +188,23 @@ class ExchangeResolver:
     ) -> ExchangeResult:
         if self.exchange:
             return await self._try_resolve(
-                self.get_provider_instance(),
+                self.exchange,
                 currency_from,
                 currency_to,
                 amount,
                 cache_max_seconds,
             )
 
-        for provider_name in PROVIDERS_MAP.keys():
+        if self.provider_policy != PROVIDER_POLICY_SEQUENTIAL:
+            return await self._resolve_concurrently(
+                currency_from, currency_to, amount, cache_max_seconds
+            )
+
+        for provider_name in self._get_available_providers():
             self.exchange = provider_name
             try:
                 return await self._try_resolve(
-                    self.get_provider_instance(),
+                    provider_name,
                     currency_from,
                     currency_to,
                     amount,
@@ -79,14 +221,77 @@ class ExchangeResolver:
             f"No valid exchange found for {currency_from}/{currency_to}"
         )
 
+    def _get_available_providers(self) -> list[str]:
+        """
+        Providers to try when no exchange is given, skipping those whose
+        circuit breaker is open unless every circuit is open.
+        """
+        available = [
+            provider_name
+            for provider_name in PROVIDERS_MAP
+            if provider_name not in self.circuit_breakers
+            or not self.circuit_breakers[provider_name].is_open
+        ]
+        return available or list(PROVIDERS_MAP)
+
+    async def _resolve_concurrently(
+        self,
+        currency_from: str,
+        currency_to: str,
+        amount: Decimal,
+        cache_max_seconds: int | None,
+    ) -> ExchangeResult:
+        """Query all providers concurrently, picking one by the policy."""
+        select = (
+            best_rate
+            if self.provider_policy == PROVIDER_POLICY_BEST_RATE
+            else first_success
+        )
+        provider_name, result, errors = await select(
+            {
+                name: self._try_resolve(
+                    name,
+                    currency_from,
+                    currency_to,
+                    amount,
+                    cache_max_seconds,
+                )
+                for name in self._get_available_providers()
+            }
+        )
+        if result is None:
+            raise_first_error(errors)
+            raise PairNotFound(
+                f"No valid exchange found for {currency_from}/{currency_to}"
+            )
+
+        self.exchange = provider_name
+        return result
+
     async def _try_resolve(
         self,
-        provider: Binance | Kucoin,
+        provider_name: str,
         currency_from: str,
         currency_to: str,
         amount: Decimal,
         cache_max_seconds: int | None,
     ) -> ExchangeResult:
+        provider = self._create_provider(provider_name)
+
+        graph = self.currency_graphs.get(provider_name.lower())
+        if graph:
+            route = graph.find_route(
+                currency_from, currency_to, self.max_route_hops
+            )
+            if route is not None:
+                return await self._resolve_via_route(
+                    provider, route, amount, cache_max_seconds, source="graph"
+                )
+            if provider.CURRENCY_GRAPH_COMPLETE:
+                raise PairNotFound(
+                    f"No route found for {currency_from}/{currency_to}."
+                )
+
         try:
             return await provider.exchange(
                 amount,
@@ -95,17 +300,65 @@ class ExchangeResolver:
                 cache_max_seconds,
             )
         except PairNotFound:
-            logger.info(
-                f"Pair not found for {currency_from}/{currency_to}. "
-                f"Trying intermediaries..."
-            )
-            return await self._resolve_via_intermediary(
-                provider,
+            pass
+
+        route = await provider.get_cached_route(currency_from, currency_to)
+        if route:
+            try:
+                return await self._resolve_via_route(
+                    provider, route, amount, cache_max_seconds, source="cached"
+                )
+            except PairNotFound:
+                logger.info(f"Cached route {route} is no longer valid.")
+
+        logger.info(
+            f"Pair not found for {currency_from}/{currency_to}. "
+            f"Trying intermediaries..."
+        )
+        return await self._resolve_via_intermediary(
+            provider,
+            currency_from,
+            currency_to,
+            amount,
+            cache_max_seconds,
+        )
+
+    async def _resolve_via_route(
+        self,
+        provider: Binance | Kucoin,
+        route: list[str],
+        amount: Decimal,
+        cache_max_seconds: int | None,
+        source: str | None = None,
+    ) -> ExchangeResult:
+        """
+        Exchange the amount along the route of currencies, leg by leg.
+        Routes with intermediaries are counted by the source they came from.
+        """
+        leg_amount = amount
+        results = []
+        for currency_from, currency_to in zip(route, route[1:]):
+            result = await provider.exchange(
+                leg_amount,
                 currency_from,
                 currency_to,
-                amount,
                 cache_max_seconds,
             )
+            leg_amount = Decimal(result.result)
+            results.append(result)
+
+        if source and len(route) > 2:
+            INTERMEDIARY_ROUTES.labels(provider.name.lower(), source).inc()
+        if len(results) == 1:
+            return results[0]
+
+        with span("format"):
+            return ExchangeResult(
+                rate=format_decimal(leg_amount / amount),
+                result=format_decimal(leg_amount),
+                updated_at=min(result.updated_at for result in results),
+                stale=any(result.stale for result in results),
+            )
 
     async def _resolve_via_intermediary(
         self,
@@ -115,34 +368,121 @@ class ExchangeResolver:
         amount: Decimal,
         cache_max_seconds: int | None,
     ) -> ExchangeResult:
-        for intermediary in INTERMEDIARY_CURRENCIES:
-            try:
-                intermediate_result = await provider.exchange(
-                    amount,
-                    currency_from,
-                    intermediary,
-                    cache_max_seconds,
-                )
-                result = await provider.exchange(
-                    Decimal(intermediate_result.result),
-                    intermediary,
-                    currency_to,
-                    cache_max_seconds,
-                )
-                result.rate = format_decimal(
-                    Decimal(intermediate_result.result)
-                    * Decimal(result.rate)
-                    / amount
-                )
-                return result
-            except PairNotFound:
-                logger.warning(
-                    f"Intermediary {intermediary} failed "
-                    f"for {currency_from}/{currency_to}."
-                )
-                continue
+        """
+        Probe the routes through every intermediary concurrently, at most
+        intermediary_max_concurrency at a time, and pick one by the policy.
+        Routes stop at the first leg that fails.
+        """
+        semaphore = asyncio.Semaphore(self.intermediary_max_concurrency)
 
-        raise PairNotFound(
-            f"Could not resolve {currency_from}/{currency_to} "
-            f"via intermediaries."
+        async def probe(intermediary: str) -> ExchangeResult:
+            async with semaphore:
+                with span("intermediary", intermediary):
+                    return await self._resolve_via_route(
+                        provider,
+                        [currency_from, intermediary, currency_to],
+                        amount,
+                        cache_max_seconds,
+                    )
+
+        select = (
+            best_rate
+            if self.intermediary_policy == INTERMEDIARY_POLICY_BEST_RATE
+            else first_success
+        )
+        intermediary, result, errors = await select(
+            {
+                intermediary: probe(intermediary)
+                for intermediary in self.intermediary_currencies
+                if intermediary not in (currency_from, currency_to)
+            }
+        )
+        if result is None:
+            raise_first_error(errors)
+            raise PairNotFound(
+                f"Could not resolve {currency_from}/{currency_to} "
+                f"via intermediaries."
+            )
+
+        logger.info(
+            f"Resolved {currency_from}/{currency_to} via {intermediary}."
         )
+        INTERMEDIARY_ROUTES.labels(provider.name.lower(), "probed").inc()
+        await provider.set_cached_route(
+            currency_from,
+            currency_to,
+            [currency_from, intermediary, currency_to],
+        )
+        return result
+
+
+async def first_success(
+    attempts: dict[str, Coroutine[Any, Any, ExchangeResult]],
+) -> tuple[str | None, ExchangeResult | None, dict[str, BaseException]]:
+    """
+    Run the attempts concurrently and return the key and result of the
+    first one to succeed, cancelling the rest. Ties keep the attempts
+    order. Returns the errors of the failed attempts if none succeeds.
+    """
+    tasks = {
+        asyncio.create_task(attempt): key for key, attempt in attempts.items()
+    }
+    order = list(tasks)
+    errors: dict[str, BaseException] = {}
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            # Every exception is read, so none is reported as never
+            # retrieved when a task finishing alongside succeeds.
+            succeeded = None
+            for task in sorted(done, key=order.index):
+                error = task.exception()
+                if error is not None:
+                    errors[tasks[task]] = error
+                elif succeeded is None:
+                    succeeded = task
+            if succeeded is not None:
+                return tasks[succeeded], succeeded.result(), errors
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    return None, None, {key: errors[key] for key in attempts}
+
+
+async def best_rate(
+    attempts: dict[str, Coroutine[Any, Any, ExchangeResult]],
+) -> tuple[str | None, ExchangeResult | None, dict[str, BaseException]]:
+    """
+    Run the attempts concurrently and return the key and result with the
+    highest rate. Ties keep the attempts order. Returns the errors of the
+    failed attempts if none succeeds.
+    """
+    results = await asyncio.gather(*attempts.values(), return_exceptions=True)
+
+    best_key, best_result = None, None
+    errors: dict[str, BaseException] = {}
+    for key, result in zip(attempts, results):
+        if isinstance(result, BaseException):
+            errors[key] = result
+        elif best_result is None or Decimal(result.rate) > Decimal(
+            best_result.rate
+        ):
+            best_key, best_result = key, result
+    return best_key, best_result, errors
+
+
+def raise_first_error(errors: dict[str, BaseException]) -> None:
+    """
+    Raise the first error that is not PairNotFound, so failures such as an
+    invalid amount or a bad provider response are not masked by the other
+    attempts missing the pair.
+    """
+    for key, error in errors.items():
+        if not isinstance(error, PairNotFound):
+            raise error
+        logger.warning(f"Pair not found via {key}.")
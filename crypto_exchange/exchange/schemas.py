@@ -21,3 +21,10 @@ class ExchangeResult(BaseModel):
     rate: str
     result: str
     updated_at: int
+    stale: bool = False
+
+
+class TradingPair(BaseModel):
+    base: str
+    quote: str
+    liquidity: Decimal = Decimal(0)
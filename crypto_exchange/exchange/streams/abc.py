@@ -0,0 +1,138 @@
+import asyncio
+import json
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+from aiohttp import (
+    ClientError,
+    ClientSession,
+    ClientWebSocketResponse,
+    WSMsgType,
+)
+
+from crypto_exchange.exchange.exceptions import ProviderBadResponse
+from crypto_exchange.exchange.streams.book import Level1Book
+
+logger = logging.getLogger(__name__)
+
+
+class MarketDataStream(ABC):
+    """
+    Abstract base class for provider WebSocket ticker streams.
+
+    Keeps a Level1Book up to date and reconnects with exponential backoff
+    and jitter whenever the connection drops or goes silent.
+    """
+
+    def __init__(
+        self,
+        http_session: ClientSession,
+        book: Level1Book,
+        url: str | None = None,
+        backoff_min: float = 0.5,
+        backoff_max: float = 30.0,
+    ):
+        self.name = self.__class__.__name__
+        self.http_session = http_session
+        self.book = book
+        self.url = url
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.ping_interval: float | None = None
+        self.connections = 0
+
+    @abstractmethod
+    async def _connect(self) -> ClientWebSocketResponse:
+        """Open the WebSocket connection and subscribe to tickers."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _handle_message(self, data: Any) -> None:
+        """Apply a decoded stream message to the book."""
+        raise NotImplementedError()
+
+    def _ping_message(self) -> dict | None:
+        """
+        Application level ping, sent every ping_interval seconds unless
+        it is None.
+        """
+        return None
+
+    async def run(self) -> None:
+        """Consume the stream forever, reconnecting on failures."""
+        backoff = self.backoff_min
+        while True:
+            try:
+                ws = await self._connect()
+            except (
+                ClientError,
+                asyncio.TimeoutError,
+                OSError,
+                ProviderBadResponse,
+            ) as e:
+                logger.warning(f"{self.name} failed to connect: {e!r}")
+            else:
+                self.connections += 1
+                self.book.connected = True
+                try:
+                    if await self._consume(ws):
+                        backoff = self.backoff_min
+                except (ClientError, asyncio.TimeoutError, OSError) as e:
+                    logger.warning(f"{self.name} connection error: {e!r}")
+                finally:
+                    self.book.connected = False
+                    await ws.close()
+
+            delay = random.uniform(backoff / 2, backoff)
+            logger.info(f"{self.name} reconnecting in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, self.backoff_max)
+
+    async def _consume(self, ws: ClientWebSocketResponse) -> bool:
+        """
+        Read messages until the connection closes or stays silent for
+        longer than the book's staleness watermark. Returns whether any
+        message was received.
+        """
+        received = False
+        last_ping = time.monotonic()
+        timeout = self.book.max_staleness
+        if self.ping_interval is not None:
+            timeout = min(timeout, self.ping_interval)
+
+        while True:
+            try:
+                msg = await ws.receive(timeout=timeout)
+            except asyncio.TimeoutError:
+                if self.book.is_healthy():
+                    msg = None
+                else:
+                    logger.warning(f"{self.name} stream went stale.")
+                    return received
+
+            if msg is not None:
+                if msg.type != WSMsgType.TEXT:
+                    return received
+                received = True
+                try:
+                    self._handle_message(json.loads(msg.data))
+                except (
+                    ValueError,
+                    KeyError,
+                    TypeError,
+                    AttributeError,
+                    ArithmeticError,
+                ) as e:
+                    logger.warning(f"{self.name} bad message: {e!r}")
+
+            if (
+                self.ping_interval is not None
+                and time.monotonic() - last_ping >= self.ping_interval
+            ):
+                ping = self._ping_message()
+                if ping is not None:
+                    await ws.send_json(ping)
+                last_ping = time.monotonic()
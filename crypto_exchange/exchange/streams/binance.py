@@ -0,0 +1,29 @@
+from decimal import Decimal
+from typing import Any
+
+from aiohttp import ClientWebSocketResponse
+
+from crypto_exchange.exchange.streams.abc import MarketDataStream
+
+STREAM_URL = "wss://stream.binance.com:9443/ws/!ticker@arr"
+
+
+class BinanceStream(MarketDataStream):
+    """Binance all market tickers stream."""
+
+    async def _connect(self) -> ClientWebSocketResponse:
+        return await self.http_session.ws_connect(self.url or STREAM_URL)
+
+    def _handle_message(self, data: Any) -> None:
+        if not isinstance(data, list):
+            self.book.touch()
+            return
+
+        for ticker in data:
+            self.book.update(
+                ticker=ticker["s"],
+                last=Decimal(ticker["c"]),
+                bid=Decimal(ticker["b"]),
+                ask=Decimal(ticker["a"]),
+                timestamp=ticker["E"] // 1000,
+            )
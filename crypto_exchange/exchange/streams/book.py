@@ -0,0 +1,73 @@
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+
+
+@dataclass(slots=True)
+class Quote:
+    bid: Decimal | None
+    ask: Decimal | None
+    last: Decimal
+    timestamp: int
+    received_at: float
+
+
+class Level1Book:
+    """
+    In-memory best bid/ask/last table for one provider, fed by a market
+    data stream. Quotes are only served while the stream is healthy and
+    the quote itself is within the staleness watermark.
+    """
+
+    def __init__(self, max_staleness: float):
+        self.max_staleness = max_staleness
+        self.connected = False
+        self.last_message_at: float | None = None
+        self._quotes: dict[str, Quote] = {}
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def update(
+        self,
+        ticker: str,
+        last: Decimal,
+        bid: Decimal | None = None,
+        ask: Decimal | None = None,
+        timestamp: int | None = None,
+    ) -> None:
+        now = time.monotonic()
+        self._quotes[ticker] = Quote(
+            bid=bid,
+            ask=ask,
+            last=last,
+            timestamp=timestamp or int(time.time()),
+            received_at=now,
+        )
+        self.last_message_at = now
+
+    def touch(self) -> None:
+        """Advance the watermark on messages that carry no quotes."""
+        self.last_message_at = time.monotonic()
+
+    def is_healthy(self) -> bool:
+        return (
+            self.connected
+            and self.last_message_at is not None
+            and time.monotonic() - self.last_message_at <= self.max_staleness
+        )
+
+    def get_quote(self, ticker: str) -> Quote | None:
+        if not self.is_healthy():
+            return None
+        quote = self._quotes.get(ticker)
+        if quote is None:
+            return None
+        if time.monotonic() - quote.received_at > self.max_staleness:
+            return None
+        return quote
+
+    def clear(self) -> None:
+        self.connected = False
+        self.last_message_at = None
+        self._quotes.clear()
@@ -0,0 +1,60 @@
+import uuid
+from decimal import Decimal
+from typing import Any
+
+from aiohttp import ClientWebSocketResponse
+
+from crypto_exchange.exchange.exceptions import ProviderBadResponse
+from crypto_exchange.exchange.streams.abc import MarketDataStream
+
+TOKEN_URL = "https://api.kucoin.com/api/v1/bullet-public"
+
+TICKER_TOPIC = "/market/ticker:all"
+
+
+class KucoinStream(MarketDataStream):
+    """Kucoin all market tickers stream."""
+
+    async def _connect(self) -> ClientWebSocketResponse:
+        async with self.http_session.post(self.url or TOKEN_URL) as response:
+            data = (await response.json()).get("data")
+        if not data or not data.get("instanceServers"):
+            raise ProviderBadResponse()
+
+        server = data["instanceServers"][0]
+        self.ping_interval = server["pingInterval"] / 1000
+
+        ws = await self.http_session.ws_connect(
+            server["endpoint"],
+            params={"token": data["token"], "connectId": uuid.uuid4().hex},
+        )
+        await ws.send_json(
+            {
+                "id": uuid.uuid4().hex,
+                "type": "subscribe",
+                "topic": TICKER_TOPIC,
+                "response": True,
+            }
+        )
+        return ws
+
+    def _ping_message(self) -> dict:
+        return {"id": uuid.uuid4().hex, "type": "ping"}
+
+    def _handle_message(self, data: Any) -> None:
+        if (
+            not isinstance(data, dict)
+            or data.get("type") != "message"
+            or data.get("topic") != TICKER_TOPIC
+        ):
+            self.book.touch()
+            return
+
+        ticker = data["data"]
+        self.book.update(
+            ticker=data["subject"],
+            last=Decimal(ticker["price"]),
+            bid=Decimal(ticker["bestBid"]) if ticker["bestBid"] else None,
+            ask=Decimal(ticker["bestAsk"]) if ticker["bestAsk"] else None,
+            timestamp=ticker["time"] // 1000,
+        )
@@ -0,0 +1,72 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LocalCache:
+    """Bounded in-process cache with TTL expiry and LRU eviction."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(
+        self,
+        key: Hashable,
+        validate: Callable[[Any], bool] | None = None,
+    ) -> Any | None:
+        """
+        Return the cached value for key, or None if it is missing, expired
+        or rejected by the validate callback.
+        """
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        if validate is not None and not validate(value):
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        if self.maxsize <= 0:
+            return
+
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,87 @@
+import time
+from typing import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stop calling an unhealthy dependency for a while.
+
+    The circuit opens after failure_threshold consecutive failures. Once
+    reset_timeout seconds have passed a single trial call is let through,
+    its success closes the circuit again and its failure reopens it. A
+    trial without an outcome, e.g. a cancelled one, is replaced by a new
+    one after another reset_timeout. on_change is called with is_open
+    when a call or its outcome changes it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        on_change: Callable[[bool], None] | None = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.on_change = on_change
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._trial_started_at: float | None = None
+        self._was_open = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return OPEN
+        return HALF_OPEN
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently rejected."""
+        state = self.state
+        return state == OPEN or (state == HALF_OPEN and self._trial_running)
+
+    @property
+    def _trial_running(self) -> bool:
+        return (
+            self._trial_started_at is not None
+            and time.monotonic() - self._trial_started_at < self.reset_timeout
+        )
+
+    def _notify(self) -> None:
+        is_open = self.is_open
+        if self.on_change is not None and is_open != self._was_open:
+            self.on_change(is_open)
+        self._was_open = is_open
+
+    def allow_request(self) -> bool:
+        """Return whether a call may be made, starting the trial call."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        allowed = state == HALF_OPEN and not self._trial_running
+        if allowed:
+            self._trial_started_at = time.monotonic()
+        self._notify()
+        return allowed
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+        self._notify()
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if (
+            self._trial_started_at is not None
+            or self.failures >= self.failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._trial_started_at = None
+        self._notify()
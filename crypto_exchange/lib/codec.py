@@ -0,0 +1,171 @@
+import struct
+from abc import ABC, abstractmethod
+from decimal import MAX_PREC, Context, Decimal
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from crypto_exchange.lib.constants import CACHE_CODEC_BINARY, CACHE_CODEC_JSON
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_VERSION = struct.Struct("<B")
+_STR_LENGTH = struct.Struct("<B")
+# Scaling a decimal must never round its coefficient.
+_EXACT = Context(prec=MAX_PREC)
+
+
+class CacheCodec(ABC):
+    """Serializes cached models to and from the bytes stored in Redis."""
+
+    name: str
+
+    @abstractmethod
+    def encode(self, value: BaseModel) -> bytes:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def decode(self, data: bytes, model: type[ModelT]) -> ModelT:
+        raise NotImplementedError()
+
+
+class JsonCodec(CacheCodec):
+    name = CACHE_CODEC_JSON
+
+    def encode(self, value: BaseModel) -> bytes:
+        return value.model_dump_json().encode()
+
+    def decode(self, data: bytes, model: type[ModelT]) -> ModelT:
+        if data[:1] != b"{":
+            # Values written by BinaryCodec stay readable after a switch.
+            return CODECS[CACHE_CODEC_BINARY].decode(data, model)
+        return model.model_validate_json(data)
+
+
+def _scale(value: Decimal) -> tuple[int, int]:
+    """Split a decimal into its exponent and integer coefficient."""
+    text = str(value)
+    point = text.find(".")
+    if "E" not in text:
+        if point < 0:
+            return 0, int(text)
+        return point + 1 - len(text), int(text[:point] + text[point + 1 :])
+
+    exponent = value.as_tuple().exponent
+    if not isinstance(exponent, int):
+        raise ValueError(f"Can not encode {value}.")
+    return exponent, int(value.scaleb(-exponent, context=_EXACT))
+
+
+class _Layout:
+    """Precomputed binary layout of a model."""
+
+    def __init__(self, model: type[BaseModel]):
+        self.str_fields: list[str] = []
+        self.decimal_fields: list[str] = []
+        self.int_fields: list[str] = []
+        fields = {
+            str: self.str_fields,
+            Decimal: self.decimal_fields,
+            int: self.int_fields,
+        }
+        for name, field in model.model_fields.items():
+            try:
+                fields[field.annotation].append(name)  # type: ignore[index]
+            except KeyError:
+                raise TypeError(
+                    f"Can not encode {model.__name__}.{name} field."
+                )
+        count = len(self.decimal_fields)
+        self.numbers = struct.Struct(
+            "<" + "b" * count + "q" * (count + len(self.int_fields))
+        )
+
+
+class BinaryCodec(CacheCodec):
+    """
+    Versioned struct layout: a version byte, the string fields as length
+    prefixed UTF-8, then a fixed struct with the exponents and 64 bit
+    scaled coefficients of the decimals followed by the ints. Fields of
+    each kind keep their declaration order.
+
+    Smaller than JSON but slower to encode and decode. Values written by
+    JsonCodec are still read, so existing cache entries stay valid while
+    a deployment migrates. Values that do not fit the layout are written
+    as JSON for the same reason.
+    """
+
+    name = CACHE_CODEC_BINARY
+    VERSION = 1
+
+    def __init__(self) -> None:
+        self._layouts: dict[type[BaseModel], _Layout] = {}
+        self._json = JsonCodec()
+
+    def _get_layout(self, model: type[BaseModel]) -> _Layout:
+        layout = self._layouts.get(model)
+        if layout is None:
+            layout = self._layouts[model] = _Layout(model)
+        return layout
+
+    def encode(self, value: BaseModel) -> bytes:
+        layout = self._get_layout(type(value))
+        exponents = []
+        coefficients = []
+        parts = [_VERSION.pack(self.VERSION)]
+        try:
+            for name in layout.decimal_fields:
+                exponent, coefficient = _scale(getattr(value, name))
+                exponents.append(exponent)
+                coefficients.append(coefficient)
+            for name in layout.str_fields:
+                encoded = getattr(value, name).encode()
+                parts.append(_STR_LENGTH.pack(len(encoded)))
+                parts.append(encoded)
+            parts.append(
+                layout.numbers.pack(
+                    *exponents,
+                    *coefficients,
+                    *[getattr(value, name) for name in layout.int_fields],
+                )
+            )
+        except (struct.error, ValueError):
+            return self._json.encode(value)
+        return b"".join(parts)
+
+    def decode(self, data: bytes, model: type[ModelT]) -> ModelT:
+        if data[0] != self.VERSION:
+            if data[:1] == b"{":
+                return self._json.decode(data, model)
+            raise ValueError(f"Unsupported cache format version {data[0]}.")
+
+        layout = self._get_layout(model)
+        values: dict[str, Any] = {}
+        offset = _VERSION.size
+        for name in layout.str_fields:
+            length = data[offset]
+            offset += _STR_LENGTH.size
+            values[name] = data[offset : offset + length].decode()
+            offset += length
+
+        numbers = layout.numbers.unpack_from(data, offset)
+        count = len(layout.decimal_fields)
+        for name, exponent, coefficient in zip(
+            layout.decimal_fields, numbers, numbers[count:]
+        ):
+            values[name] = Decimal(coefficient).scaleb(exponent)
+        for name, number in zip(layout.int_fields, numbers[count * 2 :]):
+            values[name] = number
+        return model(**values)
+
+
+CODECS: dict[str, CacheCodec] = {
+    codec.name: codec for codec in [JsonCodec(), BinaryCodec()]
+}
+
+
+def get_codec(name: str) -> CacheCodec:
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Cache codec '{name}' is not supported.")
@@ -1,3 +1,42 @@
 INTERMEDIARY_CURRENCIES = ["USDT"]
 
+MAX_ROUTE_HOPS = 3
+# Routes memoized per currency graph, least recently used are evicted.
+MAX_CACHED_ROUTES = 4096
+
+NEGATIVE_CACHE_TTL = 300
+
+CACHE_MAX_STALENESS = 300
+
 MAX_DIGITS_AFTER_DOT = 8
+
+PROVIDER_POLICY_SEQUENTIAL = "sequential"
+PROVIDER_POLICY_FIRST_SUCCESS = "first_success"
+PROVIDER_POLICY_BEST_RATE = "best_rate"
+
+INTERMEDIARY_POLICY_FIRST_SUCCESS = "first_success"
+INTERMEDIARY_POLICY_BEST_RATE = "best_rate"
+
+INTERMEDIARY_MAX_CONCURRENCY = 4
+
+CACHE_CODEC_JSON = "json"
+CACHE_CODEC_BINARY = "binary"
+
+HEDGE_BUDGET = 0.05
+
+CIRCUIT_BREAKER_FAILURES = 5
+CIRCUIT_BREAKER_RESET_TIMEOUT = 30
+
+RATE_LIMIT_MAX_WAIT = 2
+# Seconds to pause a rate limited provider that sends no Retry-After.
+RATE_LIMIT_BACKOFF = 60
+
+PRIORITY_REQUEST = 0
+PRIORITY_BACKGROUND = 1
+
+WORKER_RESTART_DELAY = 1
+WORKER_SHUTDOWN_TIMEOUT = 60
+
+WARMUP_TIMEOUT = 30
+# Cached quotes younger than this are reused by the warm-up.
+WARMUP_CACHE_MAX_SECONDS = 60
@@ -0,0 +1,95 @@
+from typing import Any, NamedTuple
+
+import redis.asyncio as aioredis
+from redis.commands.core import AsyncScript
+
+from crypto_exchange.lib.metrics import REDIS_OPERATION_DURATION
+
+# Returns the values of the requested hash fields, with false for fields
+# that expire before now + ARGV[1] seconds. Fields expire max staleness
+# seconds after their data was fetched, so the expire time tells the age
+# without downloading the value. ARGV[2..] holds the field count of every
+# key followed by its fields.
+READ_FRESH_FIELDS_SCRIPT = """
+local min_expire_time = tonumber(redis.call('TIME')[1]) + tonumber(ARGV[1])
+local result = {}
+local index = 2
+for _, key in ipairs(KEYS) do
+    local count = tonumber(ARGV[index])
+    local fields = {unpack(ARGV, index + 1, index + count)}
+    index = index + count + 1
+    local values = redis.call('HMGET', key, unpack(fields))
+    local expire_times = redis.call(
+        'HEXPIRETIME', key, 'FIELDS', count, unpack(fields)
+    )
+    for i = 1, count do
+        if values[i] and expire_times[i] >= min_expire_time then
+            table.insert(result, values[i])
+        else
+            table.insert(result, false)
+        end
+    end
+end
+return result
+"""
+
+# Client attribute holding the registered script, so its SHA1 digest is
+# computed once per client instead of on every read.
+SCRIPT_ATTRIBUTE = "_read_fresh_fields_script"
+
+
+class HashField(NamedTuple):
+    key: str
+    field: str
+
+
+def _get_script(redis: aioredis.Redis) -> AsyncScript:
+    script = vars(redis).get(SCRIPT_ATTRIBUTE)
+    if script is None:
+        script = redis.register_script(READ_FRESH_FIELDS_SCRIPT)
+        setattr(redis, SCRIPT_ATTRIBUTE, script)
+    return script
+
+
+async def read_fresh_fields(
+    redis: aioredis.Redis,
+    fields: list[HashField],
+    min_ttl: int,
+) -> list[bytes | None]:
+    """
+    Read hash fields with a single script call. Fields expiring in less
+    than min_ttl seconds are returned as None and never leave Redis.
+    """
+    positions: dict[str, list[tuple[int, str]]] = {}
+    for position, (key, field) in enumerate(fields):
+        positions.setdefault(key, []).append((position, field))
+
+    args: list[Any] = [min_ttl]
+    for key_fields in positions.values():
+        args.append(len(key_fields))
+        args.extend(field for _, field in key_fields)
+
+    script = _get_script(redis)
+    with REDIS_OPERATION_DURATION.labels("read_fresh_fields").time():
+        values = await script(keys=list(positions), args=args)
+
+    result: list[bytes | None] = [None] * len(fields)
+    value_positions = [
+        position
+        for key_fields in positions.values()
+        for position, _ in key_fields
+    ]
+    for position, value in zip(value_positions, values):
+        result[position] = value
+    return result
+
+
+def write_fields(
+    pipe: aioredis.client.Pipeline,
+    key: str,
+    mapping: dict[str, bytes],
+    ttl: int,
+) -> None:
+    """Queue writing the fields with a per field expiry on the pipeline."""
+    pipe.hset(key, mapping=mapping)
+    pipe.execute_command("HEXPIRE", key, ttl, "FIELDS", len(mapping), *mapping)
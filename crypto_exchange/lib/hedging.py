@@ -0,0 +1,83 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestHedger:
+    """
+    Send a duplicate of a slow request and use whichever finishes first.
+
+    A request is hedged once it has run longer than the delay: the
+    quantile of recently observed latencies if a quantile is set and
+    enough latencies were observed, the fixed delay otherwise. Each
+    request earns budget tokens and each hedge spends one, so at most
+    about budget of the requests are sent twice.
+    """
+
+    def __init__(
+        self,
+        delay: float | None = None,
+        quantile: float | None = None,
+        budget: float = 0.05,
+        min_samples: int = 100,
+        max_samples: int = 1000,
+        max_tokens: float = 10,
+        on_hedge: Callable[[], None] | None = None,
+    ):
+        self.delay = delay
+        self.quantile = quantile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.max_tokens = max_tokens
+        self.on_hedge = on_hedge
+        self._tokens = 0.0
+        self._latencies: deque[float] = deque(maxlen=max_samples)
+
+    def get_delay(self) -> float | None:
+        """Seconds after which a request is hedged, None to never hedge."""
+        if self.quantile is not None and (
+            len(self._latencies) >= self.min_samples
+        ):
+            latencies = sorted(self._latencies)
+            index = min(len(latencies) - 1, int(len(latencies) * self.quantile))
+            return latencies[index]
+        return self.delay
+
+    async def _timed(self, request: Callable[[], Awaitable[T]]) -> T:
+        started_at = time.perf_counter()
+        result = await request()
+        self._latencies.append(time.perf_counter() - started_at)
+        return result
+
+    async def run(self, request: Callable[[], Awaitable[T]]) -> T:
+        self._tokens = min(self.max_tokens, self._tokens + self.budget)
+        delay = self.get_delay()
+        if delay is None:
+            return await self._timed(request)
+
+        tasks = {asyncio.ensure_future(self._timed(request))}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self._tokens >= 1:
+                self._tokens -= 1
+                if self.on_hedge is not None:
+                    self.on_hedge()
+                tasks.add(asyncio.ensure_future(self._timed(request)))
+
+            errors = []
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    errors.append(error)
+            raise errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,139 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+from crypto_exchange.exchange.exceptions import (
+    InvalidAssetAmount,
+    InvalidProvider,
+    PairNotFound,
+    ProviderBadResponse,
+)
+
+REQUEST_DURATION = Histogram(
+    "crypto_exchange_request_duration_seconds",
+    "Convert request latency.",
+    ["provider", "outcome"],
+)
+
+UPSTREAM_REQUEST_DURATION = Histogram(
+    "crypto_exchange_upstream_request_duration_seconds",
+    "Provider API request latency.",
+    ["provider", "endpoint"],
+)
+
+UPSTREAM_RESPONSES = Counter(
+    "crypto_exchange_upstream_responses_total",
+    "Provider API responses by status code.",
+    ["provider", "endpoint", "status"],
+)
+
+UPSTREAM_HEDGED_REQUESTS = Counter(
+    "crypto_exchange_upstream_hedged_requests_total",
+    "Duplicate provider API requests sent for slow requests.",
+    ["provider"],
+)
+
+# Gauges are aggregated over the live workers in multiprocess mode, see
+# api.metrics.
+CIRCUIT_BREAKER_OPEN = Gauge(
+    "crypto_exchange_circuit_breaker_open",
+    "Whether requests to a provider are rejected by its circuit breaker.",
+    ["provider"],
+    multiprocess_mode="livemax",
+)
+
+CIRCUIT_BREAKER_REJECTIONS = Counter(
+    "crypto_exchange_circuit_breaker_rejections_total",
+    "Provider API requests rejected by an open circuit breaker.",
+    ["provider"],
+)
+
+RATE_LIMIT_QUEUE = Gauge(
+    "crypto_exchange_rate_limit_queue",
+    "Provider API requests waiting for rate limit weight.",
+    ["provider"],
+    multiprocess_mode="livesum",
+)
+
+RATE_LIMIT_WAIT_DURATION = Histogram(
+    "crypto_exchange_rate_limit_wait_seconds",
+    "Time provider API requests were throttled by the rate limiter.",
+    ["provider"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+RATE_LIMIT_REJECTIONS = Counter(
+    "crypto_exchange_rate_limit_rejections_total",
+    "Provider API requests that would wait too long for rate limit weight.",
+    ["provider"],
+)
+
+UPSTREAM_POOL_LIMIT = Gauge(
+    "crypto_exchange_upstream_pool_limit",
+    "Connection limit of the HTTP pool of a provider, 0 is unlimited.",
+    ["provider"],
+    multiprocess_mode="livesum",
+)
+
+UPSTREAM_POOL_REQUESTS = Gauge(
+    "crypto_exchange_upstream_pool_requests",
+    "Provider API requests holding or waiting for a pooled connection.",
+    ["provider", "state"],
+    multiprocess_mode="livesum",
+)
+
+UPSTREAM_POOL_CONNECTIONS = Counter(
+    "crypto_exchange_upstream_pool_connections_total",
+    "Connections handed out by the HTTP pool: created or reused.",
+    ["provider", "result"],
+)
+
+UPSTREAM_POOL_WAIT_DURATION = Histogram(
+    "crypto_exchange_upstream_pool_wait_seconds",
+    "Time provider API requests waited for a free pooled connection.",
+    ["provider"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+REDIS_OPERATION_DURATION = Histogram(
+    "crypto_exchange_redis_operation_duration_seconds",
+    "Redis operation latency.",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5),
+)
+
+CACHE_REQUESTS = Counter(
+    "crypto_exchange_cache_requests_total",
+    "Quote cache lookups by result: hit, miss or stale.",
+    ["provider", "cache", "layer", "result"],
+)
+
+CACHE_REVALIDATIONS = Counter(
+    "crypto_exchange_cache_revalidations_total",
+    "Background reloads of stale cached values served to requests.",
+    ["provider", "cache"],
+)
+
+INTERMEDIARY_ROUTES = Counter(
+    "crypto_exchange_intermediary_routes_total",
+    "Conversions resolved through intermediary currencies.",
+    ["provider", "source"],
+)
+
+WARMUP_DURATION = Gauge(
+    "crypto_exchange_warmup_seconds",
+    "Duration of the startup warm-up, set once it completes or times out.",
+    multiprocess_mode="livemax",
+)
+
+OUTCOMES: dict[type[Exception], str] = {
+    PairNotFound: "pair_not_found",
+    InvalidAssetAmount: "invalid_amount",
+    InvalidProvider: "invalid_provider",
+    ProviderBadResponse: "provider_error",
+}
+
+
+def get_outcome(error: Exception | None) -> str:
+    """Map a resolver exception to a bounded outcome label."""
+    if error is None:
+        return "success"
+    return OUTCOMES.get(type(error), "error")
@@ -0,0 +1,117 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Callable
+
+
+class RateLimitExceeded(Exception):
+    pass
+
+
+class RateLimiter:
+    """
+    Token bucket shared by the calls to one rate limited API.
+
+    The bucket holds up to limit weight and refills it over period
+    seconds. Calls wait in line by priority, lower first, then by arrival,
+    and give up with RateLimitExceeded when they would wait longer than
+    max_wait. The bucket is corrected from the remaining weight reported
+    by the API, and paused when the API asks to retry later. With a
+    share below 1 the bucket holds that share of limit, for processes
+    splitting the limit of the API, and the reported remaining weight is
+    scaled to it. on_queue_change is called with the number of waiting
+    calls.
+    """
+
+    def __init__(
+        self,
+        limit: float,
+        period: float,
+        max_wait: float,
+        on_queue_change: Callable[[int], None] | None = None,
+        share: float = 1,
+    ):
+        self.share = share
+        self.limit = limit * share
+        self.rate = self.limit / period
+        self.max_wait = max_wait
+        self.on_queue_change = on_queue_change
+        self._tokens = self.limit
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: list[list] = []
+        self._counter = itertools.count()
+        self._condition = asyncio.Condition()
+
+    def __len__(self) -> int:
+        """Number of calls waiting for weight."""
+        return len(self._waiters)
+
+    @property
+    def tokens(self) -> float:
+        self._refill(time.monotonic())
+        return self._tokens
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.limit, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def _get_delay(self, weight: float, now: float) -> float:
+        return max(
+            self._paused_until - now,
+            (weight - self._tokens) / self.rate,
+            0,
+        )
+
+    async def acquire(self, weight: float = 1, priority: int = 0) -> float:
+        """Wait for the weight of a call, return the seconds waited."""
+        weight = min(weight, self.limit)
+        started_at = time.monotonic()
+        deadline = started_at + self.max_wait
+        entry = [priority, next(self._counter)]
+        async with self._condition:
+            heapq.heappush(self._waiters, entry)
+            self._queue_changed()
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    timeout = deadline - now
+                    if self._waiters[0] is entry:
+                        delay = self._get_delay(weight, now)
+                        if not delay:
+                            self._tokens -= weight
+                            return now - started_at
+                        if delay > timeout:
+                            raise RateLimitExceeded()
+                        timeout = delay
+                    elif timeout <= 0:
+                        raise RateLimitExceeded()
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._queue_changed()
+                self._condition.notify_all()
+
+    def _queue_changed(self) -> None:
+        if self.on_queue_change is not None:
+            self.on_queue_change(len(self._waiters))
+
+    def update_remaining(self, remaining: float) -> None:
+        """
+        Lower the bucket to its share of the weight the API reports as
+        remaining.
+        """
+        self._refill(time.monotonic())
+        self._tokens = min(self._tokens, remaining * self.share)
+
+    def pause(self, seconds: float) -> None:
+        """Let no call through for the given seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
@@ -0,0 +1,36 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into one in-flight call.
+
+    Every caller awaiting a key receives the result or exception of the
+    single underlying call. The key is released once the call completes,
+    so later callers start a new one.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(lambda f: self._release(key, f))
+        # Shielded so a cancelled waiter does not cancel the shared call.
+        return await asyncio.shield(future)
+
+    def _release(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved even if every waiter is gone.
+            future.exception()
@@ -0,0 +1,121 @@
+import json
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from types import TracebackType
+from typing import Any, Iterator, NamedTuple
+
+_NO_SPAN = nullcontext()
+
+
+class Span(NamedTuple):
+    name: str
+    duration: float
+    description: str | None
+
+
+class RequestTrace:
+    """Timings of the stages of a single request."""
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.finished_at: float | None = None
+        self.spans: list[Span] = []
+
+    @property
+    def total(self) -> float:
+        finished_at = self.finished_at or time.perf_counter()
+        return finished_at - self.started_at
+
+    def add(
+        self,
+        name: str,
+        duration: float,
+        description: str | None = None,
+    ) -> None:
+        self.spans.append(Span(name, duration, description))
+
+    def server_timing(self) -> str:
+        """Format the spans as a Server-Timing header value."""
+        metrics = []
+        for name, duration, description in [
+            *self.spans,
+            Span("total", self.total, None),
+        ]:
+            desc = f';desc="{description}"' if description else ""
+            metrics.append(f"{name}{desc};dur={duration * 1000:.3f}")
+        return ", ".join(metrics)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_ms": round(self.total * 1000, 3),
+            "spans": [
+                {
+                    "name": name,
+                    "description": description,
+                    "duration_ms": round(duration * 1000, 3),
+                }
+                for name, duration, description in self.spans
+            ],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+
+_current_trace: ContextVar[RequestTrace | None] = ContextVar(
+    "request_trace", default=None
+)
+
+
+class _Span:
+    __slots__ = ("trace", "name", "description", "started_at")
+
+    def __init__(
+        self,
+        trace: RequestTrace,
+        name: str,
+        description: str | None,
+    ):
+        self.trace = trace
+        self.name = name
+        self.description = description
+
+    def __enter__(self) -> None:
+        self.started_at = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.trace.add(
+            self.name, time.perf_counter() - self.started_at, self.description
+        )
+
+
+def span(
+    name: str,
+    description: str | None = None,
+) -> AbstractContextManager[None]:
+    """
+    Time the block in the trace of the current request. Outside a traced
+    request this returns a shared no-op context manager.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return _NO_SPAN
+    return _Span(trace, name, description)
+
+
+@contextmanager
+def trace_request() -> Iterator[RequestTrace]:
+    """Trace the spans recorded by the block and the tasks it starts."""
+    trace = RequestTrace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        trace.finished_at = time.perf_counter()
+        _current_trace.reset(token)
@@ -1,9 +1,15 @@
 import json
 from decimal import ROUND_DOWN, Decimal
+from functools import cache
 from typing import Any
 
 from crypto_exchange.lib.constants import MAX_DIGITS_AFTER_DOT
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class DecimalEncoder(json.JSONEncoder):
     def default(self, obj: Any) -> Any:
@@ -12,12 +18,31 @@ class DecimalEncoder(json.JSONEncoder):
         return super(DecimalEncoder, self).default(obj)
 
 
+@cache
+def _get_quantize_exponent(max_digits: int) -> Decimal:
+    return Decimal("1." + "0" * max_digits)
+
+
 def format_decimal(
     value: Decimal,
     max_digits: int = MAX_DIGITS_AFTER_DOT,
 ) -> str:
     quantized_value = value.quantize(
-        Decimal("1." + "0" * max_digits),
+        _get_quantize_exponent(max_digits),
         rounding=ROUND_DOWN,
     )
     return format(quantized_value, "f")
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any) -> bytes:
+    """Serialize to compact JSON with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
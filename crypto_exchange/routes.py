@@ -1,7 +1,10 @@
 from aiohttp import web
 
-from crypto_exchange.api import v1
+from crypto_exchange.api import health, metrics, v1
 
 
 def setup_routes(app: web.Application) -> None:
     app.router.add_post("/api/v1/convert", v1.convert)
+    app.router.add_post("/api/v1/convert/batch", v1.convert_batch)
+    app.router.add_get("/metrics", metrics.metrics)
+    app.router.add_get("/ready", health.ready)
@@ -0,0 +1,26 @@
+import logging
+from typing import AsyncGenerator
+
+from aiohttp import web
+
+from crypto_exchange.lib.cache import LocalCache
+
+logger = logging.getLogger(__name__)
+
+
+async def setup_local_cache(app: web.Application) -> AsyncGenerator:
+    size = app["config"].local_cache_size
+    ttl = app["config"].local_cache_ttl
+
+    local_cache = LocalCache(maxsize=size, ttl=ttl) if size > 0 else None
+
+    app["local_cache"] = local_cache
+
+    logger.info(f"Local cache configured. size={size} ttl={ttl}")
+
+    try:
+        yield local_cache
+    finally:
+        if local_cache is not None:
+            logger.info(f"Local cache stats: {local_cache.stats()}")
+            local_cache.clear()
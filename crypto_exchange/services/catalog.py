@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import AsyncGenerator
+
+from aiohttp import web
+
+from crypto_exchange.exchange.catalog import SymbolCatalog
+from crypto_exchange.exchange.resolver import PROVIDERS_MAP
+from crypto_exchange.lib.constants import PRIORITY_BACKGROUND
+from crypto_exchange.services.requests import get_http_session
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_symbol_catalogs(app: web.Application) -> None:
+    """Reload the symbol catalog of every provider."""
+    catalogs: dict[str, SymbolCatalog] = app["symbol_catalogs"]
+    for provider_name, provider_cls in PROVIDERS_MAP.items():
+        provider = provider_cls(
+            http_session=get_http_session(app, provider_name),
+            rate_limiter=app["rate_limiters"].get(provider_name),
+            priority=PRIORITY_BACKGROUND,
+            redis=app["redis"],
+        )
+        try:
+            catalog = await provider.get_symbol_catalog()
+        except Exception as e:
+            logger.warning(
+                f"Failed to refresh {provider.name} symbol catalog: {e!r}"
+            )
+            continue
+        catalogs[provider_name] = catalog
+        app["providers"][provider_name].symbol_catalog = catalog
+        logger.info(f"{provider.name} symbol catalog has {len(catalog)} pairs.")
+
+
+async def _refresh_symbol_catalogs_forever(
+    app: web.Application,
+    interval: int,
+) -> None:
+    while True:
+        await refresh_symbol_catalogs(app)
+        await asyncio.sleep(interval)
+
+
+async def setup_symbol_catalogs(app: web.Application) -> AsyncGenerator:
+    interval = app["config"].symbol_catalog_refresh_interval
+
+    catalogs: dict[str, SymbolCatalog] = {}
+    app["symbol_catalogs"] = catalogs
+
+    if not interval:
+        yield catalogs
+        return
+
+    task = asyncio.create_task(_refresh_symbol_catalogs_forever(app, interval))
+
+    logger.info(f"Symbol catalog refresher started. interval={interval}s")
+
+    try:
+        yield catalogs
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        catalogs.clear()
+        logger.info("Symbol catalog refresher stopped.")
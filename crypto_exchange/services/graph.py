@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import AsyncGenerator
+
+from aiohttp import web
+
+from crypto_exchange.exchange.graph import CurrencyGraph
+from crypto_exchange.exchange.resolver import PROVIDERS_MAP
+from crypto_exchange.lib.constants import PRIORITY_BACKGROUND
+from crypto_exchange.services.requests import get_http_session
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_currency_graphs(app: web.Application) -> None:
+    """Rebuild the currency graph of every provider."""
+    graphs: dict[str, CurrencyGraph] = app["currency_graphs"]
+    for provider_name, provider_cls in PROVIDERS_MAP.items():
+        provider = provider_cls(
+            http_session=get_http_session(app, provider_name),
+            rate_limiter=app["rate_limiters"].get(provider_name),
+            priority=PRIORITY_BACKGROUND,
+            redis=app["redis"],
+        )
+        try:
+            graph = await provider.get_currency_graph()
+        except Exception as e:
+            logger.warning(
+                f"Failed to refresh {provider.name} currency graph: {e!r}"
+            )
+            continue
+        graphs[provider_name] = graph
+        logger.info(
+            f"{provider.name} currency graph has {len(graph)} currencies."
+        )
+
+
+async def _refresh_currency_graphs_forever(
+    app: web.Application,
+    interval: int,
+) -> None:
+    while True:
+        await refresh_currency_graphs(app)
+        await asyncio.sleep(interval)
+
+
+async def setup_currency_graphs(app: web.Application) -> AsyncGenerator:
+    interval = app["config"].currency_graph_refresh_interval
+
+    graphs: dict[str, CurrencyGraph] = {}
+    app["currency_graphs"] = graphs
+
+    if not interval:
+        yield graphs
+        return
+
+    task = asyncio.create_task(_refresh_currency_graphs_forever(app, interval))
+
+    logger.info(f"Currency graph refresher started. interval={interval}s")
+
+    try:
+        yield graphs
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        graphs.clear()
+        logger.info("Currency graph refresher stopped.")
@@ -0,0 +1,41 @@
+import logging
+from typing import AsyncGenerator
+
+from aiohttp import web
+
+from crypto_exchange.exchange.providers.binance import Binance
+from crypto_exchange.exchange.providers.kucoin import Kucoin
+from crypto_exchange.exchange.resolver import PROVIDERS_MAP
+from crypto_exchange.services.requests import get_http_session
+
+logger = logging.getLogger(__name__)
+
+
+async def setup_providers(app: web.Application) -> AsyncGenerator:
+    """
+    Create the provider instances shared by every request. Symbol
+    catalogs are assigned to them as they are loaded.
+    """
+    config = app["config"]
+    providers: dict[str, Binance | Kucoin] = {
+        provider_name: provider_cls(
+            http_session=get_http_session(app, provider_name),
+            redis=app["redis"],
+            local_cache=app["local_cache"],
+            market_data=app["market_data"].get(provider_name),
+            circuit_breaker=app["circuit_breakers"].get(provider_name),
+            hedger=app["request_hedgers"].get(provider_name),
+            rate_limiter=app["rate_limiters"].get(provider_name),
+            negative_cache_ttl=config.negative_cache_ttl,
+            cache_codec=config.cache_codec,
+            cache_max_staleness=config.cache_max_staleness,
+            stale_while_revalidate=config.stale_while_revalidate,
+        )
+        for provider_name, provider_cls in PROVIDERS_MAP.items()
+    }
+
+    app["providers"] = providers
+
+    logger.info(f"Providers created: {', '.join(providers)}.")
+
+    yield providers
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import AsyncGenerator
+
+from aiohttp import web
+
+from crypto_exchange.exchange.resolver import PROVIDERS_MAP
+from crypto_exchange.lib.constants import PRIORITY_BACKGROUND
+from crypto_exchange.services.requests import get_http_session
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_rates(app: web.Application) -> None:
+    """Refresh the cached rates of every provider using bulk endpoints."""
+    providers = [
+        provider_cls(
+            http_session=get_http_session(app, provider_name),
+            rate_limiter=app["rate_limiters"].get(provider_name),
+            priority=PRIORITY_BACKGROUND,
+            redis=app["redis"],
+            local_cache=app["local_cache"],
+            cache_codec=app["config"].cache_codec,
+            cache_max_staleness=app["config"].cache_max_staleness,
+        )
+        for provider_name, provider_cls in PROVIDERS_MAP.items()
+    ]
+    results = await asyncio.gather(
+        *[provider.refresh_exchange_rates() for provider in providers],
+        return_exceptions=True,
+    )
+    for provider, result in zip(providers, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                f"Failed to refresh {provider.name} rates: {result!r}"
+            )
+        else:
+            logger.debug(f"Refreshed {result} {provider.name} rates.")
+
+
+async def _refresh_rates_forever(
+    app: web.Application,
+    interval: int,
+) -> None:
+    while True:
+        try:
+            await refresh_rates(app)
+        except Exception as e:
+            logger.exception(e)
+        await asyncio.sleep(interval)
+
+
+async def setup_rates_refresher(app: web.Application) -> AsyncGenerator:
+    interval = app["config"].rates_refresh_interval
+    if not interval:
+        yield None
+        return
+
+    task = asyncio.create_task(_refresh_rates_forever(app, interval))
+
+    app["rates_refresher"] = task
+
+    logger.info(f"Rates refresher started. interval={interval}s")
+
+    try:
+        yield task
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        logger.info("Rates refresher stopped.")
@@ -1,11 +1,105 @@
+import asyncio
 import logging
-from typing import AsyncGenerator
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator
 
-from aiohttp import ClientSession, ClientTimeout, web
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, TraceConfig, web
+
+from crypto_exchange.config import HttpPoolConfig
+from crypto_exchange.exchange.resolver import PROVIDERS_MAP
+from crypto_exchange.lib.metrics import (
+    UPSTREAM_POOL_CONNECTIONS,
+    UPSTREAM_POOL_LIMIT,
+    UPSTREAM_POOL_REQUESTS,
+    UPSTREAM_POOL_WAIT_DURATION,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _create_pool_trace_config(provider_name: str) -> TraceConfig:
+    """Report the pool utilization and wait time of a provider session."""
+    active = UPSTREAM_POOL_REQUESTS.labels(provider_name, "active")
+    queued = UPSTREAM_POOL_REQUESTS.labels(provider_name, "queued")
+    wait_duration = UPSTREAM_POOL_WAIT_DURATION.labels(provider_name)
+
+    async def on_request_start(
+        session: ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        active.inc()
+
+    async def on_request_done(
+        session: ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        active.dec()
+
+    async def on_connection_queued_start(
+        session: ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        ctx.queued_at = time.perf_counter()
+        queued.inc()
+
+    async def on_connection_queued_end(
+        session: ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        queued.dec()
+        wait_duration.observe(time.perf_counter() - ctx.queued_at)
+
+    async def on_connection_create_end(
+        session: ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        UPSTREAM_POOL_CONNECTIONS.labels(provider_name, "created").inc()
+
+    async def on_connection_reuseconn(
+        session: ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        UPSTREAM_POOL_CONNECTIONS.labels(provider_name, "reused").inc()
+
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_done)
+    trace_config.on_request_exception.append(on_request_done)
+    trace_config.on_connection_queued_start.append(on_connection_queued_start)
+    trace_config.on_connection_queued_end.append(on_connection_queued_end)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    return trace_config
+
+
+def create_http_session(
+    provider_name: str,
+    pool: HttpPoolConfig,
+) -> ClientSession:
+    """Create a session with its own connection pool for a provider."""
+    connector = TCPConnector(
+        limit=pool.limit,
+        limit_per_host=pool.limit_per_host,
+        keepalive_timeout=pool.keepalive_timeout,
+        ttl_dns_cache=pool.dns_cache_ttl,
+    )
+    timeout = ClientTimeout(
+        total=pool.total_timeout,
+        connect=pool.pool_timeout,
+        sock_connect=pool.connect_timeout,
+        sock_read=pool.read_timeout,
+    )
+    UPSTREAM_POOL_LIMIT.labels(provider_name).set(pool.limit)
+    return ClientSession(
+        connector=connector,
+        timeout=timeout,
+        trace_configs=[_create_pool_trace_config(provider_name)],
+    )
+
+
+def get_http_session(
+    app: web.Application,
+    provider_name: str,
+) -> ClientSession:
+    """The session of a provider, the shared one if it has none."""
+    return app["http_sessions"].get(provider_name, app["http_session"])
+
+
 async def setup_requests(app: web.Application) -> AsyncGenerator:
     session_timeout = ClientTimeout(
         total=None,
@@ -13,13 +107,24 @@ async def setup_requests(app: web.Application) -> AsyncGenerator:
         sock_read=2,
     )
     http_session = ClientSession(timeout=session_timeout)
+    pools = app["config"].http_pools
+    http_sessions = {
+        provider_name: create_http_session(
+            provider_name, pools.get(provider_name, HttpPoolConfig())
+        )
+        for provider_name in PROVIDERS_MAP
+    }
 
     app["http_session"] = http_session
+    app["http_sessions"] = http_sessions
 
-    logger.info(f"HTTP session configured.")
+    logger.info(f"HTTP sessions configured for {', '.join(http_sessions)}.")
 
     try:
         yield http_session
     finally:
-        await http_session.close()
-        logger.info("HTTP session closed.")
+        await asyncio.gather(
+            http_session.close(),
+            *[session.close() for session in http_sessions.values()],
+        )
+        logger.info("HTTP sessions closed.")
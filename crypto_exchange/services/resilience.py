@@ -0,0 +1,63 @@
+import logging
+from typing import AsyncGenerator
+
+from aiohttp import web
+
+from crypto_exchange.exchange.resolver import PROVIDERS_MAP
+from crypto_exchange.lib.circuit_breaker import CircuitBreaker
+from crypto_exchange.lib.hedging import RequestHedger
+from crypto_exchange.lib.metrics import (
+    CIRCUIT_BREAKER_OPEN,
+    RATE_LIMIT_QUEUE,
+    UPSTREAM_HEDGED_REQUESTS,
+)
+from crypto_exchange.lib.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+async def setup_resilience(app: web.Application) -> AsyncGenerator:
+    """
+    Create the circuit breaker, request hedger and rate limiter of every
+    provider.
+    """
+    config = app["config"]
+    circuit_breakers: dict[str, CircuitBreaker] = {}
+    request_hedgers: dict[str, RequestHedger] = {}
+    rate_limiters: dict[str, RateLimiter] = {}
+    for provider_name, provider_cls in PROVIDERS_MAP.items():
+        if config.circuit_breaker_failures:
+            circuit_breakers[provider_name] = CircuitBreaker(
+                config.circuit_breaker_failures,
+                config.circuit_breaker_reset_timeout,
+                on_change=CIRCUIT_BREAKER_OPEN.labels(provider_name).set,
+            )
+        if config.hedge_delay is not None or config.hedge_quantile is not None:
+            request_hedgers[provider_name] = RequestHedger(
+                delay=config.hedge_delay,
+                quantile=config.hedge_quantile,
+                budget=config.hedge_budget,
+                on_hedge=UPSTREAM_HEDGED_REQUESTS.labels(provider_name).inc,
+            )
+        if config.rate_limit_max_wait is not None:
+            limit, period = provider_cls.RATE_LIMIT
+            # Every worker process gets an equal share of the limit.
+            rate_limiters[provider_name] = RateLimiter(
+                limit,
+                period,
+                config.rate_limit_max_wait,
+                on_queue_change=RATE_LIMIT_QUEUE.labels(provider_name).set,
+                share=1 / config.workers,
+            )
+
+    app["circuit_breakers"] = circuit_breakers
+    app["request_hedgers"] = request_hedgers
+    app["rate_limiters"] = rate_limiters
+
+    logger.info(
+        f"Circuit breakers: {', '.join(circuit_breakers) or 'disabled'}. "
+        f"Request hedging: {', '.join(request_hedgers) or 'disabled'}. "
+        f"Rate limiters: {', '.join(rate_limiters) or 'disabled'}."
+    )
+
+    yield circuit_breakers
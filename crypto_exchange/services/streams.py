@@ -0,0 +1,52 @@
+import asyncio
+import importlib
+import logging
+from typing import AsyncGenerator
+
+from aiohttp import web
+
+from crypto_exchange.exchange.streams.abc import MarketDataStream
+from crypto_exchange.exchange.streams.book import Level1Book
+
+logger = logging.getLogger(__name__)
+
+# Imported on first use, most deployments stream from no provider.
+STREAMS_MAP = {
+    "binance": "crypto_exchange.exchange.streams.binance.BinanceStream",
+    "kucoin": "crypto_exchange.exchange.streams.kucoin.KucoinStream",
+}
+
+
+def get_stream_cls(provider_name: str) -> type[MarketDataStream]:
+    module_name, _, cls_name = STREAMS_MAP[provider_name].rpartition(".")
+    return getattr(importlib.import_module(module_name), cls_name)
+
+
+async def setup_market_data(app: web.Application) -> AsyncGenerator:
+    config = app["config"]
+
+    books: dict[str, Level1Book] = {}
+    tasks = []
+    for provider_name in config.market_data_streams:
+        provider_name = provider_name.lower()
+        book = Level1Book(max_staleness=config.market_data_max_staleness)
+        stream = get_stream_cls(provider_name)(
+            http_session=app["http_session"],
+            book=book,
+        )
+        books[provider_name] = book
+        tasks.append(asyncio.create_task(stream.run()))
+
+    app["market_data"] = books
+
+    logger.info(f"Market data streams started: {list(books)}")
+
+    try:
+        yield books
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for book in books.values():
+            book.clear()
+        logger.info("Market data streams stopped.")
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import AsyncGenerator
+
+from aiohttp import web
+
+from crypto_exchange.exchange.providers.binance import Binance
+from crypto_exchange.exchange.providers.kucoin import Kucoin
+from crypto_exchange.lib.constants import WARMUP_CACHE_MAX_SECONDS
+from crypto_exchange.lib.metrics import WARMUP_DURATION
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up_pair(
+    provider: Binance | Kucoin,
+    currency_from: str,
+    currency_to: str,
+) -> None:
+    """Load the exchange info and rate of a pair into the caches."""
+    exchange_info = await provider.get_exchange_info(
+        currency_from, currency_to, WARMUP_CACHE_MAX_SECONDS
+    )
+    await provider.get_exchange_rate(
+        exchange_info.based_ticker,
+        currency_from,
+        currency_to,
+        WARMUP_CACHE_MAX_SECONDS,
+    )
+
+
+async def warm_up(app: web.Application) -> int:
+    """
+    Preload the configured hot pairs on the app providers concurrently.
+    Returns the number of loaded pairs, failures are logged.
+    """
+    providers: dict[str, Binance | Kucoin] = app["providers"]
+    attempts = {}
+    for pair in app["config"].warmup_pairs:
+        currency_from = pair.currency_from.upper()
+        currency_to = pair.currency_to.upper()
+        for provider_name in (
+            [pair.exchange.lower()] if pair.exchange else list(providers)
+        ):
+            key = (provider_name, currency_from, currency_to)
+            if provider_name not in providers:
+                logger.warning(f"Unknown warm-up provider '{pair.exchange}'.")
+            elif key not in attempts:
+                attempts[key] = warm_up_pair(
+                    providers[provider_name], currency_from, currency_to
+                )
+
+    results = await asyncio.gather(*attempts.values(), return_exceptions=True)
+    loaded = 0
+    for (provider_name, currency_from, currency_to), result in zip(
+        attempts, results
+    ):
+        if isinstance(result, Exception):
+            logger.warning(
+                f"Failed to warm up {currency_from}/{currency_to} "
+                f"on {provider_name}: {result!r}"
+            )
+        else:
+            loaded += 1
+    return loaded
+
+
+async def _warm_up_until_ready(app: web.Application) -> None:
+    timeout = app["config"].warmup_timeout
+    started_at = time.perf_counter()
+    try:
+        async with asyncio.timeout(timeout):
+            loaded = await warm_up(app)
+        logger.info(f"Warm-up loaded {loaded} pairs.")
+    except TimeoutError:
+        logger.warning(f"Warm-up timed out after {timeout}s.")
+    except Exception as e:
+        logger.exception(e)
+    finally:
+        WARMUP_DURATION.set(time.perf_counter() - started_at)
+        app["ready"].set()
+
+
+async def setup_warmup(app: web.Application) -> AsyncGenerator:
+    """
+    Preload the hot pairs in the background, the app reports ready once
+    the warm-up completes or times out.
+    """
+    ready = asyncio.Event()
+    app["ready"] = ready
+
+    task = asyncio.create_task(_warm_up_until_ready(app))
+
+    logger.info(f"Warm-up started. pairs={len(app['config'].warmup_pairs)}")
+
+    try:
+        yield ready
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
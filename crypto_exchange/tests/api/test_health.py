@@ -0,0 +1,26 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from crypto_exchange.api.health import ready
+
+
+@pytest.fixture
+def client(aiohttp_client, loop):
+    app = web.Application()
+    app["ready"] = asyncio.Event()
+    app.router.add_get("/ready", ready)
+    return loop.run_until_complete(aiohttp_client(app))
+
+
+async def test_ready(client):
+    response = await client.get("/ready")
+    assert response.status == 503
+    assert await response.json() == {"status": "warming_up"}
+
+    client.app["ready"].set()
+
+    response = await client.get("/ready")
+    assert response.status == 200
+    assert await response.json() == {"status": "ready"}
@@ -0,0 +1,62 @@
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+from aiohttp import web
+from prometheus_client import REGISTRY
+
+from crypto_exchange.api.metrics import metrics
+from crypto_exchange.api.v1 import convert
+from crypto_exchange.config import Config
+from crypto_exchange.exchange.exceptions import PairNotFound
+
+REQUEST_COUNT = "crypto_exchange_request_duration_seconds_count"
+
+
+@pytest.fixture
+def client(mocker, aiohttp_client, loop):
+    app = web.Application()
+
+    app["config"] = Config()
+    app["http_session"] = mocker.MagicMock(spec=aiohttp.ClientSession)
+    app["http_sessions"] = {}
+    app["redis"] = AsyncMock()
+    app["local_cache"] = None
+    app["market_data"] = {}
+    app["currency_graphs"] = {}
+    app["symbol_catalogs"] = {}
+    app["circuit_breakers"] = {}
+    app["request_hedgers"] = {}
+    app["rate_limiters"] = {}
+    app["providers"] = {}
+
+    app.router.add_post("/convert", convert)
+    app.router.add_get("/metrics", metrics)
+
+    return loop.run_until_complete(aiohttp_client(app))
+
+
+async def test_metrics_exposes_request_outcome(client, mocker):
+    mock_resolver = mocker.patch("crypto_exchange.api.v1.ExchangeResolver")
+    mock_resolver.return_value.resolve = AsyncMock(
+        side_effect=PairNotFound("Pair not found.")
+    )
+    mock_resolver.return_value.exchange = "Binance"
+    labels = {"provider": "binance", "outcome": "pair_not_found"}
+    before = REGISTRY.get_sample_value(REQUEST_COUNT, labels) or 0
+
+    await client.post(
+        "/convert",
+        json={
+            "currency_from": "BTC",
+            "currency_to": "XYZ",
+            "amount": 1,
+            "exchange": "binance",
+        },
+    )
+    response = await client.get("/metrics")
+
+    assert response.status == 200
+    assert response.content_type == "text/plain"
+    assert REQUEST_COUNT in await response.text()
+    assert REGISTRY.get_sample_value(REQUEST_COUNT, labels) == before + 1
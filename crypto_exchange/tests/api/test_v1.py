@@ -1,10 +1,13 @@
+import json
 from unittest.mock import AsyncMock
 
 import aiohttp
 import pytest
 from aiohttp import web
 
-from crypto_exchange.api.v1 import convert
+from crypto_exchange.api.schemas import ConvertRequest
+from crypto_exchange.api.v1 import convert, convert_batch
+from crypto_exchange.config import Config
 from crypto_exchange.exchange.exceptions import (
     InvalidAssetAmount,
     InvalidProvider,
@@ -12,16 +15,28 @@ from crypto_exchange.exchange.exceptions import (
     ProviderBadResponse,
 )
 from crypto_exchange.exchange.schemas import ExchangeResult
+from crypto_exchange.lib.cache import LocalCache
 
 
 @pytest.fixture
 def client(mocker, aiohttp_client, loop):
     app = web.Application()
 
+    app["config"] = Config()
     app["http_session"] = mocker.MagicMock(spec=aiohttp.ClientSession)
+    app["http_sessions"] = {}
     app["redis"] = AsyncMock()
+    app["local_cache"] = None
+    app["market_data"] = {}
+    app["currency_graphs"] = {}
+    app["symbol_catalogs"] = {}
+    app["circuit_breakers"] = {}
+    app["request_hedgers"] = {}
+    app["rate_limiters"] = {}
+    app["providers"] = {}
 
     app.router.add_post("/convert", convert)
+    app.router.add_post("/convert/batch", convert_batch)
 
     return loop.run_until_complete(aiohttp_client(app))
 
@@ -55,6 +70,29 @@ async def test_convert_success(client, mocker):
     assert data["result"] == "50000"
 
 
+async def test_convert_stale_while_revalidate(client, mocker):
+    client.app["config"].stale_while_revalidate = 10
+    mock_resolver = mocker.patch("crypto_exchange.api.v1.ExchangeResolver")
+    mock_resolver.return_value.resolve = AsyncMock(
+        return_value=ExchangeResult(
+            rate="50000", result="50000", updated_at=1633024800, stale=True
+        )
+    )
+    mock_resolver.return_value.exchange = "binance"
+    payload = {"currency_from": "BTC", "currency_to": "USDT", "amount": 1}
+
+    response = await client.post("/convert", json=payload)
+    assert (await response.json())["stale"] is True
+    response = await client.post(
+        "/convert", json={**payload, "stale_while_revalidate": 30}
+    )
+    assert response.status == 200
+
+    calls = mock_resolver.call_args_list
+    assert calls[0].kwargs["stale_while_revalidate"] == 10
+    assert calls[1].kwargs["stale_while_revalidate"] == 30
+
+
 async def test_convert_invalid_request_format(client):
     response = await client.post("/convert", data="invalid_json")
     assert response.status == 400
@@ -160,3 +198,135 @@ async def test_convert_internal_error(client, mocker):
     assert response.status == 500
     data = await response.json()
     assert data["error"] == "Internal error, try later..."
+
+
+async def test_convert_batch(client, mocker):
+    mock_resolver = mocker.patch("crypto_exchange.api.v1.ExchangeResolver")
+    mock_resolver.return_value.warm_local_cache = AsyncMock(return_value=4)
+    mock_resolver.return_value.resolve = AsyncMock(
+        side_effect=[
+            ExchangeResult(rate="50000", result="50000", updated_at=1),
+            PairNotFound("Pair not found"),
+            ProviderBadResponse(),
+        ]
+    )
+    mock_resolver.return_value.exchange = "binance"
+
+    item = {
+        "currency_from": "btc",
+        "currency_to": "usdt",
+        "amount": 1,
+        "exchange": "binance",
+        "cache_max_seconds": 300,
+    }
+    payload = {
+        "items": [
+            item,
+            {**item, "currency_to": "XYZ"},
+            {"currency_from": "BTC"},
+            {**item, "cache_max_seconds": None},
+        ]
+    }
+
+    response = await client.post("/convert/batch", json=payload)
+
+    assert response.status == 200
+    results = (await response.json())["results"]
+    assert len(results) == 4
+    assert results[0]["currency_from"] == "BTC"
+    assert results[0]["rate"] == "50000"
+    assert results[1] == {"error": "Pair not found", "status": 400}
+    assert results[2]["status"] == 400
+    assert results[3] == {
+        "error": "Error with exchange, please try again later.",
+        "status": 500,
+    }
+
+    pairs = list(mock_resolver.return_value.warm_local_cache.await_args.args[0])
+    assert pairs == [("binance", "BTC", "USDT"), ("binance", "BTC", "XYZ")]
+
+
+async def test_convert_batch_keeps_shared_local_cache(client, mocker):
+    shared_cache = LocalCache(maxsize=10, ttl=60)
+    client.server.app["local_cache"] = shared_cache
+    mock_resolver = mocker.patch("crypto_exchange.api.v1.ExchangeResolver")
+    mock_resolver.return_value.warm_local_cache = AsyncMock(return_value=0)
+    mock_resolver.return_value.resolve = AsyncMock(
+        return_value=ExchangeResult(rate="1", result="1", updated_at=1)
+    )
+    mock_resolver.return_value.exchange = "binance"
+    item = {"currency_from": "BTC", "currency_to": "USDT", "amount": 1}
+
+    response = await client.post("/convert/batch", json={"items": [item] * 3})
+
+    assert response.status == 200
+    local_caches = {
+        id(call.kwargs["local_cache"]) for call in mock_resolver.call_args_list
+    }
+    assert len(local_caches) == 1
+    assert id(shared_cache) not in local_caches
+
+
+async def test_convert_batch_too_many_items(client):
+    client.server.app["config"] = Config(batch_max_items=1)
+    payload = {"items": [{}, {}]}
+
+    response = await client.post("/convert/batch", json=payload)
+
+    assert response.status == 400
+    data = await response.json()
+    assert data["error"] == "Batch size exceeds the limit of 1 items."
+
+
+async def test_convert_batch_invalid_request_format(client):
+    response = await client.post("/convert/batch", json=[{}])
+    assert response.status == 400
+    data = await response.json()
+    assert "error" in data
+
+
+async def test_convert_server_timing(client, mocker):
+    client.app["config"].request_tracing = True
+    mock_resolver = mocker.patch("crypto_exchange.api.v1.ExchangeResolver")
+    mock_resolver.return_value.resolve = AsyncMock(
+        return_value=ExchangeResult(
+            rate="50000", result="50000", updated_at=1633024800
+        )
+    )
+    mock_resolver.return_value.exchange = "binance"
+
+    response = await client.post(
+        "/convert",
+        json={"currency_from": "BTC", "currency_to": "USDT", "amount": 1},
+    )
+
+    assert response.status == 200
+    names = [
+        metric.split(";")[0]
+        for metric in response.headers["Server-Timing"].split(", ")
+    ]
+    assert names == ["parse", "resolve", "serialize", "total"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"",
+        b"not json",
+        b"[1, 2]",
+        b'{"currency_from": "BTC"}',
+        b'{"currency_from": "BTC", "currency_to": "USDT", "amount": "x"}',
+        b'{"currency_from": "BTC", "currency_to": "USDT", "amount": NaN}',
+        b'{"currency_from": "BTC", "currency_to": "USDT", "amount": 1e999}',
+    ],
+)
+async def test_convert_invalid_request_body(client, body):
+    try:
+        ConvertRequest(**json.loads(body.decode()))
+    except Exception as e:
+        expected = json.dumps({"error": str(e)})
+
+    response = await client.post("/convert", data=body)
+
+    assert response.status == 400
+    assert await response.text() == expected
@@ -0,0 +1,41 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import redis.asyncio as aioredis
+from aiohttp import ClientSession
+
+from crypto_exchange.config import get_config
+
+
+@pytest.fixture
+async def redis_client():
+    config = get_config()
+    redis = await aioredis.from_url(
+        f"redis://{config.redis_host}:{config.redis_port}"
+    )
+    await redis.flushdb()
+    yield redis
+    await redis.close()
+
+
+@pytest.fixture
+async def http_session():
+    async with ClientSession() as session:
+        yield session
+
+
+@pytest.fixture
+def mock_redis():
+    redis = AsyncMock()
+    redis.get.return_value = None
+    redis.mget.side_effect = lambda keys: [None] * len(keys)
+    redis.register_script = MagicMock(
+        return_value=AsyncMock(
+            side_effect=lambda keys, args: [None] * (len(args) - len(keys) - 1)
+        )
+    )
+    pipeline = MagicMock()
+    pipeline.__aenter__.return_value = pipeline
+    pipeline.execute = AsyncMock()
+    redis.pipeline = MagicMock(return_value=pipeline)
+    return redis
@@ -1,31 +1,31 @@
-import json
+import asyncio
 from datetime import datetime
 from decimal import Decimal
+from unittest.mock import AsyncMock
 
+import aiohttp
 import pytest
-import redis.asyncio as aioredis
-from aiohttp import ClientSession
+from aiohttp import web
+from prometheus_client import REGISTRY
 
-from crypto_exchange.config import get_config
+from crypto_exchange.exchange.catalog import SymbolCatalog
+from crypto_exchange.exchange.exceptions import (
+    InvalidAssetAmount,
+    PairNotFound,
+    ProviderBadResponse,
+)
 from crypto_exchange.exchange.providers.abc import Provider
-from crypto_exchange.exchange.schemas import ExchangeInfo, ExchangeRate
-
-
-@pytest.fixture
-async def redis_client():
-    config = get_config()
-    redis = await aioredis.from_url(
-        f"redis://{config.redis_host}:{config.redis_port}"
-    )
-    await redis.flushdb()
-    yield redis
-    await redis.close()
-
-
-@pytest.fixture
-async def http_session():
-    async with ClientSession() as session:
-        yield session
+from crypto_exchange.exchange.schemas import (
+    ExchangeInfo,
+    ExchangeRate,
+    TradingPair,
+)
+from crypto_exchange.lib.cache import LocalCache
+from crypto_exchange.lib.circuit_breaker import CircuitBreaker
+from crypto_exchange.lib.codec import get_codec
+from crypto_exchange.lib.constants import CACHE_CODEC_BINARY
+from crypto_exchange.lib.hedging import RequestHedger
+from crypto_exchange.lib.rate_limiter import RateLimiter, RateLimitExceeded
 
 
 class MockProvider(Provider):
@@ -47,9 +47,20 @@ class MockProvider(Provider):
             timestamp=int(datetime.utcnow().timestamp()),
         )
 
+    async def _fetch_all_exchange_info(
+        self,
+    ) -> dict[tuple[str, str], ExchangeInfo]:
+        return {("BTC", "USDT"): await self._fetch_exchange_info("BTC", "USDT")}
+
     async def _fetch_ticker_price(self, based_ticker: str) -> Decimal:
         return Decimal("50000.0")
 
+    async def _fetch_all_ticker_prices(self) -> dict[str, Decimal]:
+        return {"BTCUSDT": Decimal("50000.0"), "ETHUSDT": Decimal("2500.0")}
+
+    async def _fetch_trading_pairs(self) -> list[TradingPair]:
+        return [TradingPair(base="BTC", quote="USDT")]
+
     @staticmethod
     def get_ticker(currency_from: str, currency_to: str) -> str:
         return f"{currency_from}{currency_to}"
@@ -66,10 +77,12 @@ async def test_get_exchange_info_and_redis_storage(redis_client, http_session):
     assert exchange_info.from_asset_min_amount == Decimal("0.01")
 
     cache_key = provider._get_exchange_info_cache_key("BTCUSDT")
-    cached_value = await redis_client.get(cache_key)
+    cached_value = await redis_client.hget(*cache_key)
 
     assert cached_value is not None
-    cached_exchange_info = ExchangeInfo(**json.loads(cached_value))
+    cached_exchange_info = provider.cache_codec.decode(
+        cached_value, ExchangeInfo
+    )
 
     assert cached_exchange_info.based_ticker == "BTCUSDT"
     assert cached_exchange_info.from_asset_min_amount == Decimal("0.01")
@@ -85,9 +98,456 @@ async def test_get_exchange_rate_and_redis_storage(redis_client, http_session):
     assert exchange_rate.rate == Decimal("50000.0")
 
     cache_key = provider._get_exchange_rate_cache_key("BTCUSDT")
-    cached_value = await redis_client.get(cache_key)
+    cached_value = await redis_client.hget(*cache_key)
 
     assert cached_value is not None
-    cached_exchange_rate = ExchangeRate(**json.loads(cached_value))
+    cached_exchange_rate = provider.cache_codec.decode(
+        cached_value, ExchangeRate
+    )
 
     assert cached_exchange_rate.rate == Decimal("50000.0")
+
+
+async def test_local_cache_serves_without_redis(http_session, mock_redis):
+    redis = mock_redis
+    provider = MockProvider(
+        http_session, redis, local_cache=LocalCache(maxsize=10, ttl=60)
+    )
+
+    first = await provider.exchange(Decimal("1"), "BTC", "USDT", 60)
+    redis.reset_mock()
+    second = await provider.exchange(Decimal("1"), "BTC", "USDT", 60)
+
+    assert first == second
+    redis.register_script.assert_not_called()
+    assert provider.local_cache.stats()["hits"] == 2
+
+
+async def test_local_cache_respects_cache_max_seconds(http_session, mock_redis):
+    redis = mock_redis
+    provider = MockProvider(
+        http_session, redis, local_cache=LocalCache(maxsize=10, ttl=60)
+    )
+    provider.local_cache.set(
+        provider._get_exchange_rate_cache_key("BTCUSDT"),
+        ExchangeRate(rate=Decimal("1"), timestamp=0),
+    )
+
+    exchange_rate = await provider.get_exchange_rate(
+        "BTCUSDT", "BTC", "USDT", cache_max_seconds=60
+    )
+
+    assert exchange_rate.rate == Decimal("50000.0")
+    redis.register_script.return_value.assert_awaited_once()
+
+
+async def test_cached_exchange_rate_is_inverted(redis_client, http_session):
+    provider = MockProvider(http_session, redis_client)
+
+    await provider.get_exchange_rate(
+        "BTCUSDT", "BTC", "USDT", cache_max_seconds=60
+    )
+    exchange_rate = await provider.get_exchange_rate(
+        "BTCUSDT", "USDT", "BTC", cache_max_seconds=60
+    )
+
+    assert exchange_rate.rate == 1 / Decimal("50000.0")
+
+
+class SlowMockProvider(MockProvider):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fetch_calls = {"exchange_info": 0, "ticker_price": 0}
+
+    async def _fetch_exchange_info(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> ExchangeInfo:
+        self.fetch_calls["exchange_info"] += 1
+        await asyncio.sleep(0.01)
+        return await super()._fetch_exchange_info(currency_from, currency_to)
+
+    async def _fetch_ticker_price(self, based_ticker: str) -> Decimal:
+        self.fetch_calls["ticker_price"] += 1
+        await asyncio.sleep(0.01)
+        return await super()._fetch_ticker_price(based_ticker)
+
+
+async def test_concurrent_exchange_single_upstream_request(
+    http_session, mock_redis
+):
+    provider = SlowMockProvider(http_session, mock_redis)
+
+    results = await asyncio.gather(
+        *[
+            provider.exchange(Decimal("1"), "BTC", "USDT", None)
+            for _ in range(50)
+        ]
+    )
+
+    assert provider.fetch_calls == {"exchange_info": 1, "ticker_price": 1}
+    assert len({result.rate for result in results}) == 1
+    assert len(Provider._single_flight) == 0
+
+
+async def test_concurrent_exchange_shares_exception(http_session, mock_redis):
+    provider = SlowMockProvider(http_session, mock_redis)
+    provider._fetch_ticker_price = AsyncMock(side_effect=ProviderBadResponse())
+
+    results = await asyncio.gather(
+        *[
+            provider.exchange(Decimal("1"), "BTC", "USDT", None)
+            for _ in range(10)
+        ],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ProviderBadResponse) for result in results)
+    provider._fetch_ticker_price.assert_awaited_once()
+
+
+class UnlistedMockProvider(MockProvider):
+    fetch_calls = 0
+
+    async def _fetch_exchange_info(
+        self,
+        currency_from: str,
+        currency_to: str,
+    ) -> ExchangeInfo:
+        self.fetch_calls += 1
+        raise PairNotFound("Pair not found.")
+
+
+async def test_pair_not_found_is_cached(redis_client, http_session):
+    provider = UnlistedMockProvider(
+        http_session, redis_client, local_cache=LocalCache(16, 60)
+    )
+    hits = Provider.negative_cache_hits[provider.name]
+
+    for currency_from, currency_to in [("DOGE", "XMR"), ("XMR", "DOGE")]:
+        with pytest.raises(PairNotFound):
+            await provider.get_exchange_info(currency_from, currency_to, None)
+
+    assert provider.fetch_calls == 1
+    assert Provider.negative_cache_hits[provider.name] == hits + 1
+    cache_key = provider._get_pair_not_found_cache_key("DOGE", "XMR")
+    assert 0 < await redis_client.ttl(cache_key) <= provider.negative_cache_ttl
+
+
+async def test_pair_not_found_shared_through_redis(redis_client, http_session):
+    provider = UnlistedMockProvider(http_session, redis_client)
+    await provider._set_pair_not_found_cache("DOGE", "XMR")
+
+    with pytest.raises(PairNotFound):
+        await provider.get_exchange_info("DOGE", "XMR", None)
+
+    assert provider.fetch_calls == 0
+
+
+async def test_cached_route(redis_client, http_session):
+    provider = MockProvider(http_session, redis_client)
+
+    assert await provider.get_cached_route("DOGE", "XMR") is None
+
+    await provider.set_cached_route("DOGE", "XMR", ["DOGE", "USDT", "XMR"])
+
+    assert await provider.get_cached_route("DOGE", "XMR") == [
+        "DOGE",
+        "USDT",
+        "XMR",
+    ]
+
+
+async def test_cached_route_disabled(http_session, mock_redis):
+    provider = MockProvider(http_session, mock_redis, negative_cache_ttl=0)
+
+    assert await provider.get_cached_route("DOGE", "XMR") is None
+    mock_redis.get.assert_not_awaited()
+
+
+async def test_exchange_single_redis_round_trip(
+    redis_client, http_session, mocker
+):
+    provider = MockProvider(http_session, redis_client)
+    await provider.exchange(Decimal("1"), "BTC", "USDT", 60)
+
+    execute_command = mocker.spy(redis_client, "execute_command")
+    result = await provider.exchange(Decimal("1"), "USDT", "BTC", 60)
+
+    assert result.rate == "0.00002000"
+    assert execute_command.call_count == 1
+
+
+async def test_exchange_writes_quote_through_pipelines(
+    http_session, mock_redis
+):
+    provider = MockProvider(http_session, mock_redis)
+
+    await provider.exchange(Decimal("1"), "BTC", "USDT", 60)
+
+    pipeline = mock_redis.pipeline.return_value
+    assert pipeline.hset.call_count == 2
+    assert pipeline.execute.await_count == 2
+    mock_redis.hset.assert_not_awaited()
+
+
+async def test_exchange_checks_amount_before_loading_rate(
+    http_session, mock_redis, mocker
+):
+    provider = MockProvider(http_session, mock_redis)
+    fetch_ticker_price = mocker.spy(provider, "_fetch_ticker_price")
+
+    with pytest.raises(InvalidAssetAmount):
+        await provider.exchange(Decimal("1000"), "BTC", "USDT", 60)
+
+    fetch_ticker_price.assert_not_called()
+
+
+async def test_stale_quotes_are_not_cached_in_redis(redis_client, http_session):
+    provider = MockProvider(http_session, redis_client, cache_max_staleness=60)
+    timestamp = int(datetime.utcnow().timestamp())
+
+    await provider._set_exchange_rate_cache(
+        "BTCUSDT", ExchangeRate(rate=Decimal("1"), timestamp=timestamp - 30)
+    )
+    await provider._set_exchange_rate_cache(
+        "ETHUSDT", ExchangeRate(rate=Decimal("1"), timestamp=timestamp - 90)
+    )
+
+    assert await provider._get_cached_exchange_rate("BTCUSDT", 60)
+    assert not await provider._get_cached_exchange_rate("BTCUSDT", 10)
+    assert not await redis_client.hget(
+        *provider._get_exchange_rate_cache_key("ETHUSDT")
+    )
+
+
+async def test_legacy_cache_keys_are_read_and_moved(
+    redis_client, http_session, mocker
+):
+    provider = MockProvider(http_session, redis_client)
+    timestamp = int(datetime.utcnow().timestamp())
+    exchange_info = await provider._fetch_exchange_info("BTC", "USDT")
+    exchange_rate = ExchangeRate(rate=Decimal("40000"), timestamp=timestamp)
+    codec = get_codec(CACHE_CODEC_BINARY)
+    await redis_client.set(
+        "MockProvider-exchange-info-BTCUSDT", codec.encode(exchange_info)
+    )
+    await redis_client.set(
+        "MockProvider-exchange-rate-BTCUSDT", codec.encode(exchange_rate)
+    )
+    fetch_ticker_price = mocker.spy(provider, "_fetch_ticker_price")
+
+    result = await provider.exchange(Decimal("1"), "BTC", "USDT", 60)
+
+    assert result.rate == "40000.00000000"
+    fetch_ticker_price.assert_not_called()
+    assert await redis_client.hget(
+        *provider._get_exchange_rate_cache_key("BTCUSDT")
+    )
+
+
+async def test_cache_max_seconds_is_capped(http_session, mock_redis):
+    provider = MockProvider(
+        http_session,
+        mock_redis,
+        local_cache=LocalCache(maxsize=10, ttl=600),
+        cache_max_staleness=60,
+    )
+    timestamp = int(datetime.utcnow().timestamp())
+    provider.local_cache.set(
+        provider._get_exchange_rate_cache_key("BTCUSDT"),
+        ExchangeRate(rate=Decimal("1"), timestamp=timestamp - 90),
+    )
+
+    exchange_rate = await provider.get_exchange_rate(
+        "BTCUSDT", "BTC", "USDT", cache_max_seconds=600
+    )
+
+    assert exchange_rate.rate == Decimal("50000.0")
+
+
+async def test_exchange_with_symbol_catalog(http_session, mock_redis, mocker):
+    provider = MockProvider(http_session, mock_redis)
+    provider.symbol_catalog = await provider.get_symbol_catalog()
+    fetch_exchange_info = mocker.spy(provider, "_fetch_exchange_info")
+
+    result = await provider.exchange(Decimal("1"), "USDT", "BTC", None)
+
+    assert result.rate == "0.00002000"
+    fetch_exchange_info.assert_not_awaited()
+    with pytest.raises(InvalidAssetAmount):
+        await provider.exchange(Decimal("1000"), "BTC", "USDT", None)
+    with pytest.raises(PairNotFound):
+        await provider.get_exchange_info("BTC", "XMR", None)
+    fetch_exchange_info.assert_not_awaited()
+
+
+async def test_incomplete_symbol_catalog_misses_are_fetched(
+    http_session, mock_redis, mocker
+):
+    provider = MockProvider(http_session, mock_redis)
+    provider.symbol_catalog = await provider.get_symbol_catalog()
+    mocker.patch.object(provider, "SYMBOL_CATALOG_COMPLETE", False)
+
+    exchange_info = await provider.get_exchange_info("ETH", "USDT", None)
+
+    assert exchange_info.based_ticker == "ETHUSDT"
+
+
+async def test_empty_symbol_catalog_is_not_used(http_session, mock_redis):
+    provider = MockProvider(
+        http_session, mock_redis, symbol_catalog=SymbolCatalog({})
+    )
+
+    exchange_info = await provider.get_exchange_info("ETH", "USDT", None)
+
+    assert exchange_info.based_ticker == "ETHUSDT"
+
+
+async def test_cache_requests_are_counted(http_session, mock_redis):
+    provider = MockProvider(
+        http_session, mock_redis, local_cache=LocalCache(maxsize=10, ttl=60)
+    )
+    timestamp = int(datetime.utcnow().timestamp())
+    provider.local_cache.set(
+        provider._get_exchange_rate_cache_key("BTCUSDT"),
+        ExchangeRate(rate=Decimal("1"), timestamp=timestamp - 90),
+    )
+
+    def count(layer: str, result: str) -> float:
+        return (
+            REGISTRY.get_sample_value(
+                "crypto_exchange_cache_requests_total",
+                {
+                    "provider": "mockprovider",
+                    "cache": "exchange-rate",
+                    "layer": layer,
+                    "result": result,
+                },
+            )
+            or 0
+        )
+
+    before = [count("local", "stale"), count("redis", "miss")]
+    await provider.get_exchange_rate("BTCUSDT", "BTC", "USDT", 60)
+
+    assert [count("local", "stale"), count("redis", "miss")] == [
+        before[0] + 1,
+        before[1] + 1,
+    ]
+
+
+async def test_circuit_breaker_fails_fast(aiohttp_server, mock_redis):
+    calls = 0
+
+    async def unavailable(request: web.Request) -> web.Response:
+        nonlocal calls
+        calls += 1
+        return web.json_response({}, status=503)
+
+    app = web.Application()
+    app.router.add_get("/", unavailable)
+    server = await aiohttp_server(app)
+    url = str(server.make_url("/"))
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    async with aiohttp.ClientSession() as session:
+        provider = MockProvider(session, mock_redis, circuit_breaker=breaker)
+        await provider._fetch_data(url)
+        await provider._fetch_data(url)
+        with pytest.raises(ProviderBadResponse):
+            await provider._fetch_data(url)
+
+    assert breaker.is_open
+    assert calls == 2
+
+
+@pytest.mark.parametrize("status", [429, 418])
+async def test_rate_limited_status_pauses_without_retry_after(
+    http_session, mock_redis, status
+):
+    limiter = RateLimiter(limit=10, period=1, max_wait=0.05)
+    provider = MockProvider(http_session, mock_redis, rate_limiter=limiter)
+
+    provider._update_rate_limit(status, {})
+
+    with pytest.raises(RateLimitExceeded):
+        await limiter.acquire(1)
+
+
+async def test_slow_request_is_hedged(aiohttp_server, mock_redis):
+    calls = 0
+
+    async def slow_once(request: web.Request) -> web.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1)
+        return web.json_response({"calls": calls})
+
+    app = web.Application()
+    app.router.add_get("/", slow_once)
+    server = await aiohttp_server(app)
+    hedger = RequestHedger(delay=0.02, budget=1)
+
+    async with aiohttp.ClientSession() as session:
+        provider = MockProvider(session, mock_redis, hedger=hedger)
+        data = await asyncio.wait_for(
+            provider._fetch_data(str(server.make_url("/"))), timeout=0.5
+        )
+
+    assert data == {"calls": 2}
+
+
+async def test_stale_while_revalidate(http_session, mock_redis, mocker):
+    provider = MockProvider(
+        http_session,
+        mock_redis,
+        local_cache=LocalCache(maxsize=10, ttl=600),
+        stale_while_revalidate=60,
+    )
+    timestamp = int(datetime.utcnow().timestamp())
+    for ticker, value in [
+        ("BTCUSDT", Decimal("0.01")),
+        ("ETHUSDT", Decimal("0.01")),
+    ]:
+        provider.local_cache.set(
+            provider._get_exchange_info_cache_key(ticker),
+            ExchangeInfo(
+                based_ticker=ticker,
+                from_asset_min_amount=value,
+                from_asset_max_amount=Decimal("100"),
+                to_asset_min_amount=value,
+                to_asset_max_amount=Decimal("100"),
+                timestamp=timestamp,
+            ),
+        )
+    provider.local_cache.set(
+        provider._get_exchange_rate_cache_key("BTCUSDT"),
+        ExchangeRate(rate=Decimal("1"), timestamp=timestamp - 90),
+    )
+    provider.local_cache.set(
+        provider._get_exchange_rate_cache_key("ETHUSDT"),
+        ExchangeRate(rate=Decimal("1"), timestamp=timestamp - 150),
+    )
+    fetch_ticker_price = mocker.spy(provider, "_fetch_ticker_price")
+
+    results = await asyncio.gather(
+        *[provider.exchange(Decimal("1"), "BTC", "USDT", 60) for _ in range(3)]
+    )
+
+    assert [result.rate for result in results] == ["1.00000000"] * 3
+    assert all(result.stale for result in results)
+    await asyncio.sleep(0.01)
+    fetch_ticker_price.assert_awaited_once_with("BTCUSDT")
+    assert not Provider._revalidations
+
+    result = await provider.exchange(Decimal("1"), "BTC", "USDT", 60)
+    assert result.rate == "50000.00000000"
+    assert not result.stale
+
+    # Values past the grace window are fetched before responding.
+    result = await provider.exchange(Decimal("1"), "ETH", "USDT", 60)
+    assert result.rate == "50000.00000000"
+    assert not result.stale
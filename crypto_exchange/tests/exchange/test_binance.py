@@ -2,12 +2,14 @@ from decimal import Decimal
 from unittest.mock import AsyncMock
 
 import pytest
+from aiohttp import ClientSession, web
 
 from crypto_exchange.exchange.exceptions import (
     PairNotFound,
     ProviderBadResponse,
 )
 from crypto_exchange.exchange.providers.binance import Binance
+from crypto_exchange.lib.rate_limiter import RateLimiter
 
 BASE_TICKER = "BTCUSDT"
 MOCK_EXCHANGE_INFO = {
@@ -67,3 +69,146 @@ async def test_handle_api_error(binance_provider):
 async def test_get_ticker():
     ticker = Binance.get_ticker("BTC", "USDT")
     assert ticker == "BTCUSDT"
+
+
+async def test_fetch_trading_pairs(binance_provider):
+    binance_provider._fetch_data = AsyncMock(
+        side_effect=[
+            {
+                "symbols": [
+                    {
+                        "symbol": "BTCUSDT",
+                        "status": "TRADING",
+                        "baseAsset": "BTC",
+                        "quoteAsset": "USDT",
+                    },
+                    {
+                        "symbol": "OLDUSDT",
+                        "status": "BREAK",
+                        "baseAsset": "OLD",
+                        "quoteAsset": "USDT",
+                    },
+                ]
+            },
+            [{"symbol": "BTCUSDT", "quoteVolume": "1000000.5"}],
+        ]
+    )
+
+    trading_pairs = await binance_provider._fetch_trading_pairs()
+
+    assert len(trading_pairs) == 1
+    assert trading_pairs[0].base == "BTC"
+    assert trading_pairs[0].quote == "USDT"
+    assert trading_pairs[0].liquidity == Decimal("1000000.5")
+
+
+async def test_fetch_all_exchange_info(binance_provider):
+    binance_provider._fetch_data = AsyncMock(
+        return_value={
+            "symbols": [
+                {
+                    "symbol": "BTCUSDT",
+                    "status": "TRADING",
+                    "baseAsset": "BTC",
+                    "quoteAsset": "USDT",
+                    "filters": [
+                        {
+                            "filterType": "LOT_SIZE",
+                            "minQty": "0.00001000",
+                            "maxQty": "9000.00000000",
+                        },
+                        {
+                            "filterType": "NOTIONAL",
+                            "minNotional": "5.00000000",
+                            "maxNotional": "9000000.00000000",
+                        },
+                    ],
+                },
+                {
+                    "symbol": "ETHBTC",
+                    "status": "TRADING",
+                    "baseAsset": "ETH",
+                    "quoteAsset": "BTC",
+                    "filters": [
+                        {
+                            "filterType": "LOT_SIZE",
+                            "minQty": "0.00010000",
+                            "maxQty": "100000.00000000",
+                        },
+                        {
+                            "filterType": "MIN_NOTIONAL",
+                            "minNotional": "0.00010000",
+                        },
+                    ],
+                },
+                {
+                    "symbol": "OLDUSDT",
+                    "status": "BREAK",
+                    "baseAsset": "OLD",
+                    "quoteAsset": "USDT",
+                    "filters": [],
+                },
+            ]
+        }
+    )
+
+    exchange_infos = await binance_provider._fetch_all_exchange_info()
+
+    assert list(exchange_infos) == [("BTC", "USDT"), ("ETH", "BTC")]
+    exchange_info = exchange_infos[("BTC", "USDT")]
+    assert exchange_info.based_ticker == "BTCUSDT"
+    assert exchange_info.from_asset_min_amount == Decimal("0.00001")
+    assert exchange_info.from_asset_max_amount == Decimal("9000")
+    assert exchange_info.to_asset_min_amount == Decimal("5")
+    assert exchange_info.to_asset_max_amount == Decimal("9000000")
+    exchange_info = exchange_infos[("ETH", "BTC")]
+    assert exchange_info.to_asset_min_amount == Decimal("0.0001")
+    assert exchange_info.to_asset_max_amount == Decimal("9000000")
+
+
+async def test_rate_limit_headers(aiohttp_server):
+    async def ticker_price(request: web.Request) -> web.Response:
+        if request.query.get("symbol") == "BANNED":
+            return web.json_response(
+                {"code": -1003}, status=429, headers={"Retry-After": "30"}
+            )
+        return web.json_response(
+            {"price": "1"}, headers={"X-MBX-USED-WEIGHT-1M": "5990"}
+        )
+
+    app = web.Application()
+    app.router.add_get("/api/v3/ticker/price", ticker_price)
+    server = await aiohttp_server(app)
+    url = str(server.make_url("/api/v3/ticker/price"))
+    limiter = RateLimiter(*Binance.RATE_LIMIT, max_wait=0.1)
+
+    async with ClientSession() as session:
+        provider = Binance(session, AsyncMock(), rate_limiter=limiter)
+        await provider._fetch_data(url, weight=2)
+        assert limiter.tokens < 11
+
+        with pytest.raises(ProviderBadResponse):
+            await provider._fetch_data(f"{url}?symbol=BANNED")
+        with pytest.raises(ProviderBadResponse, match="rate limit"):
+            await provider._fetch_data(url)
+
+
+async def test_used_weight_is_shared_by_workers(aiohttp_server):
+    async def ticker_price(request: web.Request) -> web.Response:
+        return web.json_response(
+            {"price": "1"}, headers={"X-MBX-USED-WEIGHT-1M": "1600"}
+        )
+
+    app = web.Application()
+    app.router.add_get("/api/v3/ticker/price", ticker_price)
+    server = await aiohttp_server(app)
+    url = str(server.make_url("/api/v3/ticker/price"))
+    workers = 4
+    limiter = RateLimiter(*Binance.RATE_LIMIT, max_wait=0.1, share=1 / workers)
+
+    async with ClientSession() as session:
+        provider = Binance(session, AsyncMock(), rate_limiter=limiter)
+        await provider._fetch_data(url, weight=2)
+        await provider._fetch_data(url, weight=2)
+
+    assert 1090 < limiter.tokens <= 1100
@@ -0,0 +1,26 @@
+from decimal import Decimal
+
+from crypto_exchange.exchange.catalog import SymbolCatalog
+from crypto_exchange.exchange.schemas import ExchangeInfo
+
+EXCHANGE_INFO = ExchangeInfo(
+    based_ticker="BTCUSDT",
+    from_asset_min_amount=Decimal("0.001"),
+    from_asset_max_amount=Decimal("100"),
+    to_asset_min_amount=Decimal("10"),
+    to_asset_max_amount=Decimal("10000"),
+    timestamp=1,
+)
+
+
+def test_get_exchange_info_both_directions():
+    catalog = SymbolCatalog({("BTC", "USDT"): EXCHANGE_INFO})
+
+    assert len(catalog) == 1
+    assert catalog.get_exchange_info("BTC", "USDT") == EXCHANGE_INFO
+    assert catalog.get_exchange_info("USDT", "BTC") == EXCHANGE_INFO
+    assert catalog.get_exchange_info("BTC", "ETH") is None
+
+
+def test_empty_catalog():
+    assert not SymbolCatalog({})
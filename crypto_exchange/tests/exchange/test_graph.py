@@ -0,0 +1,85 @@
+from decimal import Decimal
+
+from crypto_exchange.exchange.graph import CurrencyGraph
+from crypto_exchange.exchange.schemas import TradingPair
+
+
+def make_graph(*pairs: tuple[str, str, int]) -> CurrencyGraph:
+    return CurrencyGraph(
+        TradingPair(base=base, quote=quote, liquidity=Decimal(liquidity))
+        for base, quote, liquidity in pairs
+    )
+
+
+def test_direct_route():
+    graph = make_graph(("BTC", "USDT", 100))
+
+    assert graph.find_route("BTC", "USDT", max_hops=3) == ["BTC", "USDT"]
+    assert graph.find_route("USDT", "BTC", max_hops=3) == ["USDT", "BTC"]
+    assert graph.has_pair("USDT", "BTC")
+
+
+def test_fewest_hops_then_best_liquidity():
+    graph = make_graph(
+        ("DOGE", "USDT", 500),
+        ("DOGE", "BTC", 50),
+        ("XMR", "USDT", 10),
+        ("XMR", "BTC", 300),
+        ("DOGE", "ETH", 1000),
+        ("ETH", "LTC", 1000),
+        ("LTC", "XMR", 1000),
+    )
+
+    # Both two-hop routes beat the high liquidity three-hop route, and the
+    # route through BTC has the better bottleneck (50 > 10).
+    assert graph.find_route("DOGE", "XMR", max_hops=3) == [
+        "DOGE",
+        "BTC",
+        "XMR",
+    ]
+
+
+def test_max_hops():
+    graph = make_graph(("A", "B", 1), ("B", "C", 1), ("C", "D", 1))
+
+    assert graph.find_route("A", "D", max_hops=3) == ["A", "B", "C", "D"]
+    assert graph.find_route("A", "D", max_hops=2) is None
+
+
+def test_unknown_currency():
+    graph = make_graph(("BTC", "USDT", 1))
+
+    assert graph.find_route("BTC", "XYZ", max_hops=3) is None
+    assert graph.find_route("XYZ", "BTC", max_hops=3) is None
+    assert len(graph._routes) == 0
+    assert not CurrencyGraph()
+
+
+def test_routes_are_cached(mocker):
+    graph = make_graph(("BTC", "USDT", 1))
+    find_route = mocker.spy(graph, "_find_route")
+
+    graph.find_route("BTC", "USDT", max_hops=3)
+    graph.find_route("BTC", "USDT", max_hops=3)
+
+    find_route.assert_called_once()
+
+
+def test_cached_routes_are_bounded():
+    graph = CurrencyGraph(
+        [
+            TradingPair(base="BTC", quote="USDT"),
+            TradingPair(base="ETH", quote="USDT"),
+        ],
+        max_cached_routes=2,
+    )
+
+    graph.find_route("BTC", "USDT", max_hops=3)
+    graph.find_route("ETH", "USDT", max_hops=3)
+    graph.find_route("BTC", "USDT", max_hops=3)
+    graph.find_route("BTC", "ETH", max_hops=3)
+
+    assert list(graph._routes) == [
+        ("BTC", "USDT", 3),
+        ("BTC", "ETH", 3),
+    ]
@@ -49,3 +49,55 @@ async def test_fetch_ticker_price_success(kucoin_provider):
 async def test_get_ticker():
     ticker = Kucoin.get_ticker("BTC", "USDT")
     assert ticker == "BTC-USDT"
+
+
+async def test_fetch_trading_pairs(kucoin_provider):
+    mock_data = {
+        "data": {
+            "ticker": [
+                {"symbol": "BTC-USDT", "last": "63000", "volValue": "100.5"},
+                {"symbol": "NEW-USDT", "last": None, "volValue": None},
+            ]
+        }
+    }
+    kucoin_provider._fetch_data = AsyncMock(return_value=mock_data)
+
+    trading_pairs = await kucoin_provider._fetch_trading_pairs()
+
+    assert [(pair.base, pair.quote) for pair in trading_pairs] == [
+        ("BTC", "USDT"),
+        ("NEW", "USDT"),
+    ]
+    assert trading_pairs[0].liquidity == Decimal("100.5")
+    assert trading_pairs[1].liquidity == Decimal(0)
+
+
+async def test_fetch_all_exchange_info(kucoin_provider):
+    mock_data = {
+        "data": [
+            {
+                "symbol": "BTC-USDT",
+                "baseCurrency": "BTC",
+                "quoteCurrency": "USDT",
+                "baseMinSize": "0.00001",
+                "baseMaxSize": "10000000000",
+                "enableTrading": True,
+            },
+            {
+                "symbol": "OLD-USDT",
+                "baseCurrency": "OLD",
+                "quoteCurrency": "USDT",
+                "baseMinSize": "1",
+                "baseMaxSize": "10000000000",
+                "enableTrading": False,
+            },
+        ]
+    }
+    kucoin_provider._fetch_data = AsyncMock(return_value=mock_data)
+
+    exchange_infos = await kucoin_provider._fetch_all_exchange_info()
+
+    assert list(exchange_infos) == [("BTC", "USDT")]
+    exchange_info = exchange_infos[("BTC", "USDT")]
+    assert exchange_info.based_ticker == "BTC-USDT"
+    assert exchange_info.from_asset_min_amount == Decimal("0.00001")
@@ -0,0 +1,440 @@
+import asyncio
+import gc
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from crypto_exchange.exchange.exceptions import (
+    PairNotFound,
+    ProviderBadResponse,
+)
+from crypto_exchange.exchange.graph import CurrencyGraph
+from crypto_exchange.exchange.providers.binance import Binance
+from crypto_exchange.exchange.providers.kucoin import Kucoin
+from crypto_exchange.exchange.resolver import ExchangeResolver, first_success
+from crypto_exchange.exchange.schemas import (
+    ExchangeInfo,
+    ExchangeRate,
+    ExchangeResult,
+    TradingPair,
+)
+from crypto_exchange.lib.cache import LocalCache
+from crypto_exchange.lib.circuit_breaker import CircuitBreaker
+from crypto_exchange.lib.constants import (
+    INTERMEDIARY_POLICY_BEST_RATE,
+    INTERMEDIARY_POLICY_FIRST_SUCCESS,
+    PROVIDER_POLICY_BEST_RATE,
+    PROVIDER_POLICY_FIRST_SUCCESS,
+)
+
+EXCHANGE_INFO = ExchangeInfo(
+    based_ticker="BTCUSDT",
+    from_asset_min_amount=Decimal("0.001"),
+    from_asset_max_amount=Decimal("100"),
+    to_asset_min_amount=Decimal("10"),
+    to_asset_max_amount=Decimal("10000"),
+    timestamp=int(datetime.utcnow().timestamp()),
+)
+
+
+async def test_warm_local_cache(redis_client, http_session):
+    provider = Binance(http_session, redis_client)
+    await provider._set_exchange_info_cache("BTCUSDT", EXCHANGE_INFO)
+    await provider._set_exchange_rate_cache(
+        "BTCUSDT",
+        ExchangeRate(rate=Decimal("63000"), timestamp=EXCHANGE_INFO.timestamp),
+    )
+    local_cache = LocalCache(maxsize=100, ttl=60)
+    resolver = ExchangeResolver(
+        http_session, redis_client, exchange=None, local_cache=local_cache
+    )
+
+    loaded = await resolver.warm_local_cache(
+        [
+            ("binance", "BTC", "USDT"),
+            ("binance", "USDT", "BTC"),
+            (None, "ETH", "USDT"),
+            ("unknown", "BTC", "USDT"),
+        ]
+    )
+
+    assert loaded == 2
+    assert (
+        local_cache.get(provider._get_exchange_info_cache_key("BTCUSDT"))
+        == EXCHANGE_INFO
+    )
+    assert local_cache.get(
+        provider._get_exchange_rate_cache_key("BTCUSDT")
+    ).rate == Decimal("63000")
+
+
+async def test_warm_local_cache_single_round_trip(mock_redis):
+    redis = mock_redis
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        redis,
+        exchange=None,
+        local_cache=LocalCache(maxsize=100, ttl=60),
+    )
+
+    await resolver.warm_local_cache(
+        [(None, "BTC", "USDT"), ("kucoin", "ETH", "USDT")]
+    )
+
+    script = redis.register_script.return_value
+    script.assert_awaited_once()
+    # Info and rate hashes of both providers with 12 fields in total.
+    keys, args = script.await_args.kwargs.values()
+    assert len(keys) == 4
+    assert len(args) - len(keys) - 1 == 12
+
+
+async def test_resolve_via_graph_route(mocker):
+    graph = CurrencyGraph(
+        [
+            TradingPair(base="DOGE", quote="BTC"),
+            TradingPair(base="XMR", quote="BTC"),
+        ]
+    )
+    exchange = mocker.patch.object(
+        Binance,
+        "exchange",
+        side_effect=[
+            ExchangeResult(rate="0.000002", result="0.0002", updated_at=20),
+            ExchangeResult(rate="200", result="0.04", updated_at=10),
+        ],
+    )
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        AsyncMock(),
+        exchange="binance",
+        currency_graphs={"binance": graph},
+    )
+
+    result = await resolver.resolve("DOGE", "XMR", Decimal("100"), None)
+
+    assert result.rate == "0.00040000"
+    assert result.result == "0.04000000"
+    assert result.updated_at == 10
+    assert [call.args[1:3] for call in exchange.await_args_list] == [
+        ("DOGE", "BTC"),
+        ("BTC", "XMR"),
+    ]
+
+
+async def test_resolve_without_graph_route(mocker):
+    graph = CurrencyGraph([TradingPair(base="BTC", quote="USDT")])
+    exchange = mocker.patch.object(Kucoin, "exchange")
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        AsyncMock(),
+        exchange="kucoin",
+        currency_graphs={"kucoin": graph},
+    )
+
+    with pytest.raises(PairNotFound):
+        await resolver.resolve("BTC", "XYZ", Decimal("1"), None)
+
+    exchange.assert_not_awaited()
+
+
+async def test_resolve_without_route_in_incomplete_graph(mocker):
+    graph = CurrencyGraph([TradingPair(base="BTC", quote="USDT")])
+    exchange = mocker.patch.object(
+        Binance,
+        "exchange",
+        return_value=ExchangeResult(rate="2", result="2", updated_at=10),
+    )
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        AsyncMock(),
+        exchange="binance",
+        currency_graphs={"binance": graph},
+    )
+
+    result = await resolver.resolve("BTC", "XYZ", Decimal("1"), None)
+
+    assert result.rate == "2"
+    exchange.assert_awaited_once()
+
+
+def delayed(delay: float, result):
+    async def exchange(*args, **kwargs):
+        await asyncio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return exchange
+
+
+async def test_resolve_first_success(mocker):
+    binance_result = ExchangeResult(rate="2", result="2", updated_at=1)
+    kucoin_result = ExchangeResult(rate="1", result="1", updated_at=1)
+    binance_exchange = mocker.patch.object(
+        Binance, "exchange", side_effect=delayed(1, binance_result)
+    )
+    mocker.patch.object(
+        Kucoin, "exchange", side_effect=delayed(0.01, kucoin_result)
+    )
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        AsyncMock(),
+        exchange=None,
+        provider_policy=PROVIDER_POLICY_FIRST_SUCCESS,
+    )
+
+    result = await asyncio.wait_for(
+        resolver.resolve("BTC", "USDT", Decimal("1"), None), timeout=0.5
+    )
+
+    assert result == kucoin_result
+    assert resolver.exchange == "kucoin"
+    binance_exchange.assert_awaited_once()
+
+
+async def test_resolve_first_success_skips_failures(mocker):
+    kucoin_result = ExchangeResult(rate="1", result="1", updated_at=1)
+    mocker.patch.object(
+        Binance, "exchange", side_effect=PairNotFound("Pair not found.")
+    )
+    mocker.patch.object(
+        Kucoin, "exchange", side_effect=delayed(0.01, kucoin_result)
+    )
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        AsyncMock(),
+        exchange=None,
+        provider_policy=PROVIDER_POLICY_FIRST_SUCCESS,
+    )
+
+    result = await resolver.resolve("BTC", "USDT", Decimal("1"), None)
+
+    assert result == kucoin_result
+    assert resolver.exchange == "kucoin"
+
+
+async def test_first_success_retrieves_all_exceptions():
+    contexts = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda loop, context: contexts.append(context))
+    result = ExchangeResult(rate="1", result="1", updated_at=1)
+
+    async def ok():
+        return result
+
+    async def bad():
+        raise PairNotFound("Pair not found.")
+
+    try:
+        key, value, errors = await first_success({"a": ok(), "b": bad()})
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert (key, value) == ("a", result)
+    assert isinstance(errors["b"], PairNotFound)
+    assert contexts == []
+
+
+async def test_resolve_skips_open_circuit(mocker):
+    kucoin_result = ExchangeResult(rate="1", result="1", updated_at=1)
+    binance_exchange = mocker.patch.object(Binance, "exchange")
+    mocker.patch.object(Kucoin, "exchange", return_value=kucoin_result)
+    binance_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    binance_breaker.record_failure()
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        AsyncMock(),
+        exchange=None,
+        circuit_breakers={"binance": binance_breaker},
+    )
+
+    result = await resolver.resolve("BTC", "USDT", Decimal("1"), None)
+
+    assert result == kucoin_result
+    assert resolver.exchange == "kucoin"
+    binance_exchange.assert_not_called()
+
+
+async def test_app_scoped_providers():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    binance = Binance(AsyncMock(), AsyncMock(), circuit_breaker=breaker)
+    resolver = ExchangeResolver(
+        AsyncMock(), AsyncMock(), "binance", providers={"binance": binance}
+    )
+
+    assert resolver.get_provider_instance() is binance
+
+    local_cache = LocalCache(maxsize=10, ttl=60)
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        AsyncMock(),
+        "binance",
+        local_cache=local_cache,
+        providers={"binance": binance},
+        stale_while_revalidate=30,
+    )
+    provider = resolver.get_provider_instance()
+
+    assert provider is not binance
+    assert provider.local_cache is local_cache
+    assert provider.stale_while_revalidate == 30
+    assert provider.circuit_breaker is breaker
+    assert binance.local_cache is None
+
+
+async def test_resolve_best_rate(mocker):
+    binance_result = ExchangeResult(rate="2.5", result="2.5", updated_at=1)
+    kucoin_result = ExchangeResult(rate="2.4", result="2.4", updated_at=1)
+    mocker.patch.object(
+        Binance, "exchange", side_effect=delayed(0.02, binance_result)
+    )
+    mocker.patch.object(
+        Kucoin, "exchange", side_effect=delayed(0.01, kucoin_result)
+    )
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        AsyncMock(),
+        exchange=None,
+        provider_policy=PROVIDER_POLICY_BEST_RATE,
+    )
+
+    result = await resolver.resolve("BTC", "USDT", Decimal("1"), None)
+
+    assert result == binance_result
+    assert resolver.exchange == "binance"
+
+
+@pytest.mark.parametrize(
+    "provider_policy",
+    [PROVIDER_POLICY_FIRST_SUCCESS, PROVIDER_POLICY_BEST_RATE],
+)
+async def test_resolve_concurrent_errors(mocker, mock_redis, provider_policy):
+    mocker.patch.object(
+        Binance, "exchange", side_effect=PairNotFound("Pair not found.")
+    )
+    mocker.patch.object(Kucoin, "exchange", side_effect=ProviderBadResponse())
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        mock_redis,
+        exchange=None,
+        provider_policy=provider_policy,
+    )
+
+    with pytest.raises(ProviderBadResponse):
+        await resolver.resolve("BTC", "USDT", Decimal("1"), None)
+
+    mocker.patch.object(
+        Kucoin, "exchange", side_effect=PairNotFound("Pair not found.")
+    )
+    with pytest.raises(PairNotFound):
+        await resolver.resolve("BTC", "USDT", Decimal("1"), None)
+
+
+class IntermediaryExchange:
+    """Fake Provider.exchange with per-intermediary rates and delays."""
+
+    def __init__(self, rates: dict[str, tuple[str, float]]):
+        self.rates = rates
+        self.active = 0
+        self.max_active = 0
+
+    async def exchange(self, amount, currency_from, currency_to, cache):
+        if currency_from == "DOGE" and currency_to == "XMR":
+            raise PairNotFound("Pair not found.")
+        if currency_from != "DOGE":
+            return ExchangeResult(rate="1", result=str(amount), updated_at=1)
+        if currency_to not in self.rates:
+            raise PairNotFound("Pair not found.")
+
+        rate, delay = self.rates[currency_to]
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(delay)
+        self.active -= 1
+        return ExchangeResult(
+            rate=rate, result=str(amount * Decimal(rate)), updated_at=1
+        )
+
+
+async def test_resolve_via_intermediary_first_success(mocker, mock_redis):
+    exchange = IntermediaryExchange(
+        {"USDT": ("1", 0.5), "BTC": ("2", 0.01), "ETH": ("3", 0.02)}
+    )
+    mocker.patch.object(Binance, "exchange", side_effect=exchange.exchange)
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        mock_redis,
+        exchange="binance",
+        intermediary_currencies=["USDT", "BTC", "ETH", "BNB"],
+        intermediary_policy=INTERMEDIARY_POLICY_FIRST_SUCCESS,
+    )
+
+    result = await asyncio.wait_for(
+        resolver.resolve("DOGE", "XMR", Decimal("10"), None), timeout=0.4
+    )
+
+    assert result.rate == "2.00000000"
+    assert result.result == "20.00000000"
+
+
+async def test_resolve_via_intermediary_best_rate(mocker, mock_redis):
+    exchange = IntermediaryExchange(
+        {"USDT": ("1", 0.01), "BTC": ("2", 0.01), "ETH": ("3", 0.05)}
+    )
+    mocker.patch.object(Binance, "exchange", side_effect=exchange.exchange)
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        mock_redis,
+        exchange="binance",
+        intermediary_currencies=["USDT", "BTC", "ETH"],
+        intermediary_policy=INTERMEDIARY_POLICY_BEST_RATE,
+        intermediary_max_concurrency=2,
+    )
+
+    result = await resolver.resolve("DOGE", "XMR", Decimal("10"), None)
+
+    assert result.rate == "3.00000000"
+    assert exchange.max_active == 2
+
+
+async def test_resolve_via_intermediary_not_found(mocker, mock_redis):
+    mocker.patch.object(
+        Binance, "exchange", side_effect=PairNotFound("Pair not found.")
+    )
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        mock_redis,
+        exchange="binance",
+        intermediary_currencies=["USDT", "BTC"],
+    )
+
+    with pytest.raises(PairNotFound, match="via intermediaries"):
+        await resolver.resolve("DOGE", "XMR", Decimal("10"), None)
+
+
+async def test_resolve_via_cached_route(mocker, mock_redis):
+    exchange = IntermediaryExchange({"BTC": ("2", 0.01), "ETH": ("3", 0.01)})
+    binance_exchange = mocker.patch.object(
+        Binance, "exchange", side_effect=exchange.exchange
+    )
+    resolver = ExchangeResolver(
+        AsyncMock(),
+        mock_redis,
+        exchange="binance",
+        local_cache=LocalCache(maxsize=100, ttl=60),
+        intermediary_currencies=["BTC", "ETH"],
+        intermediary_policy=INTERMEDIARY_POLICY_BEST_RATE,
+    )
+
+    first = await resolver.resolve("DOGE", "XMR", Decimal("10"), None)
+    binance_exchange.reset_mock()
+    second = await resolver.resolve("DOGE", "XMR", Decimal("10"), None)
+
+    assert first == second
+    assert first.rate == "3.00000000"
+    # Direct pair plus the two legs of the cached route only.
+    assert binance_exchange.await_count == 3
@@ -0,0 +1,258 @@
+import asyncio
+import time
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+from aiohttp import WSMsgType, web
+
+from crypto_exchange.exchange.providers.binance import Binance
+from crypto_exchange.exchange.schemas import ExchangeInfo
+from crypto_exchange.exchange.streams.binance import BinanceStream
+from crypto_exchange.exchange.streams.book import Level1Book
+from crypto_exchange.exchange.streams.kucoin import TICKER_TOPIC, KucoinStream
+
+BINANCE_TICKERS = [
+    {
+        "e": "24hrTicker",
+        "E": 1726941401000,
+        "s": "BTCUSDT",
+        "c": "63000.10",
+        "b": "63000.00",
+        "a": "63000.20",
+    }
+]
+
+
+class FakeExchangeStream:
+    """Local WebSocket stand-in for the exchanges' ticker streams."""
+
+    def __init__(self, close_after_send: bool = False):
+        self.close_after_send = close_after_send
+        self.connections = 0
+        self.received: list[dict] = []
+
+    async def binance(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        await ws.send_json(BINANCE_TICKERS)
+        if not self.close_after_send:
+            async for _ in ws:
+                pass
+        await ws.close()
+        return ws
+
+    async def kucoin_token(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "code": "200000",
+                "data": {
+                    "token": "token",
+                    "instanceServers": [
+                        {
+                            "endpoint": f"http://{request.host}/kucoin",
+                            "pingInterval": 50,
+                        }
+                    ],
+                },
+            }
+        )
+
+    async def kucoin(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        await ws.send_json({"id": "1", "type": "welcome"})
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                break
+            data = msg.json()
+            self.received.append(data)
+            if data["type"] == "subscribe":
+                await ws.send_json({"id": data["id"], "type": "ack"})
+                await ws.send_json(
+                    {
+                        "type": "message",
+                        "topic": TICKER_TOPIC,
+                        "subject": "BTC-USDT",
+                        "data": {
+                            "bestAsk": "63001.3",
+                            "bestBid": "63001.1",
+                            "price": "63001.2",
+                            "time": 1726941401000,
+                        },
+                    }
+                )
+            elif data["type"] == "ping":
+                await ws.send_json({"id": data["id"], "type": "pong"})
+        return ws
+
+
+@pytest.fixture
+def fake_stream():
+    return FakeExchangeStream()
+
+
+@pytest.fixture
+async def stream_server(aiohttp_server, fake_stream):
+    app = web.Application()
+    app.router.add_get("/ws/!ticker@arr", fake_stream.binance)
+    app.router.add_post("/api/v1/bullet-public", fake_stream.kucoin_token)
+    app.router.add_get("/kucoin", fake_stream.kucoin)
+    return await aiohttp_server(app)
+
+
+async def wait_for(predicate, timeout: float = 1.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+def test_book_staleness_watermark(mocker):
+    book = Level1Book(max_staleness=5)
+    book.connected = True
+    book.update("BTCUSDT", last=Decimal("63000"))
+
+    assert book.get_quote("BTCUSDT").last == Decimal("63000")
+
+    monotonic = time.monotonic() + 10
+    mocker.patch("time.monotonic", return_value=monotonic)
+    assert not book.is_healthy()
+    assert book.get_quote("BTCUSDT") is None
+
+
+def test_book_disconnected():
+    book = Level1Book(max_staleness=5)
+    book.update("BTCUSDT", last=Decimal("63000"))
+
+    assert book.get_quote("BTCUSDT") is None
+
+
+async def test_binance_stream(stream_server, http_session):
+    book = Level1Book(max_staleness=5)
+    stream = BinanceStream(
+        http_session,
+        book,
+        url=str(stream_server.make_url("/ws/!ticker@arr")),
+    )
+    task = asyncio.create_task(stream.run())
+
+    await wait_for(lambda: book.get_quote("BTCUSDT") is not None)
+    quote = book.get_quote("BTCUSDT")
+    assert quote.last == Decimal("63000.10")
+    assert quote.bid == Decimal("63000.00")
+    assert quote.ask == Decimal("63000.20")
+    assert quote.timestamp == 1726941401
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_binance_stream_reconnects(
+    stream_server, fake_stream, http_session
+):
+    fake_stream.close_after_send = True
+    book = Level1Book(max_staleness=5)
+    stream = BinanceStream(
+        http_session,
+        book,
+        url=str(stream_server.make_url("/ws/!ticker@arr")),
+        backoff_min=0.01,
+        backoff_max=0.02,
+    )
+    task = asyncio.create_task(stream.run())
+
+    await wait_for(lambda: fake_stream.connections >= 3)
+    assert stream.connections >= 3
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    assert not book.connected
+
+
+async def test_kucoin_stream(stream_server, fake_stream, http_session):
+    book = Level1Book(max_staleness=5)
+    stream = KucoinStream(
+        http_session,
+        book,
+        url=str(stream_server.make_url("/api/v1/bullet-public")),
+    )
+    task = asyncio.create_task(stream.run())
+
+    await wait_for(lambda: book.get_quote("BTC-USDT") is not None)
+    assert book.get_quote("BTC-USDT").last == Decimal("63001.2")
+    assert fake_stream.received[0]["topic"] == TICKER_TOPIC
+
+    await wait_for(
+        lambda: any(data["type"] == "ping" for data in fake_stream.received)
+    )
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.parametrize("data", [[1, 2], "text", 42, None])
+def test_kucoin_stream_ignores_non_object_frames(data):
+    book = Level1Book(max_staleness=5)
+    book.connected = True
+    stream = KucoinStream(AsyncMock(), book)
+
+    stream._handle_message(data)
+
+    assert book.is_healthy()
+
+
+async def test_provider_reads_healthy_stream():
+    book = Level1Book(max_staleness=5)
+    book.connected = True
+    book.update("BTCUSDT", last=Decimal("63000"), timestamp=1726941401)
+    provider = Binance(AsyncMock(), AsyncMock(), market_data=book)
+    provider._fetch_ticker_price = AsyncMock()
+
+    exchange_rate = await provider.get_exchange_rate(
+        "BTCUSDT", "USDT", "BTC", cache_max_seconds=None
+    )
+
+    assert exchange_rate.rate == 1 / Decimal("63000")
+    assert exchange_rate.timestamp == 1726941401
+    provider._fetch_ticker_price.assert_not_awaited()
+
+
+async def test_provider_falls_back_to_rest_on_stale_stream(mock_redis):
+    book = Level1Book(max_staleness=5)
+    book.update("BTCUSDT", last=Decimal("63000"))
+    provider = Binance(AsyncMock(), mock_redis, market_data=book)
+    provider._fetch_ticker_price = AsyncMock(return_value=Decimal("64000"))
+
+    exchange_rate = await provider.get_exchange_rate(
+        "BTCUSDT", "BTC", "USDT", cache_max_seconds=None
+    )
+
+    assert exchange_rate.rate == Decimal("64000")
+    provider._fetch_ticker_price.assert_awaited_once()
+
+
+async def test_streamed_quote_is_not_stale(mock_redis):
+    book = Level1Book(max_staleness=5)
+    book.connected = True
+    book.update(
+        "BTCUSDT", last=Decimal("63000"), timestamp=int(time.time()) - 3
+    )
+    provider = Binance(AsyncMock(), mock_redis, market_data=book)
+    provider._fetch_exchange_info = AsyncMock(
+        return_value=ExchangeInfo(
+            based_ticker="BTCUSDT",
+            from_asset_min_amount=Decimal("0.0001"),
+            from_asset_max_amount=Decimal("100"),
+            to_asset_min_amount=Decimal("1"),
+            to_asset_max_amount=Decimal("9000000"),
+            timestamp=int(time.time()),
+        )
+    )
+
+    result = await provider.exchange(Decimal("1"), "BTC", "USDT", 1)
+
+    assert result.rate == "63000.00000000"
+    assert not result.stale
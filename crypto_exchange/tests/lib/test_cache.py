@@ -0,0 +1,50 @@
+from crypto_exchange.lib.cache import LocalCache
+
+
+def test_get_and_set():
+    cache = LocalCache(maxsize=2, ttl=60)
+
+    assert cache.get("BTCUSDT") is None
+    cache.set("BTCUSDT", 1)
+
+    assert cache.get("BTCUSDT") == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction():
+    cache = LocalCache(maxsize=2, ttl=60)
+    cache.set("BTCUSDT", 1)
+    cache.set("ETHUSDT", 2)
+
+    cache.get("BTCUSDT")
+    cache.set("BNBUSDT", 3)
+
+    assert len(cache) == 2
+    assert cache.get("ETHUSDT") is None
+    assert cache.get("BTCUSDT") == 1
+    assert cache.get("BNBUSDT") == 3
+
+
+def test_ttl_expiry():
+    cache = LocalCache(maxsize=2, ttl=60)
+    cache.set("BTCUSDT", 1, ttl=0)
+
+    assert cache.get("BTCUSDT") is None
+    assert len(cache) == 0
+
+
+def test_validate_rejects_value():
+    cache = LocalCache(maxsize=2, ttl=60)
+    cache.set("BTCUSDT", 1)
+
+    assert cache.get("BTCUSDT", validate=lambda value: value > 1) is None
+    assert cache.get("BTCUSDT") == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_zero_size_disables_cache():
+    cache = LocalCache(maxsize=0, ttl=60)
+    cache.set("BTCUSDT", 1)
+
+    assert cache.get("BTCUSDT") is None
@@ -0,0 +1,77 @@
+import asyncio
+
+from crypto_exchange.lib.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+)
+
+
+async def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.is_open
+    assert not breaker.allow_request()
+
+
+async def test_single_trial_after_reset_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+
+    await asyncio.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    assert not breaker.is_open
+    assert breaker.allow_request()
+    assert breaker.is_open
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+
+async def test_failed_trial_reopens():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.05)
+    for _ in range(3):
+        breaker.record_failure()
+
+    await asyncio.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+
+
+async def test_trial_without_outcome_is_replaced():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    await asyncio.sleep(0.06)
+    assert breaker.allow_request()
+
+    await asyncio.sleep(0.06)
+    assert breaker.allow_request()
+
+
+async def test_on_change_reports_open_state():
+    changes = []
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=0.05, on_change=changes.append
+    )
+
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    await asyncio.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_success()
+
+    assert changes == [True, False]
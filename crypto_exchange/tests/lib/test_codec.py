@@ -0,0 +1,74 @@
+from decimal import Decimal
+
+import pytest
+
+from crypto_exchange.exchange.schemas import ExchangeInfo, ExchangeRate
+from crypto_exchange.lib.codec import BinaryCodec, JsonCodec, get_codec
+
+EXCHANGE_INFO = ExchangeInfo(
+    based_ticker="BTCUSDT",
+    from_asset_min_amount=Decimal("0.00001000"),
+    from_asset_max_amount=Decimal("9000.00000000"),
+    to_asset_min_amount=Decimal("-3E+5"),
+    to_asset_max_amount=Decimal("9000000"),
+    timestamp=1700000000,
+)
+WIDE_EXCHANGE_INFO = EXCHANGE_INFO.model_copy(
+    update={"to_asset_max_amount": Decimal("1234567890123456789012345.5")}
+)
+EXCHANGE_RATE = ExchangeRate(rate=Decimal("63000.10000000"), timestamp=1)
+
+
+@pytest.mark.parametrize(
+    "value", [EXCHANGE_INFO, WIDE_EXCHANGE_INFO, EXCHANGE_RATE]
+)
+@pytest.mark.parametrize("codec", [JsonCodec(), BinaryCodec()])
+def test_round_trip(codec, value):
+    decoded = codec.decode(codec.encode(value), type(value))
+
+    assert decoded == value
+    for name in type(value).model_fields:
+        assert str(getattr(decoded, name)) == str(getattr(value, name))
+
+
+def test_binary_codec_reads_json():
+    data = JsonCodec().encode(EXCHANGE_INFO)
+
+    assert BinaryCodec().decode(data, ExchangeInfo) == EXCHANGE_INFO
+
+
+def test_json_codec_reads_binary():
+    data = BinaryCodec().encode(EXCHANGE_INFO)
+
+    assert JsonCodec().decode(data, ExchangeInfo) == EXCHANGE_INFO
+
+
+def test_binary_codec_is_compact():
+    binary_size = len(BinaryCodec().encode(EXCHANGE_INFO))
+
+    assert binary_size < len(JsonCodec().encode(EXCHANGE_INFO)) / 3
+
+
+def test_binary_codec_falls_back_to_json():
+    data = BinaryCodec().encode(WIDE_EXCHANGE_INFO)
+
+    assert data == JsonCodec().encode(WIDE_EXCHANGE_INFO)
+
+
+def test_binary_codec_falls_back_to_json_for_non_finite():
+    value = ExchangeRate.model_construct(rate=Decimal("NaN"), timestamp=1)
+
+    assert BinaryCodec().encode(value) == JsonCodec().encode(value)
+
+
+def test_binary_codec_rejects_unknown_version():
+    data = b"\x7f" + BinaryCodec().encode(EXCHANGE_RATE)[1:]
+
+    with pytest.raises(ValueError):
+        BinaryCodec().decode(data, ExchangeRate)
+
+
+def test_get_codec():
+    assert isinstance(get_codec("binary"), BinaryCodec)
+    with pytest.raises(ValueError):
+        get_codec("pickle")
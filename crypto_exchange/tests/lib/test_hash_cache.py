@@ -0,0 +1,57 @@
+from crypto_exchange.lib.hash_cache import (
+    HashField,
+    read_fresh_fields,
+    write_fields,
+)
+
+
+async def test_read_fresh_fields(redis_client):
+    async with redis_client.pipeline(transaction=False) as pipe:
+        write_fields(pipe, "rates", {"BTCUSDT": b"1", "ETHUSDT": b"2"}, 60)
+        write_fields(pipe, "rates", {"BNBUSDT": b"3"}, 10)
+        write_fields(pipe, "info", {"BTCUSDT": b"4"}, 60)
+        await pipe.execute()
+
+    fields = [
+        HashField("rates", "BNBUSDT"),
+        HashField("info", "BTCUSDT"),
+        HashField("rates", "XRPUSDT"),
+        HashField("rates", "BTCUSDT"),
+        HashField("missing", "BTCUSDT"),
+    ]
+
+    assert await read_fresh_fields(redis_client, fields, min_ttl=0) == [
+        b"3",
+        b"4",
+        None,
+        b"1",
+        None,
+    ]
+    assert await read_fresh_fields(redis_client, fields, min_ttl=30) == [
+        None,
+        b"4",
+        None,
+        b"1",
+        None,
+    ]
+
+
+async def test_write_fields_expire(redis_client):
+    async with redis_client.pipeline(transaction=False) as pipe:
+        write_fields(pipe, "rates", {"BTCUSDT": b"1"}, 60)
+        await pipe.execute()
+
+    ttl = await redis_client.execute_command(
+        "HTTL", "rates", "FIELDS", 1, "BTCUSDT"
+    )
+    assert 0 < ttl[0] <= 60
+
+
+async def test_read_fresh_fields_registers_script_once(redis_client, mocker):
+    register_script = mocker.spy(redis_client, "register_script")
+    fields = [HashField("rates", "BTCUSDT")]
+
+    await read_fresh_fields(redis_client, fields, min_ttl=0)
+    await read_fresh_fields(redis_client, fields, min_ttl=0)
+
+    register_script.assert_called_once()
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from crypto_exchange.lib.hedging import RequestHedger
+
+
+def fake_request(*delays, error=None):
+    """Requests taking the given delays in turn, failing with error."""
+    calls = []
+
+    async def request():
+        delay = delays[len(calls)]
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return delay
+
+    return request, calls
+
+
+async def test_fast_request_is_not_hedged():
+    hedges = []
+    hedger = RequestHedger(
+        delay=0.05, budget=1, on_hedge=lambda: hedges.append(1)
+    )
+    request, calls = fake_request(0.01)
+
+    assert await hedger.run(request) == 0.01
+    assert calls == [0.01]
+    assert hedges == []
+
+
+async def test_slow_request_is_hedged():
+    hedges = []
+    hedger = RequestHedger(
+        delay=0.01, budget=1, on_hedge=lambda: hedges.append(1)
+    )
+    request, calls = fake_request(1, 0.01)
+
+    result = await asyncio.wait_for(hedger.run(request), timeout=0.5)
+
+    assert result == 0.01
+    assert calls == [1, 0.01]
+    assert hedges == [1]
+
+
+async def test_hedges_are_limited_by_budget():
+    hedger = RequestHedger(delay=0.01, budget=0.5)
+    request, calls = fake_request(0.03, 0.03, 0.03, 0.03)
+
+    await hedger.run(request)
+    await hedger.run(request)
+
+    # The first request earns half a hedge, the second completes one.
+    assert len(calls) == 3
+
+
+async def test_all_failed_attempts_raise():
+    hedger = RequestHedger(delay=0.01, budget=1)
+    request, calls = fake_request(0.02, 0.02, error=ValueError("Failed."))
+
+    with pytest.raises(ValueError):
+        await hedger.run(request)
+    assert len(calls) == 2
+
+
+async def test_delay_follows_observed_latency():
+    hedger = RequestHedger(delay=1, quantile=0.9, min_samples=10)
+    assert hedger.get_delay() == 1
+
+    for delay in range(10):
+        await hedger.run(fake_request(delay / 1000)[0])
+
+    assert 0.009 <= hedger.get_delay() < 0.1
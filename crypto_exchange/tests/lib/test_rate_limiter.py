@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from crypto_exchange.lib.rate_limiter import RateLimiter, RateLimitExceeded
+
+
+async def test_acquire_within_limit_does_not_wait():
+    limiter = RateLimiter(limit=10, period=1, max_wait=1)
+
+    assert await limiter.acquire(4) < 0.01
+    assert await limiter.acquire(6) < 0.01
+    assert limiter.tokens < 1
+
+
+async def test_acquire_waits_for_refill():
+    limiter = RateLimiter(limit=10, period=0.1, max_wait=1)
+    await limiter.acquire(10)
+
+    waited = await limiter.acquire(5)
+
+    assert 0.03 <= waited < 0.2
+
+
+async def test_acquire_gives_up_after_max_wait():
+    limiter = RateLimiter(limit=10, period=10, max_wait=0.05)
+    await limiter.acquire(10)
+
+    with pytest.raises(RateLimitExceeded):
+        await limiter.acquire(5)
+    assert len(limiter) == 0
+
+
+async def test_lower_priority_waits_behind():
+    limiter = RateLimiter(limit=10, period=0.1, max_wait=1)
+    await limiter.acquire(10)
+    order = []
+
+    async def acquire(name, priority):
+        await limiter.acquire(10, priority)
+        order.append(name)
+
+    background = asyncio.create_task(acquire("background", 1))
+    await asyncio.sleep(0)
+    request = asyncio.create_task(acquire("request", 0))
+    await asyncio.sleep(0)
+    assert len(limiter) == 2
+
+    await asyncio.gather(background, request)
+
+    assert order == ["request", "background"]
+
+
+async def test_remaining_weight_and_pause_throttle():
+    limiter = RateLimiter(limit=10, period=1, max_wait=0.05)
+    limiter.update_remaining(2)
+
+    assert await limiter.acquire(2) < 0.01
+    with pytest.raises(RateLimitExceeded):
+        await limiter.acquire(2)
+
+    limiter = RateLimiter(limit=10, period=1, max_wait=1)
+    limiter.pause(0.05)
+    assert await limiter.acquire(1) >= 0.04
+
+
+def test_share_scales_limit_and_remaining_weight():
+    limiter = RateLimiter(limit=6000, period=60, max_wait=1, share=0.25)
+
+    assert limiter.tokens == 1500
+    limiter.update_remaining(4400)
+    assert 1100 <= limiter.tokens < 1101
+
+
+async def test_on_queue_change_reports_waiting_calls():
+    sizes = []
+    limiter = RateLimiter(
+        limit=10, period=0.1, max_wait=1, on_queue_change=sizes.append
+    )
+    await limiter.acquire(10)
+
+    await asyncio.gather(limiter.acquire(5), limiter.acquire(5))
+
+    assert sizes == [1, 0, 1, 2, 1, 0]
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from crypto_exchange.lib.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_are_coalesced():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(
+        *[single_flight.do("BTCUSDT", fetch) for _ in range(10)]
+    )
+
+    assert results == [1] * 10
+    assert len(single_flight) == 0
+    assert await single_flight.do("BTCUSDT", fetch) == 2
+
+
+async def test_cancelled_waiter_does_not_cancel_call():
+    single_flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return "price"
+
+    first = asyncio.create_task(single_flight.do("BTCUSDT", fetch))
+    second = asyncio.create_task(single_flight.do("BTCUSDT", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "price"
+    with pytest.raises(asyncio.CancelledError):
+        await first
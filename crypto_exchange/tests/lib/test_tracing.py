@@ -0,0 +1,44 @@
+import asyncio
+
+from crypto_exchange.lib.tracing import span, trace_request
+
+
+def test_span_outside_trace_is_noop():
+    assert span("parse") is span("format")
+    with span("parse"):
+        pass
+
+
+async def test_trace_request_records_spans_across_tasks():
+    async def upstream_call() -> None:
+        with span("upstream", "binance /api/v3/ticker/price"):
+            await asyncio.sleep(0.01)
+
+    with trace_request() as trace:
+        with span("parse"):
+            pass
+        await asyncio.gather(upstream_call(), upstream_call())
+
+    with span("serialize"):
+        pass
+
+    assert [item.name for item in trace.spans] == [
+        "parse",
+        "upstream",
+        "upstream",
+    ]
+    assert trace.spans[1].duration >= 0.01
+    assert trace.total >= trace.spans[1].duration
+
+
+def test_server_timing():
+    with trace_request() as trace:
+        trace.add("cache_read", 0.0015, "binance")
+
+    server_timing = trace.server_timing()
+
+    assert server_timing.startswith('cache_read;desc="binance";dur=1.500, ')
+    assert ", total;dur=" in server_timing
+    assert trace.to_dict()["spans"] == [
+        {"name": "cache_read", "description": "binance", "duration_ms": 1.5}
+    ]
@@ -0,0 +1,20 @@
+from decimal import Decimal
+
+from crypto_exchange.lib import utils
+from crypto_exchange.lib.utils import format_decimal, json_dumps, json_loads
+
+
+def test_format_decimal():
+    assert format_decimal(Decimal("63000.123456789")) == "63000.12345678"
+    assert format_decimal(Decimal("2"), max_digits=2) == "2.00"
+    assert format_decimal(Decimal("5.9"), max_digits=0) == "5"
+
+
+def test_json_without_orjson(monkeypatch):
+    value = {"exchange": "binance", "rate": "1.5", "updated_at": 1}
+    encoded = json_dumps(value)
+
+    monkeypatch.setattr(utils, "orjson", None)
+
+    assert json_dumps(value) == encoded
+    assert json_loads(encoded) == value
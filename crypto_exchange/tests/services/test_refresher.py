@@ -0,0 +1,141 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+from aiohttp import web
+
+from crypto_exchange.config import Config
+from crypto_exchange.exchange.providers.binance import Binance
+from crypto_exchange.exchange.providers.kucoin import Kucoin
+from crypto_exchange.exchange.schemas import ExchangeRate
+from crypto_exchange.lib.cache import LocalCache
+from crypto_exchange.services.refresher import (
+    refresh_rates,
+    setup_rates_refresher,
+)
+
+
+async def binance_ticker_price(request: web.Request) -> web.Response:
+    return web.json_response(
+        [
+            {"symbol": "BTCUSDT", "price": "63000.10000000"},
+            {"symbol": "ETHUSDT", "price": "2500.50000000"},
+        ]
+    )
+
+
+async def kucoin_all_tickers(request: web.Request) -> web.Response:
+    return web.json_response(
+        {
+            "code": "200000",
+            "data": {
+                "time": 1726941401000,
+                "ticker": [
+                    {"symbol": "BTC-USDT", "last": "63001.2"},
+                    {"symbol": "NEW-USDT", "last": None},
+                ],
+            },
+        }
+    )
+
+
+@pytest.fixture
+async def fake_exchange(aiohttp_server, mocker):
+    app = web.Application()
+    app["calls"] = 0
+
+    @web.middleware
+    async def count_calls(request, handler):
+        request.app["calls"] += 1
+        return await handler(request)
+
+    app.middlewares.append(count_calls)
+    app.router.add_get("/api/v3/ticker/price", binance_ticker_price)
+    app.router.add_get("/api/v1/market/allTickers", kucoin_all_tickers)
+    server = await aiohttp_server(app)
+
+    mocker.patch(
+        "crypto_exchange.exchange.providers.binance.ALL_TICKER_PRICES_URL",
+        str(server.make_url("/api/v3/ticker/price")),
+    )
+    mocker.patch(
+        "crypto_exchange.exchange.providers.kucoin.ALL_TICKERS_URL",
+        str(server.make_url("/api/v1/market/allTickers")),
+    )
+    return app
+
+
+async def test_refresh_exchange_rates(
+    fake_exchange, redis_client, http_session
+):
+    local_cache = LocalCache(maxsize=10, ttl=60)
+    provider = Binance(http_session, redis_client, local_cache=local_cache)
+    cache_key = provider._get_exchange_rate_cache_key("BTCUSDT")
+    local_cache.set(cache_key, ExchangeRate(rate=Decimal("1"), timestamp=0))
+
+    assert await provider.refresh_exchange_rates() == 2
+
+    cached_value = await redis_client.hget(
+        *provider._get_exchange_rate_cache_key("ETHUSDT")
+    )
+    exchange_rate = provider.cache_codec.decode(cached_value, ExchangeRate)
+    assert exchange_rate.rate == Decimal("2500.5")
+    assert local_cache.get(cache_key).rate == Decimal("63000.1")
+    assert provider._get_exchange_rate_cache_key("ETHUSDT") not in local_cache
+
+
+async def test_refresh_rates_all_providers(
+    fake_exchange, redis_client, http_session
+):
+    app = web.Application()
+    app["config"] = Config()
+    app["http_session"] = http_session
+    app["http_sessions"] = {}
+    app["rate_limiters"] = {}
+    app["redis"] = redis_client
+    app["local_cache"] = None
+
+    await refresh_rates(app)
+
+    kucoin = Kucoin(http_session, redis_client)
+    exchange_rate = await kucoin._get_cached_exchange_rate(
+        "BTC-USDT", cache_max_seconds=60
+    )
+    assert exchange_rate.rate == Decimal("63001.2")
+    assert fake_exchange["calls"] == 2
+
+
+async def test_setup_rates_refresher(fake_exchange, redis_client, http_session):
+    app = web.Application()
+    app["config"] = Config(rates_refresh_interval=1)
+    app["http_session"] = http_session
+    app["http_sessions"] = {}
+    app["rate_limiters"] = {}
+    app["redis"] = redis_client
+    app["local_cache"] = None
+
+    context = setup_rates_refresher(app)
+    task = await anext(context)
+    await asyncio.sleep(0.1)
+
+    binance = Binance(http_session, redis_client)
+    exchange_rate = await binance._get_cached_exchange_rate(
+        "BTCUSDT", cache_max_seconds=60
+    )
+    assert exchange_rate.rate == Decimal("63000.1")
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(context)
+    assert task.cancelled()
+
+
+async def test_setup_rates_refresher_disabled():
+    app = web.Application()
+    app["config"] = Config()
+
+    context = setup_rates_refresher(app)
+
+    assert await anext(context) is None
+    assert "rates_refresher" not in app
+    with pytest.raises(StopAsyncIteration):
+        await anext(context)
@@ -0,0 +1,94 @@
+import asyncio
+
+from aiohttp import web
+from prometheus_client import REGISTRY
+
+from crypto_exchange.config import Config, HttpPoolConfig
+from crypto_exchange.services.requests import (
+    create_http_session,
+    get_http_session,
+    setup_requests,
+)
+
+
+async def test_setup_requests_configures_provider_pools():
+    app = web.Application()
+    app["config"] = Config(
+        http_pools={
+            "binance": {
+                "limit": 5,
+                "limit_per_host": 2,
+                "dns_cache_ttl": 60,
+                "read_timeout": 1.5,
+            }
+        }
+    )
+
+    context = setup_requests(app)
+    http_session = await anext(context)
+
+    binance = get_http_session(app, "binance")
+    kucoin = get_http_session(app, "kucoin")
+    assert set(app["http_sessions"]) == {"binance", "kucoin"}
+    assert binance is not http_session
+    assert binance.connector.limit == 5
+    assert binance.connector.limit_per_host == 2
+    assert binance.timeout.sock_read == 1.5
+    assert kucoin.connector.limit == HttpPoolConfig().limit
+    assert kucoin.timeout.sock_connect == HttpPoolConfig().connect_timeout
+
+    await anext(context, None)
+    assert http_session.closed
+    assert binance.closed and kucoin.closed
+
+
+async def test_get_http_session_falls_back_to_shared_session():
+    app = web.Application()
+    app["http_session"] = shared = object()
+    app["http_sessions"] = {}
+
+    assert get_http_session(app, "binance") is shared
+
+
+async def test_pool_metrics(aiohttp_server):
+    async def slow(request: web.Request) -> web.Response:
+        await asyncio.sleep(0.05)
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/", slow)
+    server = await aiohttp_server(app)
+
+    def sample(name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    labels = {"provider": "pooltest"}
+    waits_before = sample(
+        "crypto_exchange_upstream_pool_wait_seconds_count", **labels
+    )
+    session = create_http_session("pooltest", HttpPoolConfig(limit=1))
+
+    async def get():
+        async with session.get(server.make_url("/")) as response:
+            await response.read()
+
+    try:
+        await asyncio.gather(get(), get(), get())
+    finally:
+        await session.close()
+
+    connections = "crypto_exchange_upstream_pool_connections_total"
+    assert sample("crypto_exchange_upstream_pool_limit", **labels) == 1
+    assert sample(connections, **labels, result="created") == 1
+    assert sample(connections, **labels, result="reused") == 2
+    assert (
+        sample("crypto_exchange_upstream_pool_wait_seconds_count", **labels)
+        == waits_before + 2
+    )
+    for state in ["active", "queued"]:
+        assert (
+            sample(
+                "crypto_exchange_upstream_pool_requests", **labels, state=state
+            )
+            == 0
+        )
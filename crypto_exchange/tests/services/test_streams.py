@@ -0,0 +1,8 @@
+from crypto_exchange.exchange.streams.binance import BinanceStream
+from crypto_exchange.exchange.streams.kucoin import KucoinStream
+from crypto_exchange.services.streams import get_stream_cls
+
+
+def test_get_stream_cls():
+    assert get_stream_cls("binance") is BinanceStream
+    assert get_stream_cls("kucoin") is KucoinStream
@@ -0,0 +1,93 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp import web
+
+from crypto_exchange.config import Config
+from crypto_exchange.exchange.exceptions import PairNotFound
+from crypto_exchange.exchange.schemas import ExchangeInfo, ExchangeRate
+from crypto_exchange.services.warmup import setup_warmup, warm_up
+
+EXCHANGE_INFO = ExchangeInfo(
+    based_ticker="BTCUSDT",
+    from_asset_min_amount=Decimal("0.001"),
+    from_asset_max_amount=Decimal("100"),
+    to_asset_min_amount=Decimal("10"),
+    to_asset_max_amount=Decimal("10000"),
+    timestamp=1700000000,
+)
+
+
+def create_provider() -> MagicMock:
+    provider = MagicMock()
+    provider.get_exchange_info = AsyncMock(return_value=EXCHANGE_INFO)
+    provider.get_exchange_rate = AsyncMock(
+        return_value=ExchangeRate(rate=Decimal("63000"), timestamp=1700000000)
+    )
+    return provider
+
+
+def create_app(warmup_pairs: list[dict], **config) -> web.Application:
+    app = web.Application()
+    app["config"] = Config(warmup_pairs=warmup_pairs, **config)
+    app["providers"] = {
+        "binance": create_provider(),
+        "kucoin": create_provider(),
+    }
+    return app
+
+
+async def test_warm_up():
+    app = create_app(
+        [
+            {"currency_from": "btc", "currency_to": "usdt"},
+            {
+                "currency_from": "ETH",
+                "currency_to": "BTC",
+                "exchange": "Kucoin",
+            },
+            {"currency_from": "BTC", "currency_to": "USDT", "exchange": "x"},
+        ]
+    )
+    binance, kucoin = app["providers"].values()
+    kucoin.get_exchange_info.side_effect = [EXCHANGE_INFO, PairNotFound()]
+
+    assert await warm_up(app) == 2
+
+    binance.get_exchange_info.assert_awaited_once_with("BTC", "USDT", 60)
+    binance.get_exchange_rate.assert_awaited_once_with(
+        "BTCUSDT", "BTC", "USDT", 60
+    )
+    assert kucoin.get_exchange_info.await_count == 2
+    kucoin.get_exchange_rate.assert_awaited_once()
+
+
+async def test_setup_warmup_reports_ready():
+    app = create_app([{"currency_from": "BTC", "currency_to": "USDT"}])
+
+    context = setup_warmup(app)
+    ready = await anext(context)
+    await asyncio.wait_for(ready.wait(), 1)
+
+    assert app["ready"] is ready
+    await anext(context, None)
+
+
+async def test_setup_warmup_ready_after_timeout():
+    app = create_app(
+        [{"currency_from": "BTC", "currency_to": "USDT"}], warmup_timeout=0.05
+    )
+
+    async def slow(*args):
+        await asyncio.sleep(10)
+
+    for provider in app["providers"].values():
+        provider.get_exchange_info.side_effect = slow
+
+    context = setup_warmup(app)
+    ready = await anext(context)
+
+    assert not ready.is_set()
+    await asyncio.wait_for(ready.wait(), 1)
+    await anext(context, None)
@@ -0,0 +1,15 @@
+import asyncio
+import sys
+
+from crypto_exchange.__main__ import create_event_loop
+
+
+def test_create_event_loop_falls_back_without_uvloop(monkeypatch):
+    # A None entry makes the import fail as if uvloop were not installed.
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    loop = create_event_loop("uvloop")
+    try:
+        assert type(loop) is type(asyncio.new_event_loop())
+    finally:
+        loop.close()
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from benchmarks.hot_paths import (
+    BENCHMARKS,
+    calibration,
+    load_baseline,
+    measure,
+)
+
+# Allowed slowdown relative to the baseline of the installed JSON backend
+# in benchmarks/baseline.json. Refresh it with
+# `python -m benchmarks.hot_paths --save-baseline` after an intended
+# change, with and without orjson installed.
+TOLERANCE = float(os.environ.get("PERF_TOLERANCE", "1.5"))
+
+# Wall clock budgets depend on the machine load, so they only run on
+# request.
+RUN_PERF_TESTS = os.environ.get("RUN_PERF_TESTS") == "1"
+
+BASELINE = load_baseline()
+
+
+@pytest.fixture(scope="module")
+def unit():
+    return measure(calibration)
+
+
+def test_every_benchmark_has_a_baseline():
+    assert set(BENCHMARKS) == set(BASELINE)
+
+
+@pytest.mark.skipif(not RUN_PERF_TESTS, reason="set RUN_PERF_TESTS=1")
+@pytest.mark.parametrize("name", BENCHMARKS)
+def test_performance_budget(name, unit):
+    budget = BASELINE[name] * TOLERANCE
+    cost = measure(BENCHMARKS[name]) / unit
+    if cost > budget:
+        # Retry once so a single noisy run does not fail the suite.
+        cost = min(cost, measure(BENCHMARKS[name]) / measure(calibration))
+
+    assert cost <= budget, (
+        f"{name} costs {cost:.3f} calibration units, "
+        f"over the budget of {budget:.3f}"
+    )
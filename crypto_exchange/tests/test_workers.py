@@ -0,0 +1,53 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+
+from crypto_exchange.workers import WorkerPool, create_socket
+
+
+def sleep_forever(sock: socket.socket, leader: bool) -> None:
+    while True:
+        time.sleep(1)
+
+
+def test_worker_pool_restarts_exited_workers():
+    sock = create_socket("127.0.0.1", 0)
+    pool = WorkerPool(sleep_forever, sock, 2)
+    pool.start()
+    try:
+        assert pool.restart_exited() == []
+
+        pid = pool.processes[1].pid
+        os.kill(pid, signal.SIGKILL)
+        pool.processes[1].join()
+
+        assert pool.restart_exited() == [1]
+        assert pool.processes[1].is_alive()
+        assert pool.processes[1].pid != pid
+    finally:
+        pool.stop(timeout=5)
+        sock.close()
+
+    assert not any(process.is_alive() for process in pool.processes.values())
+
+
+def test_worker_pool_elects_first_worker_as_leader():
+    queue = multiprocessing.get_context("fork").Queue()
+
+    def report(sock: socket.socket, leader: bool) -> None:
+        queue.put((sock.getsockname(), leader))
+
+    sock = create_socket("127.0.0.1", 0)
+    address = sock.getsockname()
+    pool = WorkerPool(report, sock, 3)
+    pool.start()
+    try:
+        reports = [queue.get(timeout=5) for _ in range(3)]
+    finally:
+        pool.stop(timeout=5)
+        sock.close()
+
+    assert {name for name, _ in reports} == {address}
+    assert sorted(leader for _, leader in reports) == [False, False, True]
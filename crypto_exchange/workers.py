@@ -0,0 +1,149 @@
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from types import FrameType
+from typing import Callable
+
+from prometheus_client import multiprocess
+
+from crypto_exchange.config import Config
+from crypto_exchange.lib.constants import (
+    WORKER_RESTART_DELAY,
+    WORKER_SHUTDOWN_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+# Serves the app on the shared socket, the second argument tells whether
+# the worker is the leader running the background tasks.
+Worker = Callable[[socket.socket, bool], None]
+
+
+def create_socket(host: str | None, port: int | None) -> socket.socket:
+    """Bind the listening socket shared by every worker."""
+    return socket.create_server((host or "0.0.0.0", port or 8080))
+
+
+def _mark_process_dead(pid: int | None) -> None:
+    if pid is not None and "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid)
+
+
+class WorkerPool:
+    """
+    Pre-forked worker processes accepting connections on one socket.
+
+    Worker 0 is the leader, a restarted worker keeps its index and so
+    its role.
+    """
+
+    def __init__(self, worker: Worker, sock: socket.socket, size: int):
+        self.worker = worker
+        self.sock = sock
+        self.size = size
+        self.processes: dict[int, BaseProcess] = {}
+        self._context = multiprocessing.get_context("fork")
+
+    def _run(self, index: int) -> None:
+        # Drop the handlers of the master, the worker installs its own.
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        self.worker(self.sock, index == 0)
+
+    def _start(self, index: int) -> None:
+        process = self._context.Process(
+            target=self._run,
+            args=(index,),
+            name=f"crypto_exchange-worker-{index}",
+        )
+        process.start()
+        self.processes[index] = process
+        logger.info(f"Worker {index} started. pid={process.pid}")
+
+    def start(self) -> None:
+        for index in range(self.size):
+            self._start(index)
+
+    def wait(self, timeout: float) -> None:
+        """Block until a worker exits or the timeout passes."""
+        wait(
+            [process.sentinel for process in self.processes.values()],
+            timeout,
+        )
+
+    def restart_exited(self) -> list[int]:
+        """Start a new process for every exited worker."""
+        restarted = []
+        for index, process in list(self.processes.items()):
+            if process.is_alive():
+                continue
+            logger.warning(
+                f"Worker {index} exited with code {process.exitcode}, "
+                f"restarting. pid={process.pid}"
+            )
+            _mark_process_dead(process.pid)
+            self._start(index)
+            restarted.append(index)
+        return restarted
+
+    def stop(self, timeout: float = WORKER_SHUTDOWN_TIMEOUT) -> None:
+        """
+        Ask every worker to shut down gracefully with SIGTERM and kill
+        the ones still running after the timeout.
+        """
+        for process in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + timeout
+        for index, process in self.processes.items():
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                logger.warning(f"Worker {index} did not stop, killing it.")
+                process.kill()
+                process.join()
+            _mark_process_dead(process.pid)
+        logger.info("Workers stopped.")
+
+
+def run_workers(config: Config, worker: Worker) -> None:
+    """
+    Serve with config.workers processes until SIGINT or SIGTERM, starting
+    a new worker whenever one exits.
+    """
+    sock = create_socket(config.host, config.port)
+    pool = WorkerPool(worker, sock, config.workers)
+    stopping = False
+
+    def stop(signum: int, frame: FrameType | None) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    pool.start()
+    logger.info(
+        f"Serving on {config.host}:{config.port} "
+        f"with {config.workers} workers."
+    )
+    try:
+        while not stopping:
+            pool.wait(timeout=1)
+            if stopping:
+                break
+            if any(
+                not process.is_alive() for process in pool.processes.values()
+            ):
+                # Slows down a crash loop.
+                time.sleep(WORKER_RESTART_DELAY)
+                if not stopping:
+                    pool.restart_exited()
+    finally:
+        pool.stop()
+        sock.close()